@@ -0,0 +1,32 @@
+"""Benchmark LTTB and M4 downsampling on a 10M-point series.
+
+Usage:
+    python benchmarks/bench_downsample.py [n_points] [target_points]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from chuk_view_schemas.downsample import lttb_indices, m4_indices
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    target = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000
+
+    rng = np.random.default_rng(0)
+    x = np.cumsum(rng.uniform(0.5, 1.5, n))
+    y = np.cumsum(rng.normal(0, 1, n))
+    print(f"{n:,} points -> {target:,}")
+
+    for name, fn in (("lttb", lttb_indices), ("m4", m4_indices)):
+        start = time.perf_counter()
+        idx = fn(x, y, target)
+        elapsed = time.perf_counter() - start
+        print(f"  {name:<5} {elapsed * 1000:8.1f} ms  ({len(idx):,} points kept)")
+
+
+if __name__ == "__main__":
+    main()
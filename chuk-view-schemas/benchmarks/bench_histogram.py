@@ -0,0 +1,37 @@
+"""Benchmark chunked histogram counting over 100M values.
+
+Usage:
+    python benchmarks/bench_histogram.py [n_values] [chunk_size]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from chuk_view_schemas.histogram import Histogram, histogram_edges
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000_000
+    chunk = int(sys.argv[2]) if len(sys.argv) > 2 else 5_000_000
+
+    rng = np.random.default_rng(0)
+    edges = histogram_edges(
+        rng.lognormal(3, 1, 100_000), rule="fd", value_range=(0, 500)
+    )
+    hist = Histogram(edges)
+    print(f"{n:,} values in chunks of {chunk:,}, {len(edges) - 1} bins")
+
+    elapsed = 0.0
+    for start in range(0, n, chunk):
+        values = rng.lognormal(3, 1, min(chunk, n - start))
+        t0 = time.perf_counter()
+        hist.update(values)
+        elapsed += time.perf_counter() - t0
+    print(f"  counting {elapsed * 1000:8.1f} ms  ({n / elapsed / 1e6:.0f}M values/s)")
+    print(f"  overflow {hist.overflow:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Benchmark server-side squarified layout against the view's algorithm.
+
+Lays out a two-level tree (``n_groups`` x ``n_leaves`` nodes, 1M by
+default) with ``layout_treemap``. If Node.js is installed, the view's
+client-side squarify (ported verbatim from apps/treemap/src/App.tsx) is
+timed over the same child lists for comparison.
+
+Usage:
+    python benchmarks/bench_treemap_layout.py [n_groups] [n_leaves]
+"""
+
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from chuk_view_schemas import TreemapContent
+from chuk_view_schemas.treemap_layout import layout_treemap
+
+# Client-side algorithm from apps/treemap/src/App.tsx, minus rendering
+CLIENT_JS = r"""
+const groups = JSON.parse(require("fs").readFileSync(process.argv[2], "utf8"));
+function squarify(children, x, y, w, h) {
+  const totalArea = children.reduce((s, c) => s + c.area, 0);
+  if (totalArea <= 0) return [];
+  const scale = (w * h) / totalArea;
+  const scaled = children.map((c) => ({ ...c, scaledArea: c.area * scale }));
+  const rects = [];
+  function layoutRow(row, rx, ry, rw, rh) {
+    const rowArea = row.reduce((s, c) => s + c.scaledArea, 0);
+    if (rw >= rh) {
+      const rowWidth = rowArea / rh; let cy = ry;
+      for (const item of row) { const ih = item.scaledArea / rowWidth;
+        rects.push({ x: rx, y: cy, w: rowWidth, h: ih }); cy += ih; }
+      return { rx: rx + rowWidth, ry, rw: rw - rowWidth, rh };
+    }
+    const rowHeight = rowArea / rw; let cx = rx;
+    for (const item of row) { const iw = item.scaledArea / rowHeight;
+      rects.push({ x: cx, y: ry, w: iw, h: rowHeight }); cx += iw; }
+    return { rx, ry: ry + rowHeight, rw, rh: rh - rowHeight };
+  }
+  function worstRatio(row, side) {
+    const rowArea = row.reduce((s, c) => s + c.scaledArea, 0);
+    const maxArea = Math.max(...row.map((c) => c.scaledArea));
+    const minArea = Math.min(...row.map((c) => c.scaledArea));
+    const s2 = side * side, rA2 = rowArea * rowArea;
+    if (rA2 === 0 || minArea === 0) return Infinity;
+    return Math.max((s2 * maxArea) / rA2, rA2 / (s2 * minArea));
+  }
+  let remaining = [...scaled]; let cx = x, cy = y, cw = w, ch = h;
+  while (remaining.length > 0) {
+    const side = Math.min(cw, ch); if (side <= 0) break;
+    let row = [remaining[0]]; let bestRatio = worstRatio(row, side); let i = 1;
+    while (i < remaining.length) {
+      const candidate = [...row, remaining[i]]; const ratio = worstRatio(candidate, side);
+      if (ratio <= bestRatio) { row = candidate; bestRatio = ratio; i++; } else break;
+    }
+    const r = layoutRow(row, cx, cy, cw, ch);
+    cx = r.rx; cy = r.ry; cw = r.rw; ch = r.rh; remaining = remaining.slice(row.length);
+  }
+  return rects;
+}
+const start = process.hrtime.bigint();
+let n = 0;
+for (const areas of groups) n += squarify(areas.map((a) => ({ area: a })), 0, 0, 1.5, 1).length;
+console.log(JSON.stringify({ ms: Number(process.hrtime.bigint() - start) / 1e6, n }));
+"""
+
+
+def main() -> None:
+    n_groups = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000
+    n_leaves = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000
+
+    rng = np.random.default_rng(0)
+    leaf_values = np.sort(rng.pareto(1.5, (n_groups, n_leaves)) + 1, axis=1)[:, ::-1]
+    root = {
+        "id": "root",
+        "label": "root",
+        "children": [
+            {
+                "id": f"g{g}",
+                "label": f"g{g}",
+                "children": [
+                    {"id": f"g{g}-{i}", "label": str(i), "value": v}
+                    for i, v in enumerate(leaf_values[g].tolist())
+                ],
+            }
+            for g in range(n_groups)
+        ],
+    }
+    content = TreemapContent.model_validate({"root": root})
+    total = n_groups * (n_leaves + 1)
+    print(f"{total:,} nodes ({n_groups:,} groups x {n_leaves:,} leaves)")
+
+    start = time.perf_counter()
+    layout_treemap(content, aspect=1.5)
+    print(f"  server layout_treemap  {(time.perf_counter() - start) * 1000:9.1f} ms")
+
+    node = shutil.which("node")
+    if node is None:
+        print("  client squarify        (skipped: node not installed)")
+        return
+    groups = [leaf_values.sum(axis=1).tolist()] + leaf_values.tolist()
+    with (
+        tempfile.NamedTemporaryFile("w", suffix=".json") as data,
+        tempfile.NamedTemporaryFile("w", suffix=".js") as script,
+    ):
+        json.dump(groups, data)
+        data.flush()
+        script.write(CLIENT_JS)
+        script.flush()
+        out = subprocess.run(
+            [node, script.name, data.name], capture_output=True, text=True, check=True
+        )
+    print(f"  client squarify (node) {json.loads(out.stdout)['ms']:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,7 +12,14 @@ from .form import (
     FieldUI,
     FieldGroup,
 )
-from .map import MapContent, MapLayer, LayerStyle, PopupTemplate, PopupAction
+from .map import (
+    MapContent,
+    MapLayer,
+    LayerStyle,
+    LayerSource,
+    PopupTemplate,
+    PopupAction,
+)
 from .markdown import MarkdownContent
 from .pdf import PdfContent
 from .split import SplitContent, SplitPanel
@@ -40,11 +47,11 @@ from .settings import SettingsContent, SettingsSection, SettingsField, SettingsO
 from .stepper import StepperContent, Step
 from .gauge import GaugeContent, GaugeThreshold
 from .heatmap import HeatmapContent, HeatmapColorScale
-from .crosstab import CrosstabContent
+from .crosstab import CrosstabContent, CrosstabSparse
 from .scatter import ScatterContent, ScatterDataset, ScatterPoint, ScatterAxisConfig
 from .boxplot import BoxplotContent, BoxplotGroup, BoxplotStats
 from .timeseries import TimeseriesContent, TimeseriesSeries, TimeseriesDataPoint
-from .treemap import TreemapContent, TreemapNode
+from .treemap import TreemapContent, TreemapNode, TreemapLayout
 from .sunburst import SunburstContent, SunburstNode
 from .pivot import PivotContent, PivotValue
 from .profile import ProfileContent, ProfilePoint
@@ -66,7 +73,7 @@ from .geostory import GeostoryContent, GeostoryStep, StepLocation
 from .investigation import InvestigationContent, Evidence, Connection
 from .gantt import GanttContent, GanttTask
 from .calendar_view import CalendarContent, CalendarEvent
-from .graph import GraphContent, GraphNode, GraphEdge
+from .graph import GraphContent, GraphNode, GraphEdge, GraphDrillDown
 from .flowchart import FlowchartContent, FlowchartNode, FlowchartEdge
 from .globe import GlobeContent, GlobePoint, GlobeArc, GlobeRotation
 from .threed import ThreeDContent, ThreeDObject
@@ -75,6 +82,20 @@ from .progress import ProgressContent, ProgressTrack, OverallProgress
 from .confirm import ConfirmContent
 from .json_view import JsonContent
 from .font import FontContent, FontGlyph, FontContour
+from .patch import (
+    UIPatch,
+    AddPanelOp,
+    UpdatePanelOp,
+    RemovePanelOp,
+    ShowPanelOp,
+    CollapsePanelOp,
+    AddLinkOp,
+    RemoveLinkOp,
+    UpdateLayoutOp,
+    CrossViewLink,
+    SetLoadingOp,
+    SetErrorOp,
+)
 
 __all__ = [
     "infer_view",
@@ -97,6 +118,7 @@ __all__ = [
     "MapContent",
     "MapLayer",
     "LayerStyle",
+    "LayerSource",
     "PopupTemplate",
     "PopupAction",
     "MarkdownContent",
@@ -158,6 +180,7 @@ __all__ = [
     "HeatmapContent",
     "HeatmapColorScale",
     "CrosstabContent",
+    "CrosstabSparse",
     "ScatterContent",
     "ScatterDataset",
     "ScatterPoint",
@@ -170,6 +193,7 @@ __all__ = [
     "TimeseriesDataPoint",
     "TreemapContent",
     "TreemapNode",
+    "TreemapLayout",
     "SunburstContent",
     "SunburstNode",
     "PivotContent",
@@ -224,6 +248,7 @@ __all__ = [
     "GraphContent",
     "GraphNode",
     "GraphEdge",
+    "GraphDrillDown",
     "FlowchartContent",
     "FlowchartNode",
     "FlowchartEdge",
@@ -243,6 +268,18 @@ __all__ = [
     "FontContent",
     "FontGlyph",
     "FontContour",
+    "UIPatch",
+    "AddPanelOp",
+    "UpdatePanelOp",
+    "RemovePanelOp",
+    "ShowPanelOp",
+    "CollapsePanelOp",
+    "AddLinkOp",
+    "RemoveLinkOp",
+    "UpdateLayoutOp",
+    "CrossViewLink",
+    "SetLoadingOp",
+    "SetErrorOp",
 ]
 
 # Server-side decorator helpers (optional — requires mcp package)
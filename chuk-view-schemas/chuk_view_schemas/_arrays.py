@@ -0,0 +1,84 @@
+"""NumPy helpers shared by the server-side builders.
+
+Internal module: not part of the public API.
+
+Requires NumPy (``pip install chuk-view-schemas[numpy]``).
+"""
+
+from __future__ import annotations
+
+import math
+import numbers
+from datetime import datetime, timezone
+from typing import Any, Sequence, Union
+
+import numpy as np
+
+TimeLike = Union[str, float, int, datetime, np.datetime64]
+
+
+def douglas_peucker(xy: np.ndarray, tolerance: float) -> np.ndarray:
+    """Points of the ``(n, 2)`` polyline ``xy`` kept by Douglas–Peucker."""
+    n = len(xy)
+    if n <= 2:
+        return xy
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        i, j = stack.pop()
+        if j <= i + 1:
+            continue
+        a, b = xy[i], xy[j]
+        seg = xy[i + 1 : j]
+        dx, dy = b - a
+        norm = math.hypot(dx, dy)
+        if norm == 0:
+            dist = np.hypot(seg[:, 0] - a[0], seg[:, 1] - a[1])
+        else:
+            dist = np.abs(dx * (seg[:, 1] - a[1]) - dy * (seg[:, 0] - a[0])) / norm
+        k = int(np.argmax(dist))
+        if dist[k] > tolerance:
+            m = i + 1 + k
+            keep[m] = True
+            stack.append((i, m))
+            stack.append((m, j))
+    return xy[keep]
+
+
+def epoch_array(t: Any) -> np.ndarray:
+    """Epoch seconds (float64) from numbers or ``datetime64`` values."""
+    arr = np.asarray(t)
+    if np.issubdtype(arr.dtype, np.datetime64):
+        return arr.astype("datetime64[ns]").astype(np.int64) / 1e9
+    return arr.astype(np.float64)
+
+
+def to_epoch(value: TimeLike) -> float:
+    """Epoch seconds of one time; naive datetimes and strings are UTC."""
+    if isinstance(value, numbers.Real):  # includes NumPy integer / float scalars
+        return float(value)
+    if isinstance(value, np.datetime64):
+        return float(value.astype("datetime64[ns]").astype(np.int64)) / 1e9
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def iso_times(times: np.ndarray) -> list[str]:
+    """ISO-8601 UTC strings (millisecond precision) for epoch seconds."""
+    ms = np.round(times * 1000).astype("datetime64[ms]")
+    return [s + "Z" for s in np.datetime_as_string(ms, unit="ms").tolist()]
+
+
+def factorize(col: Sequence[Any]) -> tuple[np.ndarray, list[str]]:
+    """Sorted labels (as strings) and the code of each element."""
+    if isinstance(col, np.ndarray) and col.dtype.kind != "O":
+        # Typed arrays: factorize natively, stringify only the uniques
+        uniq, codes = np.unique(col, return_inverse=True)
+        return codes.ravel().astype(np.int64), [str(u) for u in uniq.tolist()]
+    labels = np.array(["" if x is None else str(x) for x in col], dtype=object)
+    uniq, codes = np.unique(labels, return_inverse=True)
+    return codes.ravel().astype(np.int64), uniq.tolist()
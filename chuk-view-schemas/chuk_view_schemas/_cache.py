@@ -0,0 +1,45 @@
+"""LRU cache shared by the layout helpers (graph, flowchart).
+
+Internal module: not part of the public API; ``LayoutCache`` is exported
+from ``graph_layout`` and ``flowchart_layout``.
+
+Pure Python — no external dependencies.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any
+
+
+class LayoutCache:
+    """LRU cache of layout results keyed by graph fingerprint."""
+
+    def __init__(self, max_entries: int = 32) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Any:
+        """Return the cached value.
+
+        Raises:
+            KeyError: If ``key`` is unknown or has been evicted.
+        """
+        value = self._entries[key]
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
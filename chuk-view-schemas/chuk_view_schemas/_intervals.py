@@ -0,0 +1,57 @@
+"""Interval tree shared by the scheduling helpers (Gantt, calendar).
+
+Internal module: not part of the public API.
+
+Pure Python — no external dependencies.
+"""
+
+from __future__ import annotations
+
+
+class IntervalTree:
+    """Static interval tree: half-open ``[start, end)`` intervals.
+
+    Intervals sorted by start form an implicit balanced search tree (the
+    middle of each range is its root); each root stores the largest end in
+    its subtree, so whole subtrees ending before a query are skipped.
+    """
+
+    def __init__(self, starts: list[int], ends: list[int]) -> None:
+        self.order = sorted(range(len(starts)), key=starts.__getitem__)
+        self.start = [starts[i] for i in self.order]
+        self.end = [ends[i] for i in self.order]
+        self.max_end = self.end[:]
+        # Children before parents: process ranges bottom-up by size
+        ranges, stack = [], [(0, len(self.order))]
+        while stack:
+            lo, hi = stack.pop()
+            if lo < hi:
+                mid = (lo + hi) // 2
+                ranges.append((lo, mid, hi))
+                stack.extend(((lo, mid), (mid + 1, hi)))
+        for lo, mid, hi in reversed(ranges):
+            if lo < mid:
+                self.max_end[mid] = max(
+                    self.max_end[mid], self.max_end[(lo + mid) // 2]
+                )
+            if mid + 1 < hi:
+                right = (mid + 1 + hi) // 2
+                self.max_end[mid] = max(self.max_end[mid], self.max_end[right])
+
+    def query(self, lo: int, hi: int) -> list[int]:
+        """Original indices of intervals overlapping ``[lo, hi)``."""
+        found = []
+        stack = [(0, len(self.order))]
+        while stack:
+            a, b = stack.pop()
+            if a >= b:
+                continue
+            mid = (a + b) // 2
+            if self.max_end[mid] <= lo:
+                continue
+            stack.append((a, mid))
+            if self.start[mid] < hi:
+                if self.end[mid] > lo:
+                    found.append(self.order[mid])
+                stack.append((mid + 1, b))
+        return found
@@ -0,0 +1,280 @@
+"""Build ``BoxplotStats`` from raw values, exactly or by streaming sketch.
+
+``boxplot_stats()`` is the exact NumPy path for arrays that fit in memory.
+For data that does not (hundreds of millions of latencies), a
+``BoxplotAccumulator`` keeps a mergeable KLL quantile sketch (about
+``3 * k`` retained values, rank error around ``1.7 / k``) plus the
+``max_outliers`` most extreme values on each side, so memory is bounded
+regardless of input size. Accumulators merge, so chunks can be reduced in
+parallel and combined.
+
+Both paths use Tukey fences (``whisker`` x IQR): ``min`` / ``max`` are the
+whisker ends and ``outliers`` the values beyond them, capped at the
+``max_outliers`` most extreme per side.
+
+Usage:
+    builder = GroupedBoxplotBuilder()
+    for chunk in read_chunks():
+        builder.add_grouped(chunk["endpoint"], chunk["latency_ms"])
+    content = builder.content(title="Latency by endpoint")
+
+Requires NumPy (``pip install chuk-view-schemas[numpy]``).
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import Any, Iterable, Mapping, Optional, Union
+
+import numpy as np
+
+from .boxplot import BoxplotContent, BoxplotGroup, BoxplotStats
+
+ArrayLike = Union[Iterable[float], np.ndarray]
+
+
+def boxplot_stats(
+    values: ArrayLike, *, whisker: float = 1.5, max_outliers: int = 50
+) -> BoxplotStats:
+    """Exact Tukey box statistics of an in-memory array (NaNs ignored)."""
+    v = _finite(values)
+    if v.size == 0:
+        raise ValueError("No finite values")
+    q1, median, q3 = np.quantile(v, [0.25, 0.5, 0.75])
+    lo, hi = _fences(q1, q3, whisker)
+    inside = v[(v >= lo) & (v <= hi)]
+    low = np.sort(v[v < lo])[:max_outliers]
+    high = np.sort(v[v > hi])[::-1][:max_outliers]
+    return _stats(q1, median, q3, inside.min(), inside.max(), low, high)
+
+
+class QuantileSketch:
+    """Mergeable KLL quantile sketch over floats."""
+
+    def __init__(self, k: int = 200, seed: Optional[int] = None) -> None:
+        if k < 8:
+            raise ValueError("k must be >= 8")
+        self.k = k
+        self.count = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self._levels: list[np.ndarray] = [np.zeros(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values: ArrayLike) -> QuantileSketch:
+        v = _finite(values)
+        if v.size == 0:
+            return self
+        self.count += v.size
+        self.min = min(self.min, float(v.min()))
+        self.max = max(self.max, float(v.max()))
+        self._levels[0] = np.concatenate((self._levels[0], v))
+        self._compress()
+        return self
+
+    def merge(self, other: QuantileSketch) -> QuantileSketch:
+        """Fold ``other`` into this sketch (in place) and return self."""
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.zeros(0))
+        for h, level in enumerate(other._levels):
+            self._levels[h] = np.concatenate((self._levels[h], level))
+        self._compress()
+        return self
+
+    def items(self) -> np.ndarray:
+        """All retained values (each a real input value)."""
+        return np.concatenate(self._levels)
+
+    def quantile(self, q: Union[float, ArrayLike]) -> Union[float, np.ndarray]:
+        """Approximate quantile(s); ``q`` in ``[0, 1]``."""
+        if self.count == 0:
+            raise ValueError("Empty sketch")
+        qs = np.atleast_1d(np.asarray(q, dtype=float))
+        items = self.items()
+        weights = np.concatenate(
+            [np.full(len(level), 2.0**h) for h, level in enumerate(self._levels)]
+        )
+        order = np.argsort(items, kind="stable")
+        cum = np.cumsum(weights[order])
+        idx = np.searchsorted(cum, qs * cum[-1], side="left")
+        out = items[order][np.clip(idx, 0, items.size - 1)]
+        out = np.where(qs <= 0, self.min, np.where(qs >= 1, self.max, out))
+        return float(out[0]) if np.ndim(q) == 0 else out
+
+    def __len__(self) -> int:
+        return sum(len(level) for level in self._levels)
+
+    def _capacity(self, h: int) -> int:
+        depth = len(self._levels) - h - 1
+        return max(2, int(np.ceil(self.k * (2.0 / 3.0) ** depth)))
+
+    def _compress(self) -> None:
+        while True:
+            over = [
+                h
+                for h in range(len(self._levels))
+                if len(self._levels[h]) > self._capacity(h)
+            ]
+            if not over:
+                return
+            h = over[0]
+            if h + 1 == len(self._levels):
+                self._levels.append(np.zeros(0))
+            level = np.sort(self._levels[h])
+            # Odd one out stays behind; half the rest is promoted with
+            # double weight, starting at a random offset to stay unbiased.
+            keep = level[: level.size % 2]
+            pairs = level[level.size % 2 :]
+            promoted = pairs[int(self._rng.integers(2)) :: 2]
+            self._levels[h] = keep
+            self._levels[h + 1] = np.concatenate((self._levels[h + 1], promoted))
+
+
+class BoxplotAccumulator:
+    """Streaming, mergeable ``BoxplotStats`` for one group."""
+
+    def __init__(
+        self,
+        *,
+        k: int = 200,
+        max_outliers: int = 50,
+        whisker: float = 1.5,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.sketch = QuantileSketch(k, seed)
+        self.max_outliers = max_outliers
+        self.whisker = whisker
+        self._low = np.zeros(0)
+        self._high = np.zeros(0)
+
+    def update(self, values: ArrayLike) -> BoxplotAccumulator:
+        v = _finite(values)
+        self.sketch.update(v)
+        self._keep_tails(v, v)
+        return self
+
+    def merge(self, other: BoxplotAccumulator) -> BoxplotAccumulator:
+        self.sketch.merge(other.sketch)
+        self._keep_tails(other._low, other._high)
+        return self
+
+    def stats(self) -> BoxplotStats:
+        q1, median, q3 = self.sketch.quantile([0.25, 0.5, 0.75])
+        lo, hi = _fences(q1, q3, self.whisker)
+        candidates = np.concatenate((self.sketch.items(), self._low, self._high))
+        inside = candidates[(candidates >= lo) & (candidates <= hi)]
+        low = np.sort(self._low[self._low < lo])
+        high = np.sort(self._high[self._high > hi])[::-1]
+        return _stats(q1, median, q3, inside.min(), inside.max(), low, high)
+
+    def _keep_tails(self, low_new: np.ndarray, high_new: np.ndarray) -> None:
+        m = self.max_outliers
+        if m <= 0:
+            return
+        low = np.concatenate((self._low, low_new))
+        high = np.concatenate((self._high, high_new))
+        self._low = np.partition(low, m - 1)[:m] if low.size > m else low
+        self._high = np.partition(high, -m)[-m:] if high.size > m else high
+
+
+class GroupedBoxplotBuilder:
+    """One ``BoxplotAccumulator`` per group label, in first-seen order."""
+
+    def __init__(self, **accumulator_kwargs: Any) -> None:
+        self._kwargs = accumulator_kwargs
+        self.groups: dict[str, BoxplotAccumulator] = {}
+
+    def add(self, label: str, values: ArrayLike) -> None:
+        self._group(label).update(values)
+
+    def add_grouped(self, labels: ArrayLike, values: ArrayLike) -> None:
+        """Add a chunk of ``(label, value)`` pairs given as parallel arrays."""
+        labels_a = np.asarray(labels)
+        values_a = np.asarray(values, dtype=float)
+        if labels_a.shape != values_a.shape:
+            raise ValueError("labels and values must have the same length")
+        uniq, first, codes = np.unique(labels_a, return_index=True, return_inverse=True)
+        codes = codes.ravel()
+        order = np.argsort(codes, kind="stable")
+        bounds = np.cumsum(np.bincount(codes, minlength=uniq.size))[:-1]
+        chunks = np.split(values_a[order], bounds)
+        for i in np.argsort(first).tolist():
+            self._group(str(uniq[i])).update(chunks[i])
+
+    def merge(self, other: GroupedBoxplotBuilder) -> GroupedBoxplotBuilder:
+        for label, acc in other.groups.items():
+            if label in self.groups:
+                self.groups[label].merge(acc)
+            else:
+                self.groups[label] = copy.deepcopy(acc)
+        return self
+
+    def build(self) -> list[BoxplotGroup]:
+        return [
+            BoxplotGroup(label=label, stats=acc.stats())
+            for label, acc in self.groups.items()
+        ]
+
+    def content(self, *, title: Optional[str] = None) -> BoxplotContent:
+        return BoxplotContent(title=title, groups=self.build())
+
+    def _group(self, label: str) -> BoxplotAccumulator:
+        if label not in self.groups:
+            self.groups[label] = BoxplotAccumulator(**self._kwargs)
+        return self.groups[label]
+
+
+def boxplot_groups(
+    data: Mapping[str, ArrayLike],
+    *,
+    whisker: float = 1.5,
+    max_outliers: int = 50,
+) -> list[BoxplotGroup]:
+    """Exact ``BoxplotGroup`` per entry of ``{label: values}``."""
+    return [
+        BoxplotGroup(
+            label=label,
+            stats=boxplot_stats(values, whisker=whisker, max_outliers=max_outliers),
+        )
+        for label, values in data.items()
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Internals
+# ---------------------------------------------------------------------------
+
+
+def _finite(values: ArrayLike) -> np.ndarray:
+    if not isinstance(values, np.ndarray):
+        values = np.fromiter(values, dtype=float)
+    v = values.astype(float, copy=False).ravel()
+    return v[np.isfinite(v)]
+
+
+def _fences(q1: float, q3: float, whisker: float) -> tuple[float, float]:
+    iqr = q3 - q1
+    return q1 - whisker * iqr, q3 + whisker * iqr
+
+
+def _stats(
+    q1: float,
+    median: float,
+    q3: float,
+    lo: float,
+    hi: float,
+    low: np.ndarray,
+    high: np.ndarray,
+) -> BoxplotStats:
+    outliers = low.tolist() + high.tolist()
+    return BoxplotStats(
+        min=float(lo),
+        q1=float(q1),
+        median=float(median),
+        q3=float(q3),
+        max=float(hi),
+        outliers=outliers or None,
+    )
@@ -0,0 +1,418 @@
+"""Interval-indexed calendar events with lazily expanded recurrences.
+
+A ``CalendarStore`` holds one-off events and recurring series. Each is
+indexed once by its overall span (a series spans from its first start to
+its last end, or forever), in the static interval tree shared with
+``gantt_schedule``. A range query finds the overlapping entries in
+O(log n + k), and only matching series are expanded, only for the
+requested range. A daily stand-up that runs for years costs one index
+entry, and a month view expands about twenty of its occurrences.
+
+Recurrences follow a subset of RFC 5545 ``RRULE``:
+
+- ``FREQ``: ``DAILY``, ``WEEKLY``, ``MONTHLY`` or ``YEARLY``
+- ``INTERVAL``, ``COUNT``, ``UNTIL``
+- ``BYDAY``: weekdays (``MO,WE,FR``) for weekly rules, or with an ordinal
+  (``2TU``, ``-1FR``) for monthly rules
+- ``BYMONTHDAY``: days of the month, negative from the month end
+
+Occurrences that do not exist (31 February) are skipped, as RFC 5545
+requires, and ``exdates`` removes single occurrences. Each occurrence is a
+copy of the series event with its own ``start`` / ``end`` and id
+``<id>@<start>``.
+
+Times are wall-clock: ``YYYY-MM-DD`` for all-day events, ISO datetimes
+otherwise. Any UTC offset is kept in the output but ignored when comparing.
+
+Range tool contract: ``query()`` and ``snapshot()`` return
+``CalendarContent`` with ``rangeTool``, ``rangeStart`` and ``rangeEnd``
+set. When the user navigates outside that range, the view calls the tool
+with ``{"start": <date>, "end": <date>}`` and replaces its events with
+the result.
+
+Usage:
+    store = CalendarStore(range_tool="calendar_range")
+    store.add(CalendarEvent(id="standup", title="Stand-up",
+                            start="2025-01-06T09:30", end="2025-01-06T09:45"),
+              rrule="FREQ=WEEKLY;BYDAY=MO,TU,WE,TH,FR")
+
+    @calendar_tool(mcp, "calendar_range")
+    async def calendar_range(start: str, end: str):
+        return store.query(start, end)
+
+Pure Python — no external dependencies.
+"""
+
+from __future__ import annotations
+
+import calendar
+from collections import deque
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, tzinfo
+from itertools import islice
+from typing import Iterable, Iterator, Literal, Optional, Union
+
+from ._intervals import IntervalTree
+from .calendar_view import CalendarContent, CalendarEvent
+
+Freq = Literal["DAILY", "WEEKLY", "MONTHLY", "YEARLY"]
+ViewMode = Literal["month", "week", "agenda"]
+
+WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+
+# Longest period per frequency, in days: used to skip ahead safely
+_MAX_PERIOD_DAYS = {"DAILY": 1, "WEEKLY": 7, "MONTHLY": 31, "YEARLY": 366}
+# Stop looking for occurrences after this many empty periods in a row
+_MAX_EMPTY_PERIODS = 1000
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+@dataclass(frozen=True)
+class Recurrence:
+    """Parsed ``RRULE``.
+
+    ``by_day`` holds ``(ordinal, weekday)`` pairs, weekday 0 being Monday
+    and ordinal ``None`` meaning every such weekday.
+    """
+
+    freq: Freq
+    interval: int = 1
+    count: Optional[int] = None
+    until: Optional[datetime] = None
+    by_day: tuple[tuple[Optional[int], int], ...] = ()
+    by_month_day: tuple[int, ...] = ()
+
+    @classmethod
+    def parse(cls, rule: str) -> Recurrence:
+        """Parse ``"FREQ=WEEKLY;BYDAY=MO,WE;COUNT=10"`` (``RRULE:`` prefix optional).
+
+        Raises:
+            ValueError: On unknown or unsupported rule parts.
+        """
+        parts = {}
+        for item in rule.removeprefix("RRULE:").split(";"):
+            if item:
+                key, _, value = item.partition("=")
+                parts[key.upper()] = value.upper()
+        freq = parts.pop("FREQ", None)
+        if freq not in _MAX_PERIOD_DAYS:
+            raise ValueError(f"Unsupported FREQ: {freq!r}")
+        kwargs: dict = {"freq": freq}
+        if "INTERVAL" in parts:
+            kwargs["interval"] = int(parts.pop("INTERVAL"))
+        if "COUNT" in parts:
+            kwargs["count"] = int(parts.pop("COUNT"))
+        if "UNTIL" in parts:
+            kwargs["until"] = _parse_until(parts.pop("UNTIL"))
+        if "BYDAY" in parts:
+            kwargs["by_day"] = tuple(
+                _parse_by_day(d) for d in parts.pop("BYDAY").split(",")
+            )
+        if "BYMONTHDAY" in parts:
+            kwargs["by_month_day"] = tuple(
+                int(d) for d in parts.pop("BYMONTHDAY").split(",")
+            )
+        parts.pop("WKST", None)
+        if parts:
+            raise ValueError(f"Unsupported RRULE parts: {', '.join(sorted(parts))}")
+        return cls(**kwargs)
+
+    def __post_init__(self) -> None:
+        if self.interval < 1:
+            raise ValueError("INTERVAL must be >= 1")
+        if self.freq == "WEEKLY" and any(n is not None for n, _ in self.by_day):
+            raise ValueError("Weekly BYDAY takes no ordinals")
+        if self.by_day and self.freq in ("DAILY", "YEARLY"):
+            raise ValueError(f"BYDAY is not supported with FREQ={self.freq}")
+        if self.by_month_day and self.freq != "MONTHLY":
+            raise ValueError("BYMONTHDAY needs FREQ=MONTHLY")
+
+    def between(
+        self,
+        dtstart: datetime,
+        after: datetime,
+        before: datetime,
+        *,
+        skip: bool = True,
+    ) -> Iterator[datetime]:
+        """Occurrence starts in ``[after, before)``, ignoring ``count``.
+
+        With ``skip``, whole periods ending before ``after`` are jumped
+        over instead of generated.
+        """
+        k = 0
+        if skip and after > dtstart:
+            span = self.interval * _MAX_PERIOD_DAYS[self.freq]
+            k = max(0, (after - dtstart).days // span - 1)
+        empty = 0
+        while empty < _MAX_EMPTY_PERIODS:
+            found = False
+            for start in self._period(dtstart, k):
+                if self.until is not None and start > self.until:
+                    return
+                if start >= before:
+                    return
+                if start >= dtstart:
+                    found = True
+                    if start >= after:
+                        yield start
+            empty = 0 if found else empty + 1
+            k += 1
+
+    def _period(self, dtstart: datetime, k: int) -> list[datetime]:
+        """Candidate starts in period ``k`` (sorted; may precede ``dtstart``)."""
+        step = k * self.interval
+        if self.freq == "DAILY":
+            return [dtstart + timedelta(days=step)]
+        if self.freq == "WEEKLY":
+            monday = dtstart - timedelta(days=dtstart.weekday() - 7 * step)
+            days = sorted({wd for _, wd in self.by_day} or {dtstart.weekday()})
+            return [monday + timedelta(days=wd) for wd in days]
+        if self.freq == "YEARLY":
+            year = dtstart.year + step
+            if dtstart.month == 2 and dtstart.day == 29 and not calendar.isleap(year):
+                return []
+            return [dtstart.replace(year=year)]
+
+        year, month = divmod(dtstart.month - 1 + step, 12)
+        year, month = dtstart.year + year, month + 1
+        length = calendar.monthrange(year, month)[1]
+        days: set[int] = set()
+        for d in self.by_month_day or (() if self.by_day else (dtstart.day,)):
+            day = d if d > 0 else length + 1 + d
+            if 1 <= day <= length:
+                days.add(day)
+        first_weekday = calendar.monthrange(year, month)[0]
+        for n, wd in self.by_day:
+            matches = list(range(1 + (wd - first_weekday) % 7, length + 1, 7))
+            if n is None:
+                days.update(matches)
+            elif -len(matches) <= n <= len(matches) and n:
+                days.add(matches[n - 1 if n > 0 else n])
+        return [
+            dtstart.replace(year=year, month=month, day=day) for day in sorted(days)
+        ]
+
+
+class CalendarStore:
+    """One-off and recurring events indexed for range queries.
+
+    Args:
+        title: Title of the returned content.
+        range_tool: Tool the view calls for other date ranges.
+    """
+
+    def __init__(
+        self, *, title: Optional[str] = None, range_tool: Optional[str] = None
+    ) -> None:
+        self.title = title
+        self.range_tool = range_tool
+        self._entries: dict[str, _Entry] = {}
+        self._index: Optional[tuple[list[_Entry], IntervalTree]] = None
+
+    @classmethod
+    def from_content(
+        cls, content: CalendarContent, *, range_tool: Optional[str] = None
+    ) -> CalendarStore:
+        store = cls(title=content.title, range_tool=range_tool or content.range_tool)
+        for event in content.events:
+            store.add(event)
+        return store
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, event_id: str) -> bool:
+        return event_id in self._entries
+
+    def add(
+        self,
+        event: CalendarEvent,
+        *,
+        rrule: Union[str, Recurrence, None] = None,
+        exdates: Iterable[str] = (),
+    ) -> None:
+        """Add or replace an event, recurring from its ``start`` if ``rrule`` is set.
+
+        Raises:
+            ValueError: On an unparseable date or unsupported rule.
+        """
+        if isinstance(rrule, str):
+            rrule = Recurrence.parse(rrule)
+        start, tz = _parse(event.start)
+        date_only = len(event.start) <= 10
+        if event.end:
+            duration = _parse(event.end)[0] - start
+        else:
+            duration = timedelta(days=1 if event.all_day or date_only else 0)
+        entry = _Entry(
+            event=event,
+            start=start,
+            duration=max(duration, timedelta(0)),
+            date_only=date_only,
+            tz=tz,
+            rule=rrule,
+            exdates=frozenset(_parse(d)[0] for d in exdates),
+        )
+        entry.last = entry.last_start()
+        self._entries[event.id] = entry
+        self._index = None
+
+    def remove(self, event_id: str) -> None:
+        """Drop an event or series.
+
+        Raises:
+            KeyError: If ``event_id`` is unknown.
+        """
+        del self._entries[event_id]
+        self._index = None
+
+    def occurrences(self, start: str, end: str) -> list[CalendarEvent]:
+        """Concrete events overlapping ``[start, end)``, sorted by start."""
+        lo, hi = _parse(start)[0], _parse(end)[0]
+        entries, tree = self._tree()
+        found: list[tuple[datetime, str, CalendarEvent]] = []
+        for i in tree.query(_seconds(lo), _seconds(hi)):
+            entry = entries[i]
+            for occ_start in entry.starts(lo, hi):
+                found.append((occ_start, entry.event.id, entry.occurrence(occ_start)))
+        found.sort(key=lambda item: (item[0], item[1]))
+        return [event for _, _, event in found]
+
+    def query(self, start: str, end: str) -> CalendarContent:
+        """``CalendarContent`` for ``[start, end)`` with the range contract set."""
+        return CalendarContent(
+            title=self.title,
+            events=self.occurrences(start, end),
+            range_start=start,
+            range_end=end,
+            range_tool=self.range_tool,
+        )
+
+    def snapshot(
+        self, default_date: Optional[str] = None, view: ViewMode = "month"
+    ) -> CalendarContent:
+        """Initial content: the month (or week) around ``default_date`` (today)."""
+        start, end = view_range(default_date or date.today().isoformat(), view)
+        content = self.query(start, end)
+        content.default_date = default_date
+        content.default_view = view
+        return content
+
+    def _tree(self) -> tuple[list[_Entry], IntervalTree]:
+        if self._index is None:
+            entries = list(self._entries.values())
+            starts = [_seconds(e.start) for e in entries]
+            ends = [
+                float("inf") if e.last is None else _seconds(e.last + e.span)
+                for e in entries
+            ]
+            self._index = (entries, IntervalTree(starts, ends))
+        return self._index
+
+
+def view_range(day: str, view: ViewMode = "month") -> tuple[str, str]:
+    """``[start, end)`` dates shown by a view around ``day``.
+
+    Month and agenda views show the calendar month; week views the
+    Sunday-to-Saturday week, as in the calendar view.
+    """
+    d = _parse(day)[0].date()
+    if view == "week":
+        first = d - timedelta(days=(d.weekday() + 1) % 7)
+        return first.isoformat(), (first + timedelta(days=7)).isoformat()
+    first = d.replace(day=1)
+    last = first + timedelta(days=calendar.monthrange(d.year, d.month)[1])
+    return first.isoformat(), last.isoformat()
+
+
+# ---------------------------------------------------------------------------
+# Internals
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _Entry:
+    event: CalendarEvent
+    start: datetime
+    duration: timedelta
+    date_only: bool
+    tz: Optional[tzinfo]
+    rule: Optional[Recurrence]
+    exdates: frozenset[datetime]
+    last: Optional[datetime] = None  # last occurrence start; None if endless
+
+    @property
+    def span(self) -> timedelta:
+        """Duration used for overlap tests: zero-length events still match."""
+        return max(self.duration, timedelta(seconds=1))
+
+    def last_start(self) -> Optional[datetime]:
+        if self.rule is None:
+            return self.start
+        if self.rule.count is not None:
+            # COUNT needs the series from its start: expand it once here.
+            # EXDATE removes occurrences after counting (RFC 5545)
+            occurrences = self.rule.between(
+                self.start, self.start, datetime.max, skip=False
+            )
+            tail = deque(islice(occurrences, self.rule.count), maxlen=1)
+            return tail[0] if tail else self.start
+        return self.rule.until
+
+    def starts(self, lo: datetime, hi: datetime) -> Iterator[datetime]:
+        """Occurrence starts overlapping ``[lo, hi)``."""
+        if self.rule is None:
+            yield self.start
+            return
+        for occ in self.rule.between(self.start, lo - self.span, hi):
+            if self.last is not None and occ > self.last:
+                return
+            if occ + self.span > lo and occ not in self.exdates:
+                yield occ
+
+    def occurrence(self, start: datetime) -> CalendarEvent:
+        if self.rule is None:
+            return self.event
+        update = {
+            "id": f"{self.event.id}@{_format(start, self.date_only, self.tz)}",
+            "start": _format(start, self.date_only, self.tz),
+        }
+        if self.event.end is not None:
+            update["end"] = _format(start + self.duration, self.date_only, self.tz)
+        return self.event.model_copy(update=update)
+
+
+def _parse(value: str) -> tuple[datetime, Optional[tzinfo]]:
+    """Wall-clock datetime and UTC offset (if any) of an ISO date or datetime."""
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    dt = datetime.fromisoformat(value)
+    return dt.replace(tzinfo=None), dt.tzinfo
+
+
+def _parse_until(value: str) -> datetime:
+    """``UNTIL`` in RFC 5545 basic format (``20250131`` / ``20250131T235959Z``)."""
+    value = value.rstrip("Z")
+    if "T" in value:
+        return datetime.strptime(value, "%Y%m%dT%H%M%S")
+    # A date-only UNTIL includes that whole day
+    return datetime.strptime(value, "%Y%m%d") + timedelta(days=1, microseconds=-1)
+
+
+def _parse_by_day(value: str) -> tuple[Optional[int], int]:
+    code = value[-2:]
+    if code not in WEEKDAYS:
+        raise ValueError(f"Unknown BYDAY weekday: {value!r}")
+    return (int(value[:-2]) if value[:-2] else None), WEEKDAYS.index(code)
+
+
+def _format(dt: datetime, date_only: bool, tz: Optional[tzinfo]) -> str:
+    if date_only:
+        return dt.date().isoformat()
+    return dt.replace(tzinfo=tz).isoformat()
+
+
+def _seconds(dt: datetime) -> float:
+    return (dt - _EPOCH).total_seconds()
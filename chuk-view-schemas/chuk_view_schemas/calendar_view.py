@@ -20,6 +20,12 @@ class CalendarContent(BaseModel):
     version: Literal["1.0"] = "1.0"
     title: Optional[str] = None
     default_date: Optional[str] = Field(None, alias="defaultDate")
+    default_view: Optional[Literal["month", "week", "agenda"]] = Field(
+        None, alias="defaultView"
+    )
     events: List[CalendarEvent]
+    range_start: Optional[str] = Field(None, alias="rangeStart")
+    range_end: Optional[str] = Field(None, alias="rangeEnd")
+    range_tool: Optional[str] = Field(None, alias="rangeTool")
 
     model_config = {"populate_by_name": True}
@@ -0,0 +1,287 @@
+"""Choropleth classification and GIS legend generation.
+
+Reads one numeric property out of a GeoJSON FeatureCollection, computes
+class breaks (quantile, equal-interval or Jenks natural breaks), assigns a
+colour per feature and builds the matching gis-legend items in one go.
+
+Usage:
+    result = classify_features(counties, "population", k=5, method="jenks")
+    layers = result.map_layers(counties, id_prefix="pop", label="Population")
+    legend = GisLegendContent(sections=[result.legend_section("Population")])
+
+Requires NumPy (``pip install chuk-view-schemas[numpy]``).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Literal, Optional, Sequence
+
+import numpy as np
+
+from .gis_legend import GisLegendItem, GisLegendSection, GradientStop
+from .map import LayerStyle, MapLayer
+
+ClassifyMethod = Literal["quantile", "equal_interval", "jenks"]
+
+# ColorBrewer YlOrRd, interpolated to the requested number of classes
+DEFAULT_PALETTE = ["#ffffb2", "#fecc5c", "#fd8d3c", "#f03b20", "#bd0026"]
+NO_DATA_COLOR = "#cccccc"
+
+
+@dataclass
+class Classification:
+    """Class breaks, colours and per-feature class indices."""
+
+    breaks: list[float]  # k + 1 ascending edges
+    colors: list[str]  # one per class
+    classes: np.ndarray  # class index per feature, -1 where the value is missing
+    no_data_color: str = NO_DATA_COLOR
+
+    @property
+    def labels(self) -> list[str]:
+        return [
+            f"{_fmt(lo)} – {_fmt(hi)}"
+            for lo, hi in zip(self.breaks[:-1], self.breaks[1:])
+        ]
+
+    def feature_colors(self) -> list[str]:
+        """Colour per feature, in feature order."""
+        lookup = np.asarray(self.colors + [self.no_data_color], dtype=object)
+        return lookup[self.classes].tolist()
+
+    def gradient_item(self, label: str) -> GisLegendItem:
+        """A single gradient legend item with one stop per class."""
+        return GisLegendItem(
+            type="gradient",
+            label=label,
+            gradient_stops=[
+                GradientStop(color=c, label=text)
+                for c, text in zip(self.colors, self.labels)
+            ],
+        )
+
+    def class_items(self) -> list[GisLegendItem]:
+        """One polygon legend item per class."""
+        return [
+            GisLegendItem(type="polygon", label=text, fill_color=c)
+            for c, text in zip(self.colors, self.labels)
+        ]
+
+    def legend_section(self, title: str, *, gradient: bool = True) -> GisLegendSection:
+        items = [self.gradient_item(title)] if gradient else self.class_items()
+        if (self.classes < 0).any():
+            items.append(
+                GisLegendItem(
+                    type="polygon", label="No data", fill_color=self.no_data_color
+                )
+            )
+        return GisLegendSection(title=title, items=items)
+
+    def map_layers(
+        self,
+        collection: dict[str, Any],
+        *,
+        id_prefix: str,
+        label: str,
+        fill_opacity: float = 0.7,
+    ) -> list[MapLayer]:
+        """Split ``collection`` into one styled ``MapLayer`` per class."""
+        features = collection.get("features", [])
+        order = np.argsort(self.classes, kind="stable")
+        bounds = np.searchsorted(
+            self.classes[order], np.arange(-1, len(self.colors) + 1)
+        )
+        layers = []
+        for cls in range(-1, len(self.colors)):
+            idx = order[bounds[cls + 1] : bounds[cls + 2]]
+            if len(idx) == 0:
+                continue
+            if cls < 0:
+                color, suffix, text = self.no_data_color, "nodata", "No data"
+            else:
+                color, suffix, text = self.colors[cls], str(cls), self.labels[cls]
+            layers.append(
+                MapLayer(
+                    id=f"{id_prefix}-{suffix}",
+                    label=f"{label}: {text}",
+                    features={
+                        "type": "FeatureCollection",
+                        "features": [features[i] for i in idx.tolist()],
+                    },
+                    style=LayerStyle(
+                        color=color, fill_color=color, fill_opacity=fill_opacity
+                    ),
+                )
+            )
+        return layers
+
+
+def property_column(collection: dict[str, Any], prop: str) -> np.ndarray:
+    """Read a numeric property as a float array (NaN where missing or non-numeric)."""
+    features = collection.get("features", [])
+    return np.fromiter(
+        (_to_float((f.get("properties") or {}).get(prop)) for f in features),
+        dtype=float,
+        count=len(features),
+    )
+
+
+def class_breaks(
+    values: np.ndarray,
+    k: int = 5,
+    method: ClassifyMethod = "quantile",
+    *,
+    sample_size: int = 1000,
+    seed: int = 0,
+) -> list[float]:
+    """Compute ``k + 1`` class edges over the finite values.
+
+    Jenks natural breaks is O(k·n²), so inputs larger than ``sample_size``
+    are classified on a random sample; the outer edges still come from the
+    full data.
+    """
+    if k < 1:
+        raise ValueError("k must be >= 1")
+    data = np.asarray(values, dtype=float)
+    data = data[np.isfinite(data)]
+    if data.size == 0:
+        return []
+    lo, hi = float(data.min()), float(data.max())
+
+    if method == "equal_interval":
+        edges = np.linspace(lo, hi, k + 1)
+    elif method == "quantile":
+        edges = np.quantile(data, np.linspace(0, 1, k + 1))
+    elif method == "jenks":
+        if data.size > sample_size:
+            rng = np.random.default_rng(seed)
+            data = rng.choice(data, sample_size, replace=False)
+        edges = np.concatenate(([lo], _jenks_inner_breaks(np.sort(data), k), [hi]))
+    else:
+        raise ValueError(f"Unknown classification method: {method!r}")
+    return np.maximum.accumulate(edges).tolist()
+
+
+def classify_features(
+    collection: dict[str, Any],
+    prop: str,
+    *,
+    k: int = 5,
+    method: ClassifyMethod = "quantile",
+    palette: Optional[Sequence[str]] = None,
+    color_property: Optional[str] = "fill",
+    no_data_color: str = NO_DATA_COLOR,
+    sample_size: int = 1000,
+) -> Classification:
+    """Classify a FeatureCollection by one numeric property.
+
+    Args:
+        collection: GeoJSON FeatureCollection.
+        prop: Name of the numeric property to classify.
+        k: Number of classes.
+        method: ``"quantile"``, ``"equal_interval"`` or ``"jenks"``.
+        palette: Colour stops, interpolated to ``k`` colours.
+        color_property: Feature property that receives each feature's
+            colour (simplestyle ``fill`` by default). The collection is
+            modified in place; pass ``None`` to leave it untouched.
+        no_data_color: Colour for features without a numeric value.
+        sample_size: Sample size for the Jenks fast path.
+
+    Returns:
+        Classification with breaks, colours and per-feature class indices.
+    """
+    values = property_column(collection, prop)
+    breaks = class_breaks(values, k, method, sample_size=sample_size)
+    n_classes = len(breaks) - 1 if breaks else 0
+
+    classes = np.full(values.shape, -1, dtype=np.int64)
+    if n_classes:
+        finite = np.isfinite(values)
+        inner = np.asarray(breaks[1:-1])
+        classes[finite] = np.searchsorted(inner, values[finite], side="right")
+
+    result = Classification(
+        breaks=breaks,
+        colors=interpolate_palette(palette or DEFAULT_PALETTE, n_classes),
+        classes=classes,
+        no_data_color=no_data_color,
+    )
+    if color_property:
+        for feature, color in zip(
+            collection.get("features", []), result.feature_colors()
+        ):
+            if feature.get("properties") is None:
+                feature["properties"] = {}
+            feature["properties"][color_property] = color
+    return result
+
+
+def interpolate_palette(stops: Sequence[str], n: int) -> list[str]:
+    """Resample a list of ``#rrggbb`` colour stops to ``n`` colours."""
+    if n <= 0:
+        return []
+    if len(stops) == 1 or n == 1:
+        return [stops[0]] * n
+    rgb = np.array(
+        [[int(s[i : i + 2], 16) for i in (1, 3, 5)] for s in stops], dtype=float
+    )
+    pos = np.linspace(0, len(stops) - 1, n)
+    channels = [np.interp(pos, np.arange(len(stops)), rgb[:, c]) for c in range(3)]
+    return [
+        "#{:02x}{:02x}{:02x}".format(*(round(float(ch[i])) for ch in channels))
+        for i in range(n)
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Internals
+# ---------------------------------------------------------------------------
+
+
+def _to_float(value: Any) -> float:
+    if isinstance(value, bool) or value is None:
+        return np.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _fmt(value: float) -> str:
+    return f"{value:,.0f}" if abs(value) >= 100 else f"{value:.4g}"
+
+
+def _jenks_inner_breaks(data: np.ndarray, k: int) -> np.ndarray:
+    """Fisher-Jenks optimal partition of sorted ``data`` into ``k`` classes.
+
+    Dynamic programming over prefix sums; each class step is one vectorized
+    min over an (n × n) cost matrix.
+    """
+    n = data.size
+    if k >= n:
+        return data[1:][: k - 1]
+    s1 = np.concatenate(([0.0], np.cumsum(data)))
+    s2 = np.concatenate(([0.0], np.cumsum(data * data)))
+    i = np.arange(n + 1)[:, None]
+    j = np.arange(n + 1)[None, :]
+    count = (j - i).astype(float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cost = (s2[j] - s2[i]) - (s1[j] - s1[i]) ** 2 / count
+    cost[count <= 0] = np.inf
+
+    # best[c][j]: minimal within-class variance of data[:j] in c + 1 classes
+    best = cost[0].copy()
+    back = np.zeros((k, n + 1), dtype=np.int64)
+    for c in range(1, k):
+        total = best[:, None] + cost
+        back[c] = np.argmin(total, axis=0)
+        best = total[back[c], np.arange(n + 1)]
+
+    starts = []
+    end = n
+    for c in range(k - 1, 0, -1):
+        start = int(back[c][end])
+        starts.append(start)
+        end = start
+    return data[np.asarray(starts[::-1], dtype=np.int64)]
@@ -48,6 +48,8 @@ def _view_tool(
     visibility: Optional[list[str]] = None,
     prefers_border: Optional[bool] = None,
     cdn_base: Optional[str] = None,
+    target_points: Optional[int] = None,
+    density_threshold: Optional[int] = None,
 ) -> Callable[[F], F]:
     """Core decorator factory targeting ChukMCPServer.
 
@@ -58,6 +60,9 @@ def _view_tool(
     - Passes the explicit tool_name to mcp_server.tool(name=...)
     - Accepts individual hint kwargs (read_only_hint, etc.) matching
       ChukMCPServer's API instead of a monolithic ``annotations`` dict.
+
+    ``target_points`` and ``density_threshold`` behave as in the fastmcp
+    variant.
     """
     effective_cdn = cdn_base or CDN_BASE
     view_path = VIEW_PATHS.get(view_type, f"/{view_type}/v1")
@@ -86,6 +91,17 @@ def _view_tool(
                     f"Expected BaseModel or dict, got {type(result).__name__}"
                 )
 
+            if target_points is not None:
+                # Optional NumPy dependency, only needed when downsampling
+                from .downsample import downsample_structured
+
+                structured = downsample_structured(structured, target_points)
+
+            if density_threshold is not None:
+                from .scatter_density import reduce_scatter_structured
+
+                structured = reduce_scatter_structured(structured, density_threshold)
+
             return {"structuredContent": structured}
 
         if _has_view_tool(mcp_server):
@@ -345,7 +361,10 @@ def sunburst_tool(mcp: Any, name: str, **kwargs: Any) -> Callable[[F], F]:
 
 
 def scatter_tool(mcp: Any, name: str, **kwargs: Any) -> Callable[[F], F]:
-    """Register an MCP tool that returns a scatter View."""
+    """Register an MCP tool that returns a scatter View.
+
+    Pass ``density_threshold=`` to bin oversized results into density cells.
+    """
     return _view_tool(mcp, name, "scatter", **kwargs)
 
 
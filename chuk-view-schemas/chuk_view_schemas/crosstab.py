@@ -1,6 +1,14 @@
 from typing import List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
+
+
+class CrosstabSparse(BaseModel):
+    """Non-zero cells as parallel (row, col, value) lists; other cells are 0."""
+
+    rows: List[int]
+    cols: List[int]
+    values: List[float]
 
 
 class CrosstabContent(BaseModel):
@@ -9,7 +17,14 @@ class CrosstabContent(BaseModel):
     title: Optional[str] = None
     row_headers: List[str] = Field(alias="rowHeaders")
     column_headers: List[str] = Field(alias="columnHeaders")
-    values: List[List[float]]
+    values: Optional[List[List[float]]] = None
+    sparse_values: Optional[CrosstabSparse] = Field(None, alias="sparseValues")
     show_totals: Optional[bool] = Field(None, alias="showTotals")
 
     model_config = {"populate_by_name": True}
+
+    @model_validator(mode="after")
+    def _one_encoding(self) -> "CrosstabContent":
+        if (self.values is None) == (self.sparse_values is None):
+            raise ValueError("Exactly one of values or sparseValues is required")
+        return self
@@ -0,0 +1,186 @@
+"""Crosstab builder with automatic sparse encoding.
+
+``crosstab()`` counts (or sums weights) over two label arrays: both are
+factorized to integer codes and the cells are filled with one ``bincount``
+over ``row * n_cols + col``. High-cardinality tables, such as products by
+store, are mostly zeros. With ``sparse_threshold`` set (for example
+``DEFAULT_SPARSE_THRESHOLD``), a matrix below that occupied-cell density
+is sent as ``sparseValues`` triplets instead of dense ``values``, and very
+large grids are never materialized densely. Sparse output is opt-in:
+views that only read ``values`` need the default dense encoding.
+
+Usage:
+    content = crosstab(sales["product"], sales["store"], sales["units"],
+                       title="Units by store")
+    content = crosstab_records(stream_of_dicts, "product", "store", "units")
+
+Requires NumPy (``pip install chuk-view-schemas[numpy]``).
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, Literal, Mapping, Optional
+
+import numpy as np
+
+from ._arrays import factorize
+from .crosstab import CrosstabContent, CrosstabSparse
+
+DEFAULT_SPARSE_THRESHOLD = 0.1
+
+# Above this many cells, skip the dense bincount and only track occupied ones
+_DENSE_CELL_LIMIT = 20_000_000
+
+SortOrder = Literal["label", "total"]
+
+
+def crosstab(
+    row_labels: Any,
+    column_labels: Any,
+    weights: Any = None,
+    *,
+    title: Optional[str] = None,
+    sort: SortOrder = "label",
+    sparse_threshold: Optional[float] = None,
+    show_totals: Optional[bool] = None,
+) -> CrosstabContent:
+    """Cross-tabulate two label arrays.
+
+    Args:
+        row_labels: Row label per record.
+        column_labels: Column label per record.
+        weights: Value per record to sum; counts records when omitted.
+            Records with a NaN or infinite weight add nothing to their cell.
+        title: Crosstab title.
+        sort: Header order: ``"label"`` (sorted labels) or ``"total"``
+            (largest row / column total first).
+        sparse_threshold: Emit ``sparse_values`` instead of ``values``
+            when the fraction of non-zero cells is below this. ``None``
+            (the default) always emits dense values.
+        show_totals: Passed through to the view.
+
+    Raises:
+        ValueError: If the label arrays differ in length, or a dense grid
+            would exceed the cell limit (pass ``sparse_threshold``).
+    """
+    r_codes, r_labels = factorize(_as_column(row_labels))
+    c_codes, c_labels = factorize(_as_column(column_labels))
+    if r_codes.shape != c_codes.shape:
+        raise ValueError("row_labels and column_labels must have the same length")
+    w = None if weights is None else np.asarray(weights, dtype=float)
+    if w is not None and w.shape != r_codes.shape:
+        raise ValueError("weights must have the same length as the labels")
+
+    n_rows, n_cols = len(r_labels), len(c_labels)
+    if sparse_threshold is None and n_rows * n_cols > _DENSE_CELL_LIMIT:
+        raise ValueError(
+            f"{n_rows} x {n_cols} grid is too large for dense values; "
+            "pass sparse_threshold"
+        )
+    flat = r_codes * n_cols + c_codes
+    if w is not None and not np.isfinite(w).all():
+        finite = np.isfinite(w)
+        flat, w = flat[finite], w[finite]
+    if n_rows * n_cols <= _DENSE_CELL_LIMIT:
+        sums = np.bincount(flat, weights=w, minlength=n_rows * n_cols)
+        cells = np.flatnonzero(sums)
+        cell_values = sums[cells]
+    else:
+        cells, inverse = np.unique(flat, return_inverse=True)
+        cell_values = np.bincount(inverse.ravel(), weights=w, minlength=cells.size)
+        keep = cell_values != 0
+        cells, cell_values = cells[keep], cell_values[keep]
+    rows, cols = np.divmod(cells, n_cols)
+
+    row_order = _order(rows, cell_values, n_rows, sort)
+    col_order = _order(cols, cell_values, n_cols, sort)
+    rows, cols = _rank(row_order)[rows], _rank(col_order)[cols]
+
+    values, sparse_values = None, None
+    density = cells.size / max(n_rows * n_cols, 1)
+    if sparse_threshold is not None and density < sparse_threshold:
+        order = np.lexsort((cols, rows))
+        sparse_values = CrosstabSparse(
+            rows=rows[order].tolist(),
+            cols=cols[order].tolist(),
+            values=cell_values[order].tolist(),
+        )
+    else:
+        dense = np.zeros((n_rows, n_cols))
+        dense[rows, cols] = cell_values
+        values = dense.tolist()
+    return CrosstabContent(
+        title=title,
+        row_headers=[r_labels[i] for i in row_order.tolist()],
+        column_headers=[c_labels[i] for i in col_order.tolist()],
+        values=values,
+        sparse_values=sparse_values,
+        show_totals=show_totals,
+    )
+
+
+def crosstab_records(
+    records: Iterable[Mapping[str, Any]],
+    row_field: str,
+    column_field: str,
+    value_field: Optional[str] = None,
+    **kwargs: Any,
+) -> CrosstabContent:
+    """``crosstab()`` over an iterable of dicts, consumed in one pass.
+
+    Records with a missing or non-numeric ``value_field`` count as 0.
+    """
+    rows: list[Any] = []
+    cols: list[Any] = []
+    vals: list[float] = []
+    for record in records:
+        rows.append(record.get(row_field))
+        cols.append(record.get(column_field))
+        if value_field is not None:
+            vals.append(_to_number(record.get(value_field)))
+    return crosstab(rows, cols, vals if value_field is not None else None, **kwargs)
+
+
+def to_dense(content: CrosstabContent) -> list[list[float]]:
+    """Dense ``values`` for a crosstab, expanding ``sparse_values`` if set."""
+    if content.values is not None:
+        return content.values
+    dense = np.zeros((len(content.row_headers), len(content.column_headers)))
+    if content.sparse_values is not None:
+        sv = content.sparse_values
+        dense[sv.rows, sv.cols] = sv.values
+    return dense.tolist()
+
+
+# ---------------------------------------------------------------------------
+# Internals
+# ---------------------------------------------------------------------------
+
+
+def _as_column(labels: Any) -> Any:
+    return labels if isinstance(labels, np.ndarray) else list(labels)
+
+
+def _to_number(value: Any) -> float:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return number if np.isfinite(number) else 0.0
+
+
+def _order(
+    codes: np.ndarray, values: np.ndarray, n: int, sort: SortOrder
+) -> np.ndarray:
+    if sort == "label":
+        return np.arange(n)
+    if sort == "total":
+        totals = np.bincount(codes, weights=values, minlength=n)
+        return np.argsort(-totals, kind="stable")
+    raise ValueError(f"Unknown sort order: {sort!r}")
+
+
+def _rank(order: np.ndarray) -> np.ndarray:
+    rank = np.empty_like(order)
+    rank[order] = np.arange(order.size)
+    return rank
@@ -39,5 +39,7 @@ class DataTableContent(BaseModel):
     total_rows: Optional[int] = Field(None, alias="totalRows")
     page_size: Optional[int] = Field(None, alias="pageSize")
     current_page: Optional[int] = Field(None, alias="currentPage")
+    search_tool: Optional[str] = Field(None, alias="searchTool")
+    highlights: Optional[List[Dict[str, List[List[int]]]]] = None
 
     model_config = {"populate_by_name": True}
@@ -0,0 +1,288 @@
+"""LTTB and M4 downsampling for timeseries and line/area chart Views.
+
+A view can only draw about a thousand pixels across, so sending millions
+of samples is wasted payload. Two vectorized downsamplers:
+
+- ``lttb_indices``: Largest-Triangle-Three-Buckets, visually faithful,
+  optionally forced to keep the global min/max samples
+- ``m4_indices``: first/last/min/max per time bucket, so every extreme is
+  kept exactly
+
+Both accept irregular (sorted) x values. ``downsample_timeseries``,
+``downsample_chart`` and ``downsample_structured`` apply them to View
+payloads; the FastMCP / ChukMCPServer decorators call the latter when
+given ``target_points=``.
+
+Requires NumPy (``pip install chuk-view-schemas[numpy]``).
+"""
+
+from __future__ import annotations
+
+import warnings
+from datetime import datetime
+from typing import Any, Literal, Optional
+
+import numpy as np
+
+from .chart import ChartContent
+from .timeseries import TimeseriesContent
+
+DownsampleMethod = Literal["lttb", "m4"]
+
+# Chart types whose datasets are continuous lines
+LINE_CHART_TYPES = {"line", "area"}
+
+
+def lttb_indices(
+    x: Any, y: Any, n_out: int, *, keep_extremes: bool = True
+) -> np.ndarray:
+    """Indices of the samples Largest-Triangle-Three-Buckets keeps.
+
+    Args:
+        x: Sorted x values (timestamps or positions).
+        y: Values, same length as ``x``.
+        n_out: Target number of samples (>= 3).
+        keep_extremes: Also keep the global min and max samples, which
+            LTTB may otherwise drop.
+
+    Returns:
+        Sorted int64 index array; at most ``n_out`` (+2 with extremes).
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = y.size
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # Bucket i covers [bounds[i], bounds[i + 1]); first and last points
+    # are their own buckets.
+    every = (n - 2) / (n_out - 2)
+    bounds = np.empty(n_out, dtype=np.int64)
+    bounds[:-1] = np.floor(np.arange(n_out - 1) * every).astype(np.int64) + 1
+    bounds[-2] = n - 1
+    bounds[-1] = n
+    counts = np.diff(bounds)
+    mean_x = np.add.reduceat(x, bounds[:-1]) / counts
+    mean_y = np.add.reduceat(y, bounds[:-1]) / counts
+
+    out = np.empty(n_out, dtype=np.int64)
+    out[0] = a = 0
+    for i in range(n_out - 2):
+        start, end = bounds[i], bounds[i + 1]
+        ax, ay = x[a], y[a]
+        cx, cy = mean_x[i + 1], mean_y[i + 1]
+        area = np.abs((ax - cx) * (y[start:end] - ay) - (ax - x[start:end]) * (cy - ay))
+        a = start + int(np.argmax(area))
+        out[i + 1] = a
+    out[-1] = n - 1
+
+    if keep_extremes:
+        out = np.union1d(out, [int(np.argmin(y)), int(np.argmax(y))])
+    return out
+
+
+def m4_indices(x: Any, y: Any, n_out: int) -> np.ndarray:
+    """Indices of the first, last, min and max sample in each x bucket.
+
+    Buckets split the x range evenly (``n_out // 4`` of them), so irregular
+    timestamps get one bucket per pixel column rather than per sample count.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = y.size
+    n_buckets = max(1, n_out // 4)
+    if n_out >= n:
+        return np.arange(n)
+
+    edges = np.linspace(x[0], x[-1], n_buckets + 1)
+    starts = np.searchsorted(x, edges[:-1], side="left")
+    ends = np.append(starts[1:], n)
+    keep = [np.array([0, n - 1])]
+    for start, end in zip(starts.tolist(), ends.tolist()):
+        if end <= start:
+            continue
+        seg = y[start:end]
+        keep.append(
+            np.array(
+                [
+                    start,
+                    end - 1,
+                    start + int(np.argmin(seg)),
+                    start + int(np.argmax(seg)),
+                ]
+            )
+        )
+    return np.unique(np.concatenate(keep))
+
+
+def downsample_indices(
+    x: Any, y: Any, n_out: int, method: DownsampleMethod = "lttb"
+) -> np.ndarray:
+    """Dispatch to ``lttb_indices`` or ``m4_indices``, skipping NaN values."""
+    y = np.asarray(y, dtype=float)
+    finite = np.flatnonzero(np.isfinite(y))
+    x = np.asarray(x, dtype=float)[finite]
+    if method == "lttb":
+        idx = lttb_indices(x, y[finite], n_out)
+    elif method == "m4":
+        idx = m4_indices(x, y[finite], n_out)
+    else:
+        raise ValueError(f"Unknown downsample method: {method!r}")
+    return finite[idx]
+
+
+def downsample_timeseries(
+    content: TimeseriesContent,
+    target_points: int,
+    method: DownsampleMethod = "lttb",
+) -> TimeseriesContent:
+    """Return a copy of ``content`` with every series downsampled."""
+    structured = content.model_dump(by_alias=True, exclude_none=True)
+    return TimeseriesContent.model_validate(
+        downsample_structured(structured, target_points, method)
+    )
+
+
+def downsample_chart(
+    content: ChartContent,
+    target_points: int,
+    method: DownsampleMethod = "lttb",
+) -> ChartContent:
+    """Return a copy of a line/area ``content`` with datasets downsampled.
+
+    Other chart types are returned unchanged.
+    """
+    if content.chart_type not in LINE_CHART_TYPES:
+        return content
+    structured = content.model_dump(by_alias=True, exclude_none=True)
+    return ChartContent.model_validate(
+        downsample_structured(structured, target_points, method)
+    )
+
+
+def downsample_structured(
+    structured: dict[str, Any],
+    target_points: int,
+    method: DownsampleMethod = "lttb",
+) -> dict[str, Any]:
+    """Downsample a serialized timeseries or line/area chart payload.
+
+    Any other payload is returned unchanged. The input dict is not modified.
+    """
+    view = structured.get("type")
+    if view == "timeseries":
+        series = [
+            {**s, "data": _downsample_timeseries_data(s["data"], target_points, method)}
+            for s in structured.get("series", [])
+        ]
+        return {**structured, "series": series}
+    if view == "chart" and structured.get("chartType") in LINE_CHART_TYPES:
+        return {
+            **structured,
+            "data": _downsample_chart_data(
+                structured.get("data", []), target_points, method
+            ),
+        }
+    return structured
+
+
+# ---------------------------------------------------------------------------
+# Internals
+# ---------------------------------------------------------------------------
+
+
+def _downsample_timeseries_data(
+    data: list[dict[str, Any]], target_points: int, method: DownsampleMethod
+) -> list[dict[str, Any]]:
+    if len(data) <= target_points:
+        return data
+    t = _time_axis([p["t"] for p in data])
+    v = np.fromiter((p["v"] for p in data), dtype=float, count=len(data))
+    order = np.argsort(t, kind="stable")
+    idx = order[downsample_indices(t[order], v[order], target_points, method)]
+    return [data[i] for i in np.sort(idx).tolist()]
+
+
+def _downsample_chart_data(
+    datasets: list[dict[str, Any]], target_points: int, method: DownsampleMethod
+) -> list[dict[str, Any]]:
+    # XY datasets with numeric x are independent; everything else is
+    # aligned by position, so all aligned datasets -- including short ones
+    # -- keep the same indices.
+    aligned: list[int] = []
+    result = list(datasets)
+    keep: Optional[np.ndarray] = None
+    for i, ds in enumerate(datasets):
+        values = ds.get("values", [])
+        if not values:
+            continue
+        x, y = _chart_xy(values)
+        if x is not None:
+            if len(values) > target_points:
+                idx = downsample_indices(x, y, target_points, method)
+                result[i] = {**ds, "values": [values[j] for j in idx.tolist()]}
+            continue
+        aligned.append(i)
+        if len(values) > target_points:
+            idx = downsample_indices(np.arange(y.size), y, target_points, method)
+            keep = idx if keep is None else np.union1d(keep, idx)
+    if keep is None:
+        return result
+
+    for i in aligned:
+        values = datasets[i]["values"]
+        picked = [j for j in keep.tolist() if j < len(values)]
+        result[i] = {
+            **datasets[i],
+            "values": [
+                {"label": str(j), "value": values[j]}
+                if isinstance(values[j], (int, float))
+                else values[j]
+                for j in picked
+            ],
+        }
+    return result
+
+
+def _chart_xy(values: list[Any]) -> tuple[Optional[np.ndarray], np.ndarray]:
+    first = values[0]
+    if (
+        isinstance(first, dict)
+        and "y" in first
+        and isinstance(first.get("x"), (int, float))
+    ):
+        x = np.fromiter((v["x"] for v in values), dtype=float, count=len(values))
+        y = np.fromiter((v["y"] for v in values), dtype=float, count=len(values))
+        return x, y
+    y = np.fromiter((_chart_y(v) for v in values), dtype=float, count=len(values))
+    return None, y
+
+
+def _chart_y(value: Any) -> float:
+    if isinstance(value, dict):
+        value = value.get("value", value.get("y"))
+    return np.nan if value is None else value
+
+
+def _time_axis(ts: list[str]) -> np.ndarray:
+    """Timestamps as float seconds; falls back to sample positions."""
+    try:
+        with warnings.catch_warnings():
+            # numpy warns on (and mis-handles) UTC offsets; use fromisoformat
+            warnings.simplefilter("error")
+            stripped = [t.removesuffix("Z") for t in ts]
+            return np.array(stripped, dtype="datetime64[ns]").astype(np.int64) / 1e9
+    except (ValueError, Warning):
+        pass
+    try:
+        # fromisoformat only accepts "Z" from Python 3.11
+        return np.array(
+            [
+                datetime.fromisoformat(
+                    t[:-1] + "+00:00" if t.endswith("Z") else t
+                ).timestamp()
+                for t in ts
+            ]
+        )
+    except ValueError:
+        return np.arange(len(ts), dtype=float)
@@ -115,8 +115,16 @@ def _view_tool(
     visibility: Optional[list[str]] = None,
     prefers_border: Optional[bool] = None,
     cdn_base: Optional[str] = None,
+    target_points: Optional[int] = None,
+    density_threshold: Optional[int] = None,
 ) -> Callable[[F], F]:
-    """Core decorator factory."""
+    """Core decorator factory.
+
+    ``target_points`` downsamples timeseries and line/area chart results
+    to about that many samples per series (LTTB, see ``downsample.py``).
+    ``density_threshold`` replaces scatter results with more points than
+    that by density-cell centroids plus outliers (``scatter_density.py``).
+    """
     effective_cdn = cdn_base or CDN_BASE
     view_path = VIEW_PATHS.get(view_type, f"/{view_type}/v1")
     view_url = f"{effective_cdn}{view_path}"
@@ -162,6 +170,17 @@ def _view_tool(
                     f"Expected BaseModel or dict, got {type(result).__name__}"
                 )
 
+            if target_points is not None:
+                # Optional NumPy dependency, only needed when downsampling
+                from .downsample import downsample_structured
+
+                structured = downsample_structured(structured, target_points)
+
+            if density_threshold is not None:
+                from .scatter_density import reduce_scatter_structured
+
+                structured = reduce_scatter_structured(structured, density_threshold)
+
             return {"structuredContent": structured}
 
         mcp_server.tool(**decorator_kwargs)(wrapper)
@@ -374,7 +393,10 @@ def sunburst_tool(mcp: Any, name: str, **kwargs: Any) -> Callable[[F], F]:
 
 
 def scatter_tool(mcp: Any, name: str, **kwargs: Any) -> Callable[[F], F]:
-    """Register an MCP tool that returns a scatter View."""
+    """Register an MCP tool that returns a scatter View.
+
+    Pass ``density_threshold=`` to bin oversized results into density cells.
+    """
     return _view_tool(mcp, name, "scatter", **kwargs)
 
 
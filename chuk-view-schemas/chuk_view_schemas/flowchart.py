@@ -8,6 +8,8 @@ class FlowchartNode(BaseModel):
     label: str
     shape: Optional[Literal["rect", "diamond", "ellipse", "parallelogram"]] = None
     color: Optional[str] = None
+    x: Optional[float] = None
+    y: Optional[float] = None
 
 
 class FlowchartEdge(BaseModel):
@@ -1,6 +1,6 @@
 from typing import List, Literal, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class GanttTask(BaseModel):
@@ -11,6 +11,9 @@ class GanttTask(BaseModel):
     progress: Optional[int] = None
     dependencies: Optional[List[str]] = None
     group: Optional[str] = None
+    critical: Optional[bool] = None
+    slack: Optional[int] = None
+    summary: Optional[bool] = None
 
 
 class GanttContent(BaseModel):
@@ -18,3 +21,8 @@ class GanttContent(BaseModel):
     version: Literal["1.0"] = "1.0"
     title: Optional[str] = None
     tasks: List[GanttTask]
+    start_date: Optional[str] = Field(None, alias="startDate")
+    end_date: Optional[str] = Field(None, alias="endDate")
+    window_tool: Optional[str] = Field(None, alias="windowTool")
+
+    model_config = {"populate_by_name": True}
@@ -0,0 +1,334 @@
+"""Scheduling engine for large Gantt Views.
+
+``GanttSchedule`` indexes a plan once and serves date windows of it:
+
+- ``order``: a topological order of the tasks over ``dependencies``
+  (Kahn's algorithm); a cycle raises ``ValueError`` naming the loop
+- ``slack``: total float per task in days, from a backward pass over that
+  order against the planned dates. A task's latest finish is the earliest
+  latest start of its successors (the project end for the last tasks);
+  tasks with no slack form the critical path, and negative slack flags a
+  task whose successors are planned to start before it can finish
+- ``groups``: per-group roll-ups (span, duration-weighted progress,
+  task count, whether any task is critical)
+- ``window()``: only the tasks overlapping a date range, found through a
+  static interval tree (O(log n + k)), with collapsed groups replaced by
+  one summary bar
+
+Dates follow the view: ``YYYY-MM-DD`` strings, with ``end`` exclusive and
+every task at least one day long. Dependencies on unknown tasks are
+ignored, as the view ignores them.
+
+Window tool contract: ``window()`` returns ``GanttContent`` with
+``windowTool``, ``startDate`` and ``endDate`` set. When the user scrolls or
+toggles a group, the view calls that tool with
+``{"start": <date>, "end": <date>, "collapsed": [<group>, ...]}`` and
+replaces its content with the result.
+
+Usage:
+    schedule = GanttSchedule.from_content(plan, window_tool="gantt_window")
+
+    @gantt_tool(mcp, "gantt_window")
+    async def gantt_window(start: str, end: str, collapsed: list[str] = []):
+        return schedule.window(start, end, collapsed=collapsed)
+
+Pure Python — no external dependencies.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Iterable, Optional, Sequence
+
+from ._intervals import IntervalTree
+from .gantt import GanttContent, GanttTask
+
+SUMMARY_PREFIX = "group:"
+
+
+@dataclass
+class GanttGroup:
+    """Roll-up of the tasks sharing one ``group``."""
+
+    name: str
+    start: str
+    end: str
+    progress: Optional[int]
+    tasks: int
+    critical: bool
+
+
+def topological_order(tasks: Sequence[GanttTask]) -> list[str]:
+    """Task ids ordered so every task follows its dependencies.
+
+    Ties keep the input order.
+
+    Raises:
+        ValueError: If the dependencies form a cycle.
+    """
+    return [tasks[i].id for i in _topological(tasks, _index(tasks))]
+
+
+class GanttSchedule:
+    """Dependency-ordered, interval-indexed plan.
+
+    Args:
+        tasks: The plan; ids must be unique.
+        title: Title of the returned content.
+        window_tool: Tool the view calls to page through the plan.
+
+    Raises:
+        ValueError: On duplicate ids or a dependency cycle.
+    """
+
+    def __init__(
+        self,
+        tasks: Sequence[GanttTask],
+        *,
+        title: Optional[str] = None,
+        window_tool: Optional[str] = None,
+    ) -> None:
+        self.tasks = list(tasks)
+        self.title = title
+        self.window_tool = window_tool
+        self._pos = _index(self.tasks)
+        if len(self._pos) != len(self.tasks):
+            for i, task in enumerate(self.tasks):
+                if self._pos[task.id] != i:
+                    raise ValueError(f"Duplicate task id: {task.id!r}")
+
+        self._start = [_day(t.start) for t in self.tasks]
+        self._end = [max(_day(t.end), s + 1) for t, s in zip(self.tasks, self._start)]
+        self._topo = _topological(self.tasks, self._pos)
+        self._slack = self._backward_pass()
+        self._tree = IntervalTree(self._start, self._end)
+        self.groups = self._roll_up()
+
+    @classmethod
+    def from_content(
+        cls, content: GanttContent, *, window_tool: Optional[str] = None
+    ) -> GanttSchedule:
+        return cls(
+            content.tasks,
+            title=content.title,
+            window_tool=window_tool or content.window_tool,
+        )
+
+    def __len__(self) -> int:
+        return len(self.tasks)
+
+    @property
+    def order(self) -> list[str]:
+        """Task ids in topological order."""
+        return [self.tasks[i].id for i in self._topo]
+
+    @property
+    def slack(self) -> dict[str, int]:
+        """Total float per task id, in days."""
+        return {t.id: s for t, s in zip(self.tasks, self._slack)}
+
+    @property
+    def start(self) -> Optional[str]:
+        return _iso(min(self._start)) if self.tasks else None
+
+    @property
+    def end(self) -> Optional[str]:
+        return _iso(max(self._end)) if self.tasks else None
+
+    def critical_path(self) -> list[str]:
+        """Ids of the tasks with no slack, in topological order."""
+        return [self.tasks[i].id for i in self._topo if self._slack[i] <= 0]
+
+    def overlapping(self, start: str, end: str) -> list[GanttTask]:
+        """Tasks overlapping ``[start, end)``, in plan order."""
+        return [self.tasks[i] for i in self._overlapping(_day(start), _day(end))]
+
+    def window(
+        self,
+        start: str,
+        end: str,
+        *,
+        collapsed: Iterable[str] = (),
+    ) -> GanttContent:
+        """``GanttContent`` for the tasks overlapping ``[start, end)``.
+
+        Tasks are annotated with ``slack`` and ``critical``. Each group in
+        ``collapsed`` whose span overlaps the window becomes one summary
+        bar (id ``group:<name>``) in place of its tasks, and dependencies
+        on its tasks point at that bar. Dependencies on tasks outside the
+        window are dropped.
+        """
+        lo, hi = _day(start), _day(end)
+        collapsed = {name for name in collapsed if name in self.groups}
+        keyed: list[tuple[int, GanttTask]] = []
+        shown: set[int] = set()
+        for i in self._overlapping(lo, hi):
+            if self.tasks[i].group not in collapsed:
+                keyed.append((i, self.tasks[i]))
+                shown.add(i)
+        summaries = {}
+        for name in collapsed:
+            g_lo, g_hi = self._spans[name]
+            if g_lo < hi and g_hi > lo:
+                summaries[name] = self._summary(self.groups[name])
+                # Summary bars take the row of their group's first task
+                keyed.append((self._members[name][0], summaries[name]))
+        keyed.sort(key=lambda item: item[0])
+
+        def row_id(dep: str) -> Optional[str]:
+            j = self._pos.get(dep)
+            if j is None:
+                return None
+            group = self.tasks[j].group
+            if group in summaries:
+                return summaries[group].id
+            return dep if j in shown else None
+
+        out = []
+        for pos, row in keyed:
+            members = self._members[row.group] if row.summary and row.group else [pos]
+            deps: dict[str, None] = {}
+            for m in members:
+                for dep in self.tasks[m].dependencies or ():
+                    target = row_id(dep)
+                    if target is not None and target != row.id:
+                        deps.setdefault(target)
+            if row.summary:
+                out.append(row.model_copy(update={"dependencies": list(deps) or None}))
+                continue
+            slack = self._slack[pos]
+            out.append(
+                row.model_copy(
+                    update={
+                        "dependencies": list(deps) or None,
+                        "slack": slack,
+                        "critical": slack <= 0,
+                    }
+                )
+            )
+        return GanttContent(
+            title=self.title,
+            tasks=out,
+            start_date=_iso(lo),
+            end_date=_iso(hi),
+            window_tool=self.window_tool,
+        )
+
+    def _overlapping(self, lo: int, hi: int) -> list[int]:
+        return sorted(self._tree.query(lo, hi))
+
+    def _backward_pass(self) -> list[int]:
+        n = len(self.tasks)
+        if n == 0:
+            return []
+        project_end = max(self._end)
+        latest_finish = [project_end] * n
+        for i in reversed(self._topo):
+            latest_start = latest_finish[i] - (self._end[i] - self._start[i])
+            for j in self._predecessors(i):
+                latest_finish[j] = min(latest_finish[j], latest_start)
+        return [lf - e for lf, e in zip(latest_finish, self._end)]
+
+    def _predecessors(self, i: int) -> list[int]:
+        deps = self.tasks[i].dependencies or ()
+        return [self._pos[d] for d in deps if d in self._pos and self._pos[d] != i]
+
+    def _roll_up(self) -> dict[str, GanttGroup]:
+        # Member positions (in plan order) and day span per group, kept so
+        # window() only touches the groups it shows
+        self._members: dict[str, list[int]] = {}
+        for i, task in enumerate(self.tasks):
+            if task.group is not None:
+                self._members.setdefault(task.group, []).append(i)
+        self._spans: dict[str, tuple[int, int]] = {}
+        groups = {}
+        for name, idx in self._members.items():
+            self._spans[name] = (
+                min(self._start[i] for i in idx),
+                max(self._end[i] for i in idx),
+            )
+            days = [self._end[i] - self._start[i] for i in idx]
+            tracked = [(d, self.tasks[i].progress) for d, i in zip(days, idx)]
+            tracked = [(d, p) for d, p in tracked if p is not None]
+            weight = sum(d for d, _ in tracked)
+            groups[name] = GanttGroup(
+                name=name,
+                start=_iso(self._spans[name][0]),
+                end=_iso(self._spans[name][1]),
+                progress=(
+                    round(sum(d * p for d, p in tracked) / weight) if tracked else None
+                ),
+                tasks=len(idx),
+                critical=any(self._slack[i] <= 0 for i in idx),
+            )
+        return groups
+
+    def _summary(self, group: GanttGroup) -> GanttTask:
+        return GanttTask(
+            id=SUMMARY_PREFIX + group.name,
+            label=f"{group.name} ({group.tasks} tasks)",
+            start=group.start,
+            end=group.end,
+            progress=group.progress,
+            group=group.name,
+            critical=group.critical,
+            summary=True,
+        )
+
+
+# ---------------------------------------------------------------------------
+# Internals
+# ---------------------------------------------------------------------------
+
+
+def _index(tasks: Sequence[GanttTask]) -> dict[str, int]:
+    return {task.id: i for i, task in enumerate(tasks)}
+
+
+def _topological(tasks: Sequence[GanttTask], pos: dict[str, int]) -> list[int]:
+    n = len(tasks)
+    successors: list[list[int]] = [[] for _ in range(n)]
+    indegree = [0] * n
+    for i, task in enumerate(tasks):
+        for dep in dict.fromkeys(task.dependencies or ()):
+            j = pos.get(dep)
+            if j is not None:
+                successors[j].append(i)
+                indegree[i] += 1
+    order = [i for i in range(n) if indegree[i] == 0]
+    for i in order:  # grows while iterating: Kahn's algorithm
+        for j in successors[i]:
+            indegree[j] -= 1
+            if indegree[j] == 0:
+                order.append(j)
+    if len(order) < n:
+        cycle = _find_cycle(tasks, pos, [d > 0 for d in indegree])
+        raise ValueError("Dependency cycle: " + " -> ".join(cycle))
+    return order
+
+
+def _find_cycle(
+    tasks: Sequence[GanttTask], pos: dict[str, int], blocked: list[bool]
+) -> list[str]:
+    """One cycle among the tasks Kahn's algorithm could not order."""
+    # Every blocked task has a blocked dependency: follow them until one repeats
+    i = blocked.index(True)
+    seen: dict[int, int] = {}
+    path: list[int] = []
+    while i not in seen:
+        seen[i] = len(path)
+        path.append(i)
+        i = next(
+            pos[d] for d in tasks[i].dependencies or () if d in pos and blocked[pos[d]]
+        )
+    loop = path[seen[i] :] + [i]
+    return [tasks[j].id for j in reversed(loop)]
+
+
+def _day(value: str) -> int:
+    return date.fromisoformat(value[:10]).toordinal()
+
+
+def _iso(day: int) -> str:
+    return date.fromordinal(day).isoformat()
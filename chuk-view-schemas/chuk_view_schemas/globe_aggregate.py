@@ -0,0 +1,214 @@
+"""Point binning and arc aggregation for globe Views.
+
+Flight and traffic data often means millions of arcs between a few thousand
+points. ``aggregate_globe()`` bounds the payload at any input size:
+
+- points are binned into a hierarchical lat/lon grid (level ``L`` cells are
+  ``90 / 2**L`` degrees; each cell splits into four at the next level), at
+  the finest level whose occupied cells fit ``max_points``
+- arcs between the same pair of cells are merged, summing their weights
+- only the ``top_k`` heaviest merged arcs are kept
+
+Point ``size`` scales with the aggregated point weight and arc ``color``
+with the merged arc weight.
+
+Requires NumPy (``pip install chuk-view-schemas[numpy]``).
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional, Sequence
+
+import numpy as np
+
+from .choropleth import interpolate_palette
+from .globe import GlobeArc, GlobeContent, GlobePoint
+
+MAX_LEVEL = 12
+
+# Cool-to-hot ramp for arc weights
+DEFAULT_ARC_PALETTE = ["#4575b4", "#91bfdb", "#fee090", "#fc8d59", "#d73027"]
+
+
+def grid_cells(lat: Any, lon: Any, level: int) -> np.ndarray:
+    """Integer cell index per point at a grid level (row-major, south-west origin)."""
+    size = 90.0 / 2**level
+    cols = round(360.0 / size)
+    rows = round(180.0 / size)
+    row = np.clip(
+        ((np.asarray(lat, dtype=float) + 90.0) // size).astype(np.int64), 0, rows - 1
+    )
+    col = np.clip(
+        ((np.asarray(lon, dtype=float) + 180.0) // size).astype(np.int64), 0, cols - 1
+    )
+    return row * cols + col
+
+
+def choose_level(
+    lat: Any, lon: Any, max_points: int, max_level: int = MAX_LEVEL
+) -> int:
+    """Finest grid level whose number of occupied cells is at most ``max_points``.
+
+    The occupied cells are found once at ``max_level``; coarser levels merge
+    them four to one, so each step costs only the occupied cells.
+
+    Raises:
+        ValueError: If even level 0 occupies more than ``max_points`` cells.
+    """
+    cells = np.unique(grid_cells(lat, lon, max_level))
+    cols = 4 * 2**max_level
+    for level in range(max_level, 0, -1):
+        if cells.size <= max_points:
+            return level
+        row, col = np.divmod(cells, cols)
+        cols //= 2
+        cells = np.unique(row // 2 * cols + col // 2)
+    if cells.size > max_points:
+        raise ValueError(
+            f"{cells.size} cells are occupied at level 0; "
+            f"max_points={max_points} cannot be met"
+        )
+    return 0
+
+
+def aggregate_globe(
+    point_ids: Sequence[Any],
+    lat: Any,
+    lon: Any,
+    arc_from: Any = None,
+    arc_to: Any = None,
+    *,
+    point_weight: Any = None,
+    arc_weight: Any = None,
+    max_points: int = 500,
+    top_k: int = 1000,
+    level: Optional[int] = None,
+    min_size: float = 0.2,
+    max_size: float = 2.0,
+    point_color: Optional[str] = None,
+    arc_palette: Optional[Sequence[str]] = None,
+    title: Optional[str] = None,
+) -> GlobeContent:
+    """Bin points, merge arcs and return a bounded ``GlobeContent``.
+
+    Args:
+        point_ids: Id per point. Arcs refer to points by these ids.
+        lat, lon: Point coordinates in degrees.
+        arc_from, arc_to: Arc endpoints, as point ids (or, when the ids are
+            not integers, as integer indices into the point arrays).
+        point_weight: Weight per point (default 1), summed per cell.
+        arc_weight: Weight per arc (default 1), summed per merged arc.
+        max_points: Upper bound on output points; picks the grid level.
+            ``ValueError`` if the points span more level-0 cells (45°
+            squares) than this.
+        top_k: Number of heaviest merged arcs to keep.
+        level: Force a grid level instead of choosing one.
+        min_size, max_size: Point size range, scaled by sqrt of weight.
+        point_color: Colour for every output point.
+        arc_palette: Colour stops for arcs, light to heavy.
+        title: Globe title.
+
+    Returns:
+        GlobeContent with at most ``max_points`` points (unless ``level`` is
+        forced) and at most ``top_k`` arcs. Merged arcs that start and end
+        in the same cell are dropped.
+    """
+    ids = np.asarray(point_ids)
+    lat_a = np.asarray(lat, dtype=float)
+    lon_a = np.asarray(lon, dtype=float)
+    if not (ids.shape == lat_a.shape == lon_a.shape):
+        raise ValueError("point_ids, lat and lon must have the same length")
+    pw = (
+        np.ones(ids.size)
+        if point_weight is None
+        else np.asarray(point_weight, dtype=float)
+    )
+
+    if level is None:
+        level = choose_level(lat_a, lon_a, max_points)
+    cells, point_cell = np.unique(grid_cells(lat_a, lon_a, level), return_inverse=True)
+    point_cell = point_cell.ravel()
+    n_cells = cells.size
+
+    counts = np.bincount(point_cell, minlength=n_cells)
+    weight = np.bincount(point_cell, weights=pw, minlength=n_cells)
+    denom = np.maximum(counts, 1)
+    mean_lat = np.bincount(point_cell, weights=lat_a, minlength=n_cells) / denom
+    mean_lon = np.bincount(point_cell, weights=lon_a, minlength=n_cells) / denom
+    scale = np.sqrt(weight / weight.max()) if n_cells and weight.max() > 0 else weight
+    sizes = min_size + (max_size - min_size) * scale
+
+    cell_ids = [f"L{level}-{c}" for c in cells.tolist()]
+    first_id = ids[np.unique(point_cell, return_index=True)[1]] if n_cells else ids
+    points = [
+        GlobePoint(
+            id=cell_ids[i],
+            lat=round(float(mean_lat[i]), 5),
+            lon=round(float(mean_lon[i]), 5),
+            label=str(first_id[i]) if counts[i] == 1 else f"{counts[i]} points",
+            size=round(float(sizes[i]), 3),
+            color=point_color,
+        )
+        for i in range(n_cells)
+    ]
+
+    arcs: Optional[list[GlobeArc]] = None
+    if arc_from is not None and arc_to is not None:
+        src = point_cell[_point_index(ids, arc_from)]
+        dst = point_cell[_point_index(ids, arc_to)]
+        aw = None if arc_weight is None else np.asarray(arc_weight, dtype=float)
+        arcs = _merge_arcs(src, dst, aw, n_cells, top_k, cell_ids, arc_palette)
+
+    return GlobeContent(title=title, points=points, arcs=arcs)
+
+
+def _point_index(ids: np.ndarray, refs: Any) -> np.ndarray:
+    refs = np.asarray(refs)
+    if refs.dtype.kind in "iu" and ids.dtype.kind not in "iu":
+        return refs.astype(np.int64)
+    order = np.argsort(ids, kind="stable")
+    pos = np.searchsorted(ids[order], refs)
+    pos = np.clip(pos, 0, ids.size - 1)
+    idx = order[pos]
+    if not np.array_equal(ids[idx], refs):
+        missing = refs[ids[idx] != refs][:3].tolist()
+        raise KeyError(f"Arc endpoints not in point_ids: {missing}")
+    return idx
+
+
+def _merge_arcs(
+    src: np.ndarray,
+    dst: np.ndarray,
+    weight: Optional[np.ndarray],
+    n_cells: int,
+    top_k: int,
+    cell_ids: list[str],
+    palette: Optional[Sequence[str]],
+) -> list[GlobeArc]:
+    keep = src != dst
+    src, dst = src[keep], dst[keep]
+    if weight is not None:
+        weight = weight[keep]
+    if src.size == 0:
+        return []
+
+    keys, inverse = np.unique(src * n_cells + dst, return_inverse=True)
+    totals = np.bincount(inverse.ravel(), weights=weight, minlength=keys.size)
+    if keys.size > top_k:
+        top = np.argpartition(totals, -top_k)[-top_k:]
+    else:
+        top = np.arange(keys.size)
+    top = top[np.argsort(totals[top], kind="stable")[::-1]]
+
+    colors = interpolate_palette(palette or DEFAULT_ARC_PALETTE, 8)
+    logw = np.log1p(totals[top])
+    span = logw.max() - logw.min()
+    norm = (logw - logw.min()) / span if span > 0 else np.ones_like(logw)
+    shade = np.minimum((norm * len(colors)).astype(np.int64), len(colors) - 1)
+
+    return [
+        GlobeArc(
+            source=cell_ids[k // n_cells], to=cell_ids[k % n_cells], color=colors[s]
+        )
+        for k, s in zip(keys[top].tolist(), shade.tolist())
+    ]
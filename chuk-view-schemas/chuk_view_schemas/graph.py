@@ -1,6 +1,13 @@
-from typing import List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+
+class GraphDrillDown(BaseModel):
+    """Tool call that expands a collapsed super-node into its members."""
+
+    tool: str
+    arguments: Optional[Dict[str, Any]] = None
 
 
 class GraphNode(BaseModel):
@@ -9,6 +16,11 @@ class GraphNode(BaseModel):
     color: Optional[str] = None
     size: Optional[float] = None
     group: Optional[str] = None
+    x: Optional[float] = None
+    y: Optional[float] = None
+    drill_down: Optional[GraphDrillDown] = Field(None, alias="drillDown")
+
+    model_config = {"populate_by_name": True}
 
 
 class GraphEdge(BaseModel):
@@ -26,3 +38,6 @@ class GraphContent(BaseModel):
     directed: Optional[bool] = None
     nodes: List[GraphNode]
     edges: List[GraphEdge]
+    expand_tool: Optional[str] = Field(None, alias="expandTool")
+
+    model_config = {"populate_by_name": True}
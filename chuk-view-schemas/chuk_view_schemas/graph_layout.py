@@ -0,0 +1,484 @@
+"""Server-side force-directed layout and coarsening for graph Views.
+
+The graph view runs an O(n²) force simulation on every render, which stalls
+the iframe for a few thousand nodes. ``layout_graph()`` computes positions
+in Python instead and stores them as ``GraphNode.x`` / ``y`` (fractions of
+the view's width and height).
+
+The layout is multilevel force-directed (Fruchterman-Reingold):
+
+1. The graph is coarsened repeatedly by heavy-edge matching. Each node
+   picks its heaviest neighbour, mutual picks merge, and nodes whose pick
+   merged join that pair. This continues until a few hundred nodes remain.
+2. The coarsest graph is laid out with exact pairwise repulsion.
+3. Each level is expanded back to the finer graph and refined for a few
+   iterations. Above ``_EXACT_LIMIT`` nodes, repulsion is Barnes-Hut style
+   on a uniform grid: exact within a node's cell, and cell centroids for
+   the other cells.
+
+The same matching hierarchy drives ``coarsen_graph()``, which collapses a
+large graph into at most ``max_nodes`` super-nodes. Each multi-member
+super-node carries a ``drillDown`` tool call that expands it.
+
+Results depend only on node ids, edges and parameters, so they are cached
+in a ``LayoutCache`` under ``graph_fingerprint()`` plus the parameters. A
+coarsening is stored under its ``key``, which its ``drillDown`` calls carry,
+so drill-downs always expand the clustering the view was shown.
+
+Usage:
+    cache = LayoutCache()
+
+    @graph_tool(mcp, "show_dependencies")
+    async def show_dependencies() -> GraphContent:
+        return coarsen_graph(build_graph(), max_nodes=300,
+                             tool="expand_cluster", cache=cache).content
+
+    @graph_tool(mcp, "expand_cluster")
+    async def expand_cluster(cluster: str, coarsening: str) -> GraphContent:
+        return cache.get(coarsening).expand(cluster)
+
+Requires NumPy (``pip install chuk-view-schemas[numpy]``).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import numpy as np
+
+from ._cache import LayoutCache
+from .graph import GraphContent, GraphDrillDown, GraphEdge, GraphNode
+
+# Levels at or below this many nodes use exact pairwise repulsion
+_EXACT_LIMIT = 1_500
+
+# Coarsening stops at this many nodes, or when a pass shrinks by < 10%
+_COARSEST = 200
+
+_COARSEST_ITERATIONS = 300
+
+# Refinement iterations per level: the most on small levels, tapering to
+# the minimum on the largest (where the coarse layout is already close)
+_REFINE_ITERATIONS = 30
+_MIN_REFINE_ITERATIONS = 10
+
+# Fraction of the view left empty on each side
+_MARGIN = 0.05
+
+
+def graph_fingerprint(content: GraphContent) -> str:
+    """Stable hash of the node ids and weighted edges.
+
+    Labels, colours and other display fields do not affect the layout, so
+    they are not hashed.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for node in content.nodes:
+        h.update(node.id.encode())
+        h.update(b"\x00")
+    h.update(b"\x01")
+    for edge in content.edges:
+        weight = 1.0 if edge.weight is None else edge.weight
+        h.update(f"{edge.source}\x00{edge.target}\x00{weight!r}\x00".encode())
+    return h.hexdigest()
+
+
+def force_layout(
+    n: int,
+    sources: Any,
+    targets: Any,
+    weights: Any = None,
+    *,
+    seed: int = 0,
+) -> np.ndarray:
+    """Multilevel force-directed positions for an undirected graph.
+
+    Args:
+        n: Number of nodes.
+        sources: Source node index per edge.
+        targets: Target node index per edge.
+        weights: Edge weights (attraction scales with weight); default 1.
+        seed: Seed for the initial placement and matching tie-breaks.
+
+    Returns:
+        ``(n, 2)`` array of positions (unnormalized, about one unit
+        between adjacent nodes).
+    """
+    s = np.asarray(sources, dtype=np.int64).ravel()
+    t = np.asarray(targets, dtype=np.int64).ravel()
+    w = np.ones(s.size) if weights is None else np.asarray(weights, dtype=float).ravel()
+    if not s.size == t.size == w.size:
+        raise ValueError("sources, targets and weights must have the same length")
+    if n == 0:
+        return np.zeros((0, 2))
+    s, t, w = _simplify(s, t, w)
+    rng = np.random.default_rng(seed)
+
+    levels = _hierarchy(n, s, t, w, rng, min_nodes=_COARSEST)
+    m, cs, ct, cw = levels[-1].coarse if levels else (n, s, t, w)
+    pos = rng.random((m, 2)) * math.sqrt(m)
+    pos = _fr(pos, cs, ct, cw, _COARSEST_ITERATIONS, math.sqrt(m) / 10)
+
+    for level in reversed(levels):
+        m_fine, fs, ft, fw = level.fine
+        # Spread out so the finer level keeps roughly unit edge lengths
+        pos = pos * math.sqrt(m_fine / len(pos))
+        pos = pos[level.mapping] + rng.normal(scale=0.1, size=(m_fine, 2))
+        iterations = max(
+            _MIN_REFINE_ITERATIONS, min(_REFINE_ITERATIONS, 150_000 // m_fine)
+        )
+        pos = _fr(pos, fs, ft, fw, iterations, 1.0)
+    return pos
+
+
+def layout_graph(
+    content: GraphContent,
+    *,
+    seed: int = 0,
+    cache: Optional[LayoutCache] = None,
+) -> GraphContent:
+    """Set ``x`` / ``y`` on every node, in place, and return ``content``.
+
+    Positions are fractions of the view's width and height (0-1). Edges to
+    unknown node ids and self-loops are ignored.
+    """
+    key = f"layout:{graph_fingerprint(content)}:{seed}"
+    if cache is not None and key in cache:
+        xy = cache.get(key)
+    else:
+        s, t, w = _edge_arrays(content)
+        xy = _normalize(force_layout(len(content.nodes), s, t, w, seed=seed))
+        if cache is not None:
+            cache.put(key, xy)
+    for node, (x, y) in zip(content.nodes, xy.tolist()):
+        node.x, node.y = x, y
+    return content
+
+
+@dataclass
+class GraphCoarsening:
+    """A graph collapsed into super-nodes.
+
+    ``content`` holds one node per cluster: single-member clusters keep the
+    original node, larger ones become ``cluster:<n>`` super-nodes.
+    ``members`` maps every node id in ``content`` to the original node ids
+    it stands for. Coarse edges are undirected and sum the weights of the
+    edges between two clusters. ``key`` identifies this coarsening (graph
+    fingerprint and parameters) in a ``LayoutCache``.
+    """
+
+    key: str
+    fingerprint: str
+    source: GraphContent
+    content: GraphContent
+    members: dict[str, list[str]]
+    seed: int = 0
+
+    def expand(self, cluster_id: str, *, layout: bool = True) -> GraphContent:
+        """The subgraph induced by one cluster's members.
+
+        Raises:
+            KeyError: If ``cluster_id`` is not a node of ``content``.
+        """
+        ids = set(self.members[cluster_id])
+        sub = GraphContent(
+            title=self.source.title,
+            directed=self.source.directed,
+            nodes=[n.model_copy() for n in self.source.nodes if n.id in ids],
+            edges=[e for e in self.source.edges if e.source in ids and e.target in ids],
+        )
+        return layout_graph(sub, seed=self.seed) if layout else sub
+
+
+def coarsen_graph(
+    content: GraphContent,
+    *,
+    max_nodes: int = 300,
+    tool: Optional[str] = None,
+    layout: bool = True,
+    seed: int = 0,
+    cache: Optional[LayoutCache] = None,
+) -> GraphCoarsening:
+    """Collapse ``content`` into at most about ``max_nodes`` super-nodes.
+
+    Args:
+        content: Graph to coarsen.
+        max_nodes: Target node count. Coarsening stops early if matching
+            no longer shrinks the graph (e.g. mostly disconnected nodes).
+        tool: Tool for super-node ``drillDown`` calls, made with
+            ``{"cluster": <id>, "coarsening": <key>}``.
+        layout: Also lay out the coarse graph (``x`` / ``y``).
+        seed: Seed for matching tie-breaks and the layout.
+        cache: Stores the ``GraphCoarsening`` under its ``key``, so a
+            drill-down tool can ``cache.get(coarsening).expand(cluster)``.
+    """
+    fingerprint = graph_fingerprint(content)
+    key = f"coarsen:{fingerprint}:{max_nodes}:{tool}:{layout}:{seed}"
+    if cache is not None and key in cache:
+        return cache.get(key)
+
+    n = len(content.nodes)
+    s, t, w = _edge_arrays(content)
+    s, t, w = _simplify(s, t, w)
+    levels = _hierarchy(
+        n, s, t, w, np.random.default_rng(seed), min_nodes=max(max_nodes, 1)
+    )
+    mapping = np.arange(n)
+    for level in levels:
+        mapping = level.mapping[mapping]
+    m, cs, ct, cw = levels[-1].coarse if levels else (n, s, t, w)
+
+    strength = np.bincount(s, weights=w, minlength=n) + np.bincount(
+        t, weights=w, minlength=n
+    )
+    order = np.lexsort((-strength, mapping))
+    starts = np.flatnonzero(np.diff(mapping[order], prepend=-1))
+    groups = np.split(order, starts[1:])
+
+    nodes: list[GraphNode] = []
+    members: dict[str, list[str]] = {}
+    for cluster, idx in enumerate(groups):
+        member_nodes = [content.nodes[i] for i in idx.tolist()]
+        if len(member_nodes) == 1:
+            node = member_nodes[0].model_copy()
+        else:
+            node = _super_node(f"cluster:{cluster}", member_nodes)
+            if tool is not None:
+                node.drill_down = GraphDrillDown(
+                    tool=tool,
+                    arguments={"cluster": node.id, "coarsening": key},
+                )
+        nodes.append(node)
+        members[node.id] = [member.id for member in member_nodes]
+
+    edges = [
+        GraphEdge(source=nodes[a].id, target=nodes[b].id, weight=weight)
+        for a, b, weight in zip(cs.tolist(), ct.tolist(), cw.tolist())
+    ]
+    coarse = GraphContent(title=content.title, nodes=nodes, edges=edges)
+    if layout:
+        xy = _normalize(force_layout(m, cs, ct, cw, seed=seed))
+        for node, (x, y) in zip(nodes, xy.tolist()):
+            node.x, node.y = x, y
+
+    result = GraphCoarsening(key, fingerprint, content, coarse, members, seed)
+    if cache is not None:
+        cache.put(key, result)
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Internals
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _Level:
+    """One coarsening pass: fine graph, fine -> coarse map, coarse graph."""
+
+    fine: tuple[int, np.ndarray, np.ndarray, np.ndarray]
+    mapping: np.ndarray
+    coarse: tuple[int, np.ndarray, np.ndarray, np.ndarray]
+
+
+def _edge_arrays(content: GraphContent) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    index = {node.id: i for i, node in enumerate(content.nodes)}
+    s, t, w = [], [], []
+    for edge in content.edges:
+        a, b = index.get(edge.source), index.get(edge.target)
+        if a is None or b is None:
+            continue
+        s.append(a)
+        t.append(b)
+        w.append(1.0 if edge.weight is None else edge.weight)
+    return (
+        np.array(s, dtype=np.int64),
+        np.array(t, dtype=np.int64),
+        np.array(w, dtype=float),
+    )
+
+
+def _simplify(
+    s: np.ndarray, t: np.ndarray, w: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Drop self-loops and merge parallel edges (either direction), summing weights."""
+    keep = s != t
+    a, b = np.minimum(s[keep], t[keep]), np.maximum(s[keep], t[keep])
+    if a.size == 0:
+        return a, b, w[keep]
+    n = int(b.max()) + 1
+    pairs, inverse = np.unique(a * n + b, return_inverse=True)
+    weights = np.bincount(inverse.ravel(), weights=np.abs(w[keep]))
+    return pairs // n, pairs % n, weights
+
+
+def _hierarchy(
+    n: int,
+    s: np.ndarray,
+    t: np.ndarray,
+    w: np.ndarray,
+    rng: np.random.Generator,
+    *,
+    min_nodes: int,
+) -> list[_Level]:
+    levels: list[_Level] = []
+    m = n
+    while m > min_nodes:
+        mapping = _match(m, s, t, w, rng)
+        c = int(mapping.max()) + 1
+        if c > 0.9 * m:
+            break
+        cs, ct, cw = _simplify(mapping[s], mapping[t], w)
+        levels.append(_Level((m, s, t, w), mapping, (c, cs, ct, cw)))
+        m, s, t, w = c, cs, ct, cw
+    return levels
+
+
+def _match(
+    n: int, s: np.ndarray, t: np.ndarray, w: np.ndarray, rng: np.random.Generator
+) -> np.ndarray:
+    """Heavy-edge grouping: fine node index -> coarse node index."""
+    # Random tie-break shared by both directions, so edge order is strict
+    # and the only cycles among preferences are mutual pairs
+    tie = rng.random(s.size)
+    a = np.concatenate((s, t))
+    b = np.concatenate((t, s))
+    order = np.lexsort((np.tile(-tie, 2), np.tile(-w, 2), a))
+    first = np.flatnonzero(np.diff(a[order], prepend=-1))
+    pref = np.full(n, -1)
+    pref[a[order][first]] = b[order][first]
+
+    idx = np.arange(n)
+    has = pref >= 0
+    mutual = np.zeros(n, dtype=bool)
+    mutual[has] = pref[pref[has]] == idx[has]
+    root = idx.copy()
+    root[mutual] = np.minimum(idx[mutual], pref[mutual])
+    # Nodes whose preferred neighbour is in a pair join that pair
+    joins = has & ~mutual
+    joins[joins] = mutual[pref[joins]]
+    root[joins] = root[pref[joins]]
+    # Isolated nodes are paired up so disconnected graphs still shrink
+    isolated = np.flatnonzero(~has)
+    root[isolated[1::2]] = isolated[0 : isolated.size - isolated.size % 2 : 2]
+
+    _, mapping = np.unique(root, return_inverse=True)
+    return mapping.ravel()
+
+
+def _fr(
+    pos: np.ndarray,
+    s: np.ndarray,
+    t: np.ndarray,
+    w: np.ndarray,
+    iterations: int,
+    step: float,
+) -> np.ndarray:
+    """Fruchterman-Reingold with unit ideal length and geometric cooling."""
+    n = len(pos)
+    if n < 2:
+        return np.zeros((n, 2))
+    # Step shrinks to 1% of its start over the run
+    cool = 0.01 ** (1 / max(iterations, 1))
+    for _ in range(iterations):
+        disp = _repulsion(pos)
+        d = pos[s] - pos[t]
+        # Attraction d² per unit length, along the edge
+        f = d * (np.sqrt((d * d).sum(axis=1)) * w)[:, None]
+        for axis in (0, 1):
+            disp[:, axis] -= np.bincount(s, weights=f[:, axis], minlength=n)
+            disp[:, axis] += np.bincount(t, weights=f[:, axis], minlength=n)
+        length = np.sqrt((disp * disp).sum(axis=1))
+        scale = np.minimum(length, step) / np.maximum(length, 1e-12)
+        pos = pos + disp * scale[:, None]
+        step *= cool
+    return pos
+
+
+def _repulsion(pos: np.ndarray) -> np.ndarray:
+    """Repulsive displacement 1/d from every other node."""
+    n = len(pos)
+    if n <= _EXACT_LIMIT:
+        return _pairwise(pos)
+
+    # Balanced cells: g strips of equal count by x, each cut into g cells
+    # of equal count by y, so clustered layouts don't crowd a few cells
+    g = max(2, round(n**0.25))
+    strip = np.empty(n, dtype=np.int64)
+    strip[np.argsort(pos[:, 0], kind="stable")] = np.arange(n) * g // n
+    order = np.lexsort((pos[:, 1], strip))
+    strip_sorted = strip[order]
+    starts = np.searchsorted(strip_sorted, np.arange(g))
+    sizes = np.diff(np.append(starts, n))
+    rank = np.arange(n) - starts[strip_sorted]
+    cell_sorted = strip_sorted * g + rank * g // sizes[strip_sorted]
+    cell = np.empty(n, dtype=np.int64)
+    cell[order] = cell_sorted
+
+    # Far field: every other cell acts as a point mass at its centroid
+    mass = np.bincount(cell, minlength=g * g).astype(float)
+    centroid = (
+        np.column_stack(
+            [np.bincount(cell, weights=pos[:, k], minlength=g * g) for k in (0, 1)]
+        )
+        / np.maximum(mass, 1)[:, None]
+    )
+    disp = np.empty_like(pos)
+    chunk = max(1, 4_000_000 // (g * g))
+    for i in range(0, n, chunk):
+        p = pos[i : i + chunk]
+        f = mass[None, :] / _sq_dist(p, centroid)
+        f[np.arange(len(p)), cell[i : i + chunk]] = 0.0
+        disp[i : i + chunk] = p * f.sum(axis=1)[:, None] - f @ centroid
+
+    # Near field: exact within each cell
+    bounds = np.flatnonzero(np.diff(cell_sorted, prepend=-1, append=g * g))
+    for lo, hi in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+        if hi - lo > 1:
+            members = order[lo:hi]
+            disp[members] += _pairwise(pos[members])
+    return disp
+
+
+def _pairwise(pos: np.ndarray) -> np.ndarray:
+    # sum_j (p_i - p_j) / d_ij² == p_i * sum_j f_ij - (f @ p)_i
+    pos = pos - pos.mean(axis=0)
+    out = np.empty_like(pos)
+    chunk = max(1, 4_000_000 // len(pos))
+    for i in range(0, len(pos), chunk):
+        p = pos[i : i + chunk]
+        f = 1.0 / _sq_dist(p, pos)
+        rows = np.arange(len(p))
+        f[rows, rows + i] = 0.0
+        out[i : i + chunk] = p * f.sum(axis=1)[:, None] - f @ pos
+    return out
+
+
+def _sq_dist(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Pairwise squared distances via one matrix product, floored at 1e-9."""
+    d2 = (a * a).sum(axis=1)[:, None] + (b * b).sum(axis=1)[None, :] - 2.0 * (a @ b.T)
+    return np.maximum(d2, 1e-9)
+
+
+def _normalize(pos: np.ndarray) -> np.ndarray:
+    """Centre in the unit square with equal x/y scale and a margin."""
+    if len(pos) == 0:
+        return pos
+    lo, hi = pos.min(axis=0), pos.max(axis=0)
+    span = float((hi - lo).max()) or 1.0
+    return 0.5 + (pos - (lo + hi) / 2) / span * (1 - 2 * _MARGIN)
+
+
+def _super_node(node_id: str, members: list[GraphNode]) -> GraphNode:
+    """Super-node labelled after its best-connected member."""
+    groups = Counter(m.group for m in members if m.group is not None)
+    return GraphNode(
+        id=node_id,
+        label=f"{members[0].label} +{len(members) - 1}",
+        group=groups.most_common(1)[0][0] if groups else None,
+        size=min(8.0 * len(members) ** 0.25, 40.0),
+    )
@@ -0,0 +1,284 @@
+"""Incremental neighbourhood expansion for graph and investigation Views.
+
+A ``GraphStore`` holds the full graph on the server, indexed by node for
+adjacency lookups, and sends it to the view a piece at a time. For each
+session it tracks which nodes and edges the client already has:
+
+- ``snapshot()`` returns the first content: the seed nodes and their
+  ``hops`` neighbourhood, with ``expandTool`` set
+- ``expand()`` returns a ``ui_patch`` that appends only the nodes within
+  ``hops`` of a node that the client lacks, plus every edge among the
+  nodes it will then hold that it has not been sent yet
+
+Expand tool contract: when the user expands a node, the view calls
+``expandTool`` with ``{"nodeId": <id>, "hops": <int>}`` and applies the
+returned patch. The patch holds ``update-panel`` append ops on ``nodes`` /
+``edges`` (``evidence`` / ``connections`` for investigations).
+
+Usage:
+    store = GraphStore.from_content(full_graph, expand_tool="expand_node")
+
+    @graph_tool(mcp, "show_graph")
+    async def show_graph(ctx: Context) -> GraphContent:
+        return store.snapshot(["root"], session=ctx.session_id)
+
+    @mcp.tool()
+    async def expand_node(nodeId: str, ctx: Context, hops: int = 1) -> dict:
+        patch = store.expand(nodeId, session=ctx.session_id,
+                             panel_id="graph", hops=hops)
+        return patch.model_dump(by_alias=True, exclude_none=True) if patch else {}
+
+Pure Python — no external dependencies.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Iterable, Literal, Optional, Union
+
+from pydantic import BaseModel
+
+from .graph import GraphContent, GraphEdge, GraphNode
+from .investigation import Connection, Evidence, InvestigationContent
+from .patch import UIPatch, UpdatePanelOp
+
+GraphKind = Literal["graph", "investigation"]
+
+# (node list field, edge list field) per content type
+_FIELDS = {"graph": ("nodes", "edges"), "investigation": ("evidence", "connections")}
+
+
+@dataclass
+class _Sent:
+    nodes: set[str] = field(default_factory=set)
+    edges: set[int] = field(default_factory=set)
+
+
+class GraphStore:
+    """Adjacency-indexed graph with per-session delivery tracking.
+
+    Sessions are kept in least-recently-used order; beyond
+    ``max_sessions`` the oldest is forgotten (its next ``expand()`` then
+    re-sends what it needs). ``directed`` (graphs) and ``notes``
+    (investigations) are passed through to ``snapshot()``.
+    """
+
+    def __init__(
+        self,
+        kind: GraphKind = "graph",
+        *,
+        expand_tool: Optional[str] = None,
+        title: Optional[str] = None,
+        directed: Optional[bool] = None,
+        notes: Optional[str] = None,
+        max_sessions: int = 1024,
+    ) -> None:
+        if kind not in _FIELDS:
+            raise ValueError(f"Unknown graph kind: {kind!r}")
+        self.kind = kind
+        self.expand_tool = expand_tool
+        self.title = title
+        self.directed = directed
+        self.notes = notes
+        self.max_sessions = max_sessions
+        self._nodes: dict[str, Union[GraphNode, Evidence]] = {}
+        self._edges: list[Union[GraphEdge, Connection]] = []
+        self._adjacency: dict[str, list[int]] = {}
+        self._sessions: OrderedDict[str, _Sent] = OrderedDict()
+
+    @classmethod
+    def from_content(
+        cls,
+        content: Union[GraphContent, InvestigationContent],
+        *,
+        expand_tool: Optional[str] = None,
+        max_sessions: int = 1024,
+    ) -> GraphStore:
+        if isinstance(content, GraphContent):
+            store = cls(
+                "graph",
+                expand_tool=expand_tool,
+                title=content.title,
+                directed=content.directed,
+                max_sessions=max_sessions,
+            )
+            nodes, edges = content.nodes, content.edges
+        else:
+            store = cls(
+                "investigation",
+                expand_tool=expand_tool,
+                title=content.title,
+                notes=content.notes,
+                max_sessions=max_sessions,
+            )
+            nodes, edges = content.evidence, content.connections
+        for node in nodes:
+            store.add_node(node)
+        for edge in edges:
+            store.add_edge(edge)
+        return store
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self._nodes
+
+    def add_node(self, node: Union[GraphNode, Evidence]) -> None:
+        """Add or replace a node (``GraphNode`` or ``Evidence``)."""
+        self._nodes[node.id] = node
+        self._adjacency.setdefault(node.id, [])
+
+    def add_edge(self, edge: Union[GraphEdge, Connection]) -> None:
+        """Add an edge (``GraphEdge`` or ``Connection``) between known nodes.
+
+        Raises:
+            KeyError: If either endpoint has not been added.
+        """
+        a, b = _endpoints(edge)
+        if a not in self._nodes or b not in self._nodes:
+            missing = a if a not in self._nodes else b
+            raise KeyError(f"Unknown node: {missing!r}")
+        index = len(self._edges)
+        self._edges.append(edge)
+        self._adjacency[a].append(index)
+        if b != a:
+            self._adjacency[b].append(index)
+
+    def neighbours(self, node_id: str) -> list[str]:
+        """Distinct neighbours of ``node_id``, in edge order."""
+        seen: dict[str, None] = {}
+        for index in self._adjacency[node_id]:
+            a, b = _endpoints(self._edges[index])
+            seen.setdefault(b if a == node_id else a)
+        seen.pop(node_id, None)
+        return list(seen)
+
+    def snapshot(
+        self,
+        seeds: Iterable[str],
+        *,
+        session: str,
+        hops: int = 1,
+        max_nodes: Optional[int] = None,
+    ) -> Union[GraphContent, InvestigationContent]:
+        """Initial content for a session: ``seeds`` and their neighbourhood.
+
+        Resets what the session is recorded as holding.
+
+        Raises:
+            KeyError: If a seed is unknown.
+        """
+        self._sessions.pop(session, None)
+        sent = self._session(session)
+        nodes, edges = self._collect(list(seeds), sent, hops, max_nodes)
+        node_field, edge_field = _FIELDS[self.kind]
+        payload = {
+            "title": self.title,
+            node_field: nodes,
+            edge_field: edges,
+            "expand_tool": self.expand_tool,
+        }
+        if self.kind == "graph":
+            return GraphContent(**payload, directed=self.directed)
+        return InvestigationContent(**payload, notes=self.notes)
+
+    def expand(
+        self,
+        node_id: str,
+        *,
+        session: str,
+        panel_id: str,
+        hops: int = 1,
+        max_nodes: Optional[int] = None,
+    ) -> Optional[UIPatch]:
+        """Patch adding what the session lacks within ``hops`` of ``node_id``.
+
+        ``max_nodes`` caps the new nodes (nearest first). Returns ``None``
+        when the client already has everything.
+
+        Raises:
+            KeyError: If ``node_id`` is unknown.
+        """
+        nodes, edges = self._collect([node_id], self._session(session), hops, max_nodes)
+        node_field, edge_field = _FIELDS[self.kind]
+        ops = [
+            UpdatePanelOp(
+                panel_id=panel_id,
+                action="append",
+                target_field=name,
+                data={name: [_dump(item) for item in items]},
+            )
+            for name, items in ((node_field, nodes), (edge_field, edges))
+            if items
+        ]
+        return UIPatch(ops=ops) if ops else None
+
+    def forget(self, session: str) -> None:
+        """Drop a session's delivery record."""
+        self._sessions.pop(session, None)
+
+    def _session(self, session: str) -> _Sent:
+        sent = self._sessions.get(session)
+        if sent is None:
+            sent = self._sessions[session] = _Sent()
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        self._sessions.move_to_end(session)
+        return sent
+
+    def _collect(
+        self,
+        seeds: list[str],
+        sent: _Sent,
+        hops: int,
+        max_nodes: Optional[int],
+    ) -> tuple[list, list]:
+        """New nodes near ``seeds`` and new edges among held nodes; marks both sent."""
+        for seed in seeds:
+            if seed not in self._nodes:
+                raise KeyError(f"Unknown node: {seed!r}")
+        new: list[str] = []
+        seen = set(seeds)
+        queue = deque((seed, 0) for seed in seeds)
+        while queue:
+            node_id, depth = queue.popleft()
+            if node_id not in sent.nodes:
+                if max_nodes is not None and len(new) >= max_nodes:
+                    break
+                new.append(node_id)
+                sent.nodes.add(node_id)
+            if depth == hops:
+                continue
+            for neighbour in self.neighbours(node_id):
+                if neighbour not in seen:
+                    seen.add(neighbour)
+                    queue.append((neighbour, depth + 1))
+
+        edges = []
+        for node_id in new:
+            for index in self._adjacency[node_id]:
+                if index in sent.edges:
+                    continue
+                a, b = _endpoints(self._edges[index])
+                if a in sent.nodes and b in sent.nodes:
+                    sent.edges.add(index)
+                    edges.append(index)
+        edges.sort()
+        return [self._nodes[n] for n in new], [self._edges[i] for i in edges]
+
+
+# ---------------------------------------------------------------------------
+# Internals
+# ---------------------------------------------------------------------------
+
+
+def _endpoints(edge: Union[GraphEdge, Connection]) -> tuple[str, str]:
+    if isinstance(edge, Connection):
+        return edge.source, edge.to
+    return edge.source, edge.target
+
+
+def _dump(item: BaseModel) -> dict:
+    return item.model_dump(by_alias=True, exclude_none=True)
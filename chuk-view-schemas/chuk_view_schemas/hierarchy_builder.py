@@ -0,0 +1,211 @@
+"""Build treemap / sunburst trees from flat path records.
+
+Wide hierarchies (file systems, cost centres) are easiest to produce as
+``(path, value)`` records. ``Hierarchy`` indexes them into a tree in one
+pass, rolling values up to every ancestor as it goes. When emitting it can:
+
+- keep only the ``top_n`` largest children per node, collapsing the rest
+  into a single "Other" leaf with their combined value
+- cap depth, turning nodes at ``max_depth`` into leaves carrying their
+  subtree total
+
+Every emitted node's ``value`` is its rolled-up total. The views size a
+parent by summing its children, so a value recorded directly on an interior
+path is emitted as a "(self)" leaf child.
+
+Node ids are the parent id plus ``/`` and the escaped label (``~`` as
+``~0``, ``/`` as ``~1``), so labels containing ``/`` cannot collide. The
+synthetic children use ``~self`` and ``~other``, which no escaped label
+produces.
+
+``to_dict()`` is iterative, so its depth is not limited by Python's
+recursion limit. ``treemap()`` / ``sunburst()`` validate through pydantic,
+which recurses, so they raise ``ValueError`` for trees deeper than
+``MAX_CONTENT_DEPTH``; pass ``max_depth`` to cut deeper trees.
+
+Usage:
+    tree = Hierarchy(root_label="/")
+    for path, size in walk_files():
+        tree.add(path.split("/"), size)
+    content = tree.treemap(top_n=20, max_depth=4, title="Disk usage")
+
+Pure Python — no external dependencies.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, Optional, Sequence
+
+from .sunburst import SunburstContent
+from .treemap import TreemapContent
+
+OTHER_LABEL = "Other"
+SELF_LABEL = "(self)"
+MAX_CONTENT_DEPTH = 200
+
+
+class _Node:
+    __slots__ = ("children", "own", "total")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Node] = {}
+        self.own = 0.0
+        self.total = 0.0
+
+
+class Hierarchy:
+    """Mutable path-indexed tree with rolled-up values."""
+
+    def __init__(self, *, root_label: str = "All", root_id: str = "root") -> None:
+        self.root_label = root_label
+        self.root_id = root_id
+        self._root = _Node()
+
+    @property
+    def total(self) -> float:
+        return self._root.total
+
+    def add(self, path: Sequence[str], value: float = 1.0) -> None:
+        """Add ``value`` at ``path`` (a sequence of labels below the root)."""
+        node = self._root
+        node.total += value
+        for part in path:
+            child = node.children.get(part)
+            if child is None:
+                child = node.children[part] = _Node()
+            child.total += value
+            node = child
+        node.own += value
+
+    def extend(self, records: Iterable[tuple[Sequence[str], float]]) -> Hierarchy:
+        for path, value in records:
+            self.add(path, value)
+        return self
+
+    def to_dict(
+        self,
+        *,
+        top_n: Optional[int] = None,
+        max_depth: Optional[int] = None,
+        other_label: str = OTHER_LABEL,
+        self_label: str = SELF_LABEL,
+    ) -> dict[str, Any]:
+        """The tree as nested node dicts (``id``/``label``/``value``/``children``).
+
+        Args:
+            top_n: Children kept per node, largest first; the rest merge
+                into an "Other" leaf.
+            max_depth: Deepest level emitted (the root is depth 0).
+            other_label: Label for merged small children.
+            self_label: Label for a node's own value when it also has
+                children.
+        """
+        return self._emit(top_n, max_depth, other_label, self_label)[0]
+
+    def treemap(self, *, title: Optional[str] = None, **kwargs: Any) -> TreemapContent:
+        """``TreemapContent``; keyword arguments as for ``to_dict``.
+
+        Raises:
+            ValueError: If the emitted tree is deeper than ``MAX_CONTENT_DEPTH``.
+        """
+        return TreemapContent.model_validate(
+            {"title": title, "root": self._content_root(**kwargs)}
+        )
+
+    def sunburst(
+        self, *, title: Optional[str] = None, **kwargs: Any
+    ) -> SunburstContent:
+        """``SunburstContent``; keyword arguments as for ``to_dict``.
+
+        Raises:
+            ValueError: If the emitted tree is deeper than ``MAX_CONTENT_DEPTH``.
+        """
+        return SunburstContent.model_validate(
+            {"title": title, "root": self._content_root(**kwargs)}
+        )
+
+    def _content_root(
+        self,
+        *,
+        top_n: Optional[int] = None,
+        max_depth: Optional[int] = None,
+        other_label: str = OTHER_LABEL,
+        self_label: str = SELF_LABEL,
+    ) -> dict[str, Any]:
+        root, depth = self._emit(top_n, max_depth, other_label, self_label)
+        if depth > MAX_CONTENT_DEPTH:
+            raise ValueError(
+                f"Tree is {depth} levels deep; treemap and sunburst content "
+                f"supports at most {MAX_CONTENT_DEPTH} (pass max_depth)"
+            )
+        return root
+
+    def _emit(
+        self,
+        top_n: Optional[int],
+        max_depth: Optional[int],
+        other_label: str,
+        self_label: str,
+    ) -> tuple[dict[str, Any], int]:
+        """Nested node dicts and the depth of the deepest emitted node."""
+        root = {"id": self.root_id, "label": self.root_label, "value": self._root.total}
+        deepest = 0
+        stack = [(self._root, root, 0)]
+        while stack:
+            node, out, depth = stack.pop()
+            if not node.children or (max_depth is not None and depth >= max_depth):
+                continue
+            ranked = sorted(
+                node.children.items(), key=lambda kv: kv[1].total, reverse=True
+            )
+            if top_n is not None and len(ranked) > top_n:
+                kept, rest = ranked[:top_n], ranked[top_n:]
+            else:
+                kept, rest = ranked, []
+
+            deepest = max(deepest, depth + 1)
+            children = []
+            for label, child in kept:
+                item = {
+                    "id": f"{out['id']}/{_escape(label)}",
+                    "label": label,
+                    "value": child.total,
+                }
+                children.append(item)
+                stack.append((child, item, depth + 1))
+            if node.own:
+                children.append(
+                    {
+                        "id": f"{out['id']}/~self",
+                        "label": self_label,
+                        "value": node.own,
+                    }
+                )
+            if rest:
+                children.append(
+                    {
+                        "id": f"{out['id']}/~other",
+                        "label": f"{other_label} ({len(rest)})",
+                        "value": sum(child.total for _, child in rest),
+                    }
+                )
+            out["children"] = children
+        return root, deepest
+
+
+def build_hierarchy(
+    records: Iterable[tuple[Sequence[str], float]],
+    *,
+    root_label: str = "All",
+) -> Hierarchy:
+    """``Hierarchy`` from ``(path, value)`` records."""
+    return Hierarchy(root_label=root_label).extend(records)
+
+
+# ---------------------------------------------------------------------------
+# Internals
+# ---------------------------------------------------------------------------
+
+
+def _escape(label: str) -> str:
+    return label.replace("~", "~0").replace("/", "~1")
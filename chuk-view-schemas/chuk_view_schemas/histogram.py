@@ -0,0 +1,218 @@
+"""Vectorized histograms that render as bar ``ChartContent``.
+
+``histogram()`` picks bin edges (Freedman-Diaconis, Sturges or fixed) and
+counts an in-memory array. For data streamed in chunks, fix the edges once
+(from a sample, or with an explicit ``value_range``) and feed the chunks to
+``Histogram.update``. Histograms over the same edges merge, so chunks can be
+counted in parallel. Every value goes in the bin whose edges bracket it;
+uniform bins compute the index arithmetically and correct it against the
+edges, custom edges use ``searchsorted``.
+
+Usage:
+    hist = Histogram(histogram_edges(sample, rule="fd", value_range=(0, 500)))
+    for chunk in read_chunks():
+        hist.update(chunk)
+    content = hist.to_chart(title="Response size", x_label="KB")
+
+Requires NumPy (``pip install chuk-view-schemas[numpy]``).
+"""
+
+from __future__ import annotations
+
+from itertools import pairwise
+from typing import Any, Literal, Optional
+
+import numpy as np
+
+from .chart import AxisConfig, ChartContent, ChartDataset, LabeledValue
+
+BinRule = Literal["fd", "sturges", "fixed"]
+
+
+def histogram_edges(
+    values: Any,
+    *,
+    rule: BinRule = "fd",
+    bins: Optional[int] = None,
+    width: Optional[float] = None,
+    value_range: Optional[tuple[float, float]] = None,
+    nice: bool = True,
+    max_bins: int = 200,
+) -> np.ndarray:
+    """Choose bin edges for ``values``.
+
+    Args:
+        values: Data (or a representative sample) used to size the bins.
+        rule: ``"fd"`` (Freedman-Diaconis, robust to outliers),
+            ``"sturges"`` (log2 of the count) or ``"fixed"`` (``bins`` or
+            ``width`` required).
+        bins: Bin count for ``"fixed"``.
+        width: Bin width for ``"fixed"``.
+        value_range: ``(lo, hi)`` to cover; defaults to the data min/max.
+        nice: Round a derived width to 1, 2, 2.5 or 5 x 10^k and align the
+            first edge to a multiple of it, for readable labels. An explicit
+            ``width`` is only aligned; explicit ``bins`` are kept as given.
+        max_bins: Upper bound on the number of bins.
+
+    Returns:
+        Increasing edge array (``n_bins + 1`` values).
+    """
+    v = np.asarray(values, dtype=float).ravel()
+    v = v[np.isfinite(v)]
+    if value_range is not None:
+        lo, hi = map(float, value_range)
+    elif v.size:
+        lo, hi = float(v.min()), float(v.max())
+    else:
+        raise ValueError("No finite values and no value_range")
+    if hi <= lo:
+        hi = lo + 1.0
+
+    if rule == "fixed":
+        if width is None and bins is None:
+            raise ValueError('rule="fixed" needs bins= or width=')
+        step = width if width is not None else (hi - lo) / bins  # type: ignore[operator]
+    elif rule == "fd":
+        q1, q3 = np.quantile(v, [0.25, 0.75]) if v.size else (lo, hi)
+        step = 2 * (q3 - q1) / max(v.size, 1) ** (1 / 3)
+        if step <= 0:
+            step = (hi - lo) / _sturges(v.size)
+    elif rule == "sturges":
+        step = (hi - lo) / _sturges(v.size)
+    else:
+        raise ValueError(f"Unknown bin rule: {rule!r}")
+
+    step = max(step, (hi - lo) / max_bins)
+    if nice and rule != "fixed":
+        step = _nice_step(step)
+    if nice and (rule != "fixed" or width is not None):
+        lo = np.floor(lo / step) * step
+    n = max(1, int(np.ceil((hi - lo) / step - 1e-9)))
+    return lo + np.arange(n + 1) * step
+
+
+class Histogram:
+    """Counts over fixed bin edges; chunk-updatable and mergeable.
+
+    Values outside the edges are tallied in ``underflow`` / ``overflow``
+    rather than dropped silently. The last bin includes its right edge.
+    """
+
+    def __init__(self, edges: Any) -> None:
+        self.edges = np.asarray(edges, dtype=float)
+        if self.edges.ndim != 1 or self.edges.size < 2:
+            raise ValueError("edges needs at least two values")
+        if np.any(np.diff(self.edges) <= 0):
+            raise ValueError("edges must be strictly increasing")
+        self.counts = np.zeros(self.edges.size - 1, dtype=np.int64)
+        self.underflow = 0
+        self.overflow = 0
+        widths = np.diff(self.edges)
+        self._uniform = bool(np.allclose(widths, widths[0]))
+
+    @property
+    def total(self) -> int:
+        return int(self.counts.sum())
+
+    def update(self, values: Any) -> Histogram:
+        v = np.asarray(values, dtype=float).ravel()
+        v = v[np.isfinite(v)]
+        lo, hi = self.edges[0], self.edges[-1]
+        below = v < lo
+        above = v > hi
+        self.underflow += int(below.sum())
+        self.overflow += int(above.sum())
+        v = v[~(below | above)]
+        n_bins = self.counts.size
+        if self._uniform:
+            # Rounding can land a value next to an edge one bin off
+            idx = ((v - lo) * (n_bins / (hi - lo))).astype(np.int64)
+            np.clip(idx, 0, n_bins - 1, out=idx)
+            idx -= v < self.edges[idx]
+            idx += (v >= self.edges[idx + 1]) & (idx < n_bins - 1)
+        else:
+            idx = np.searchsorted(self.edges, v, side="right") - 1
+            np.minimum(idx, n_bins - 1, out=idx)
+        self.counts += np.bincount(idx, minlength=n_bins)
+        return self
+
+    def merge(self, other: Histogram) -> Histogram:
+        if not np.array_equal(self.edges, other.edges):
+            raise ValueError("Histograms must share bin edges to merge")
+        self.counts += other.counts
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+        return self
+
+    def labels(self, fmt: str = "{:g}") -> list[str]:
+        e = self.edges.tolist()
+        return [f"{fmt.format(a)}–{fmt.format(b)}" for a, b in pairwise(e)]
+
+    def to_chart(
+        self,
+        *,
+        title: Optional[str] = None,
+        label: str = "Count",
+        color: Optional[str] = None,
+        x_label: Optional[str] = None,
+        y_label: Optional[str] = None,
+        density: bool = False,
+        fmt: str = "{:g}",
+    ) -> ChartContent:
+        """Bar chart with one ``LabeledValue`` per bin.
+
+        ``density=True`` plots counts / (total x bin width) instead of counts.
+        """
+        values = self.counts.astype(float)
+        if density and self.total:
+            values = values / (self.total * np.diff(self.edges))
+        return ChartContent(
+            title=title,
+            chart_type="bar",
+            data=[
+                ChartDataset(
+                    label=label,
+                    color=color,
+                    values=[
+                        LabeledValue(label=bin_label, value=value)
+                        for bin_label, value in zip(self.labels(fmt), values.tolist())
+                    ],
+                )
+            ],
+            x_axis=AxisConfig(label=x_label) if x_label else None,
+            y_axis=AxisConfig(label=y_label) if y_label else None,
+        )
+
+
+def histogram(
+    values: Any,
+    *,
+    rule: BinRule = "fd",
+    bins: Optional[int] = None,
+    width: Optional[float] = None,
+    value_range: Optional[tuple[float, float]] = None,
+    nice: bool = True,
+) -> Histogram:
+    """Choose edges with ``histogram_edges`` and count ``values``."""
+    edges = histogram_edges(
+        values, rule=rule, bins=bins, width=width, value_range=value_range, nice=nice
+    )
+    return Histogram(edges).update(values)
+
+
+# ---------------------------------------------------------------------------
+# Internals
+# ---------------------------------------------------------------------------
+
+
+def _sturges(n: int) -> int:
+    return int(np.ceil(np.log2(max(n, 1)))) + 1
+
+
+def _nice_step(step: float) -> float:
+    exp = np.floor(np.log10(step))
+    base = 10.0**exp
+    for m in (1.0, 2.0, 2.5, 5.0, 10.0):
+        if step <= m * base * (1 + 1e-9):
+            return float(m * base)
+    return float(10 * base)
@@ -27,3 +27,6 @@ class InvestigationContent(BaseModel):
     notes: Optional[str] = None
     evidence: List[Evidence]
     connections: List[Connection]
+    expand_tool: Optional[str] = Field(None, alias="expandTool")
+
+    model_config = {"populate_by_name": True}
@@ -0,0 +1,169 @@
+"""Lazy layer loading for map and layers Views.
+
+Hidden layers are sent as metadata plus a ``LayerSource`` fetch reference
+instead of their full GeoJSON. The features live in a server-side
+``LayerStore`` and are served from memory when the view toggles the
+layer on.
+
+Usage:
+    store = LayerStore()
+
+    @layers_tool(mcp, "show_city")
+    async def show_city() -> LayersContent:
+        content = LayersContent(layers=[roads, parcels_hidden, ...])
+        return defer_hidden_layers(content, store, tool="load_layer")
+
+    @mcp.tool()
+    async def load_layer(layerId: str) -> dict:
+        return store.get(layerId)
+
+Pure Python — no external dependencies.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, TypeVar
+
+from pydantic import BaseModel
+
+from .map import LayerSource
+
+C = TypeVar("C", bound=BaseModel)
+
+
+@dataclass
+class _Entry:
+    payload: Optional[dict[str, Any]]
+    nbytes: int
+    loader: Optional[Callable[[], Any]] = None
+
+
+def _encode(layer: Any) -> dict[str, Any]:
+    if isinstance(layer, BaseModel):
+        return layer.model_dump(by_alias=True, exclude_none=True)
+    if isinstance(layer, dict):
+        return layer
+    raise TypeError(f"Expected BaseModel or dict, got {type(layer).__name__}")
+
+
+def _size(payload: dict[str, Any]) -> int:
+    return len(json.dumps(payload, separators=(",", ":")))
+
+
+class LayerStore:
+    """In-memory cache of encoded layer payloads, keyed by layer id.
+
+    Layers added with ``put()`` are pinned for the life of the store.
+    Layers added with ``register()`` are built by their loader on first
+    request; once the cached payloads exceed ``max_bytes`` the least
+    recently used loader-backed entries are dropped and rebuilt on demand.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = 64 * 1024 * 1024) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+
+    def __contains__(self, layer_id: str) -> bool:
+        return layer_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        """Encoded JSON size of all payloads currently held in memory."""
+        return sum(e.nbytes for e in self._entries.values())
+
+    def put(self, layer: Any) -> None:
+        """Store a fully built layer (``MapLayer``, ``LayersLayer`` or dict)."""
+        payload = _encode(layer)
+        self._entries[payload["id"]] = _Entry(payload, _size(payload))
+        self._entries.move_to_end(payload["id"])
+
+    def register(self, layer_id: str, loader: Callable[[], Any]) -> None:
+        """Register a loader that builds the layer the first time it is requested."""
+        self._entries[layer_id] = _Entry(None, 0, loader)
+
+    def get(self, layer_id: str) -> dict[str, Any]:
+        """Return the encoded layer payload, loading it if needed.
+
+        Raises:
+            KeyError: If the layer id is unknown.
+        """
+        entry = self._entries[layer_id]
+        if entry.payload is None:
+            payload = _encode(entry.loader())  # type: ignore[misc]
+            entry.payload = payload
+            entry.nbytes = _size(payload)
+        self._entries.move_to_end(layer_id)
+        self._evict(keep=layer_id)
+        return entry.payload
+
+    def evict(self, layer_id: str) -> None:
+        """Drop a layer's cached payload (and the layer itself if it has no loader)."""
+        entry = self._entries.get(layer_id)
+        if entry is None:
+            return
+        if entry.loader is None:
+            del self._entries[layer_id]
+        else:
+            entry.payload = None
+            entry.nbytes = 0
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _evict(self, keep: str) -> None:
+        if self.max_bytes is None:
+            return
+        total = self.nbytes
+        for layer_id, entry in self._entries.items():
+            if total <= self.max_bytes:
+                break
+            if layer_id == keep or entry.loader is None or entry.payload is None:
+                continue
+            total -= entry.nbytes
+            entry.payload = None
+            entry.nbytes = 0
+
+
+def defer_hidden_layers(
+    content: C,
+    store: LayerStore,
+    *,
+    tool: Optional[str] = None,
+    resource: Optional[str] = None,
+) -> C:
+    """Move the features of every ``visible=False`` layer into ``store``.
+
+    Works with ``MapContent`` and ``LayersContent``. Each hidden layer keeps
+    its metadata and gains a ``source`` reference: either ``tool`` called
+    with ``{"layerId": <id>}``, or ``resource`` formatted with ``{id}``
+    (e.g. ``"ui://my-server/layers/{id}"``).
+
+    Args:
+        content: A map or layers View payload.
+        store: Store that will serve the deferred layers.
+        tool: Name of the tool the view calls to load a layer.
+        resource: ``ui://`` URI template for the layer resource.
+
+    Returns:
+        A copy of ``content`` with hidden layers replaced by lazy stubs.
+    """
+    if (tool is None) == (resource is None):
+        raise ValueError("Pass exactly one of tool= or resource=")
+
+    layers = []
+    for layer in content.layers:  # type: ignore[attr-defined]
+        if layer.visible is False and layer.features is not None:
+            store.put(layer)
+            if tool is not None:
+                source = LayerSource(tool=tool, arguments={"layerId": layer.id})
+            else:
+                source = LayerSource(resource=resource.format(id=layer.id))  # type: ignore[union-attr]
+            layer = layer.model_copy(update={"features": None, "source": source})
+        layers.append(layer)
+    return content.model_copy(update={"layers": layers})
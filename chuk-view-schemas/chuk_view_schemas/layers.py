@@ -1,6 +1,8 @@
 from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, model_validator
+
+from .map import LayerSource
 
 
 class LayersCenter(BaseModel):
@@ -13,7 +15,14 @@ class LayersLayer(BaseModel):
     label: str
     visible: Optional[bool] = None
     opacity: Optional[float] = None
-    features: Dict[str, Any]  # GeoJSON
+    features: Optional[Dict[str, Any]] = None  # GeoJSON
+    source: Optional[LayerSource] = None  # set instead of features for lazy layers
+
+    @model_validator(mode="after")
+    def _features_or_source(self) -> "LayersLayer":
+        if (self.features is None) == (self.source is None):
+            raise ValueError("Exactly one of features or source is required")
+        return self
 
 
 class LayersContent(BaseModel):
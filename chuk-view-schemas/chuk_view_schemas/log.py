@@ -4,10 +4,12 @@ from pydantic import BaseModel, Field
 
 
 class LogEntry(BaseModel):
+    id: Optional[str] = None
     timestamp: Optional[str] = None
     level: Literal["info", "debug", "warning", "error"]
     message: str
     source: Optional[str] = None
+    highlights: Optional[List[List[int]]] = None
 
 
 class LogContent(BaseModel):
@@ -18,5 +20,7 @@ class LogContent(BaseModel):
     show_timestamp: Optional[bool] = Field(None, alias="showTimestamp")
     monospace: Optional[bool] = None
     entries: List[LogEntry]
+    max_entries: Optional[int] = Field(None, alias="maxEntries")
+    search_tool: Optional[str] = Field(None, alias="searchTool")
 
     model_config = {"populate_by_name": True}
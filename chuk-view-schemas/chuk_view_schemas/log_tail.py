@@ -0,0 +1,503 @@
+"""Tail log files into log Views with bounded memory and append patches.
+
+``LogTail`` follows one file:
+
+- ``poll()`` memory-maps the file and parses only the complete lines
+  written since the last call. Parsed entries go into a ring buffer of the
+  latest ``capacity`` entries, so memory stays bounded however long the
+  job runs. A file that shrinks or is replaced (rotation) is re-read from
+  the start.
+- A sparse block index records, every ``block_size`` bytes, the block's
+  byte range, time span and the levels and sources it contains.
+  ``seek()`` finds the offset for a timestamp by bisection, and
+  ``history()`` re-reads only the blocks that overlap the time range and
+  can hold matching levels / sources, instead of rescanning the file.
+- ``patch()`` returns a ``ui_patch`` that appends the new entries to the
+  panel's top-level ``entries``, optionally filtered by level and source.
+  After a rotation it replaces ``entries`` instead.
+
+Each entry's ``id`` is its byte offset in the file. Lines are parsed as
+JSON objects (``timestamp`` / ``time`` / ``ts``, ``level`` / ``lvl`` /
+``severity``, ``message`` / ``msg``, ``source`` / ``logger``) or as text
+of the form ``<timestamp> [LEVEL] [source] message``. Levels are mapped
+onto the schema's four (``warn`` -> ``warning``, ``fatal`` / ``critical``
+-> ``error``, ``trace`` -> ``debug``). Lines without a recognised level
+(stack traces, continuation lines) inherit the previous entry's level and
+source. Pass ``parser=`` to read other formats.
+
+Usage:
+    tail = LogTail("/var/log/job.log", panel_id="job-log", capacity=2000)
+    content = tail.snapshot(levels={"warning", "error"})
+    ...
+    if (patch := tail.patch(levels={"warning", "error"})) is not None:
+        await send(patch.model_dump(by_alias=True, exclude_none=True))
+
+Pure Python — no external dependencies.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import re
+from bisect import bisect_right
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Collection, Iterator, Optional, Union
+
+from .log import LogContent, LogEntry
+from .patch import UIPatch, UpdatePanelOp
+
+Parser = Callable[[str], Optional[LogEntry]]
+
+LEVEL_ALIASES = {
+    "trace": "debug",
+    "debug": "debug",
+    "info": "info",
+    "notice": "info",
+    "warn": "warning",
+    "warning": "warning",
+    "err": "error",
+    "error": "error",
+    "critical": "error",
+    "crit": "error",
+    "fatal": "error",
+}
+
+_TEXT_LINE = re.compile(
+    r"^(?P<timestamp>\d{4}-\d\d-\d\d[T ]\d\d:\d\d(?::\d\d(?:[.,]\d+)?)?"
+    r"(?:Z|[+-]\d\d:?\d\d)?)?\s*"
+    r"\[?(?P<level>[A-Za-z]+)\]?:?\s+"
+    r"(?:\[(?P<source>[^\]]+)\]:?\s*|(?P<name>[\w.\-]+):\s+)?"
+    r"(?P<message>.*)$"
+)
+
+
+def parse_line(line: str) -> Optional[LogEntry]:
+    """Parse one JSON or text log line; ``None`` if it has no known level."""
+    line = line.rstrip("\r")
+    if line.startswith("{"):
+        try:
+            record = json.loads(line)
+        except ValueError:
+            record = None
+        if isinstance(record, dict):
+            level = _first(record, "level", "lvl", "severity", "levelname")
+            level = LEVEL_ALIASES.get(str(level).lower()) if level else None
+            if level is not None:
+                timestamp = _first(record, "timestamp", "time", "ts", "@timestamp")
+                source = _first(record, "source", "logger", "name", "module")
+                return LogEntry(
+                    timestamp=None if timestamp is None else str(timestamp),
+                    level=level,
+                    message=str(_first(record, "message", "msg") or ""),
+                    source=None if source is None else str(source),
+                )
+    match = _TEXT_LINE.match(line)
+    if match is None:
+        return None
+    level = LEVEL_ALIASES.get(match["level"].lower())
+    # Without a timestamp only a bracketed level counts ("[WARN] ...")
+    if level is None or not (match["timestamp"] or line.startswith("[")):
+        return None
+    return LogEntry(
+        timestamp=match["timestamp"],
+        level=level,
+        message=match["message"],
+        source=match["source"] or match["name"],
+    )
+
+
+@dataclass
+class LogBlock:
+    """Sparse index entry: one run of complete lines in the file."""
+
+    start: int  # byte offsets, end exclusive
+    end: int
+    first_time: Optional[float]
+    last_time: Optional[float]
+    levels: frozenset[str]
+    sources: frozenset[Optional[str]]
+    # Inherited by continuation lines at the start of the block
+    inherit_level: str = "info"
+    inherit_source: Optional[str] = None
+
+
+class LogTail:
+    """Ring-buffered, block-indexed tail of one log file.
+
+    Args:
+        path: File to follow; it need not exist yet.
+        panel_id: Dashboard panel that ``patch()`` targets.
+        capacity: Entries kept in memory (and ``maxEntries`` for the view).
+        block_size: Approximate bytes per sparse index block.
+        parser: Line parser; see ``parse_line``.
+        title: Log title.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        panel_id: str = "log",
+        capacity: int = 5000,
+        block_size: int = 256 * 1024,
+        parser: Parser = parse_line,
+        title: Optional[str] = None,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.path = Path(path)
+        self.panel_id = panel_id
+        self.capacity = capacity
+        self.block_size = block_size
+        self.parser = parser
+        self.title = title
+        self._blocks: list[LogBlock] = []
+        self._buffer: deque[LogEntry] = deque(maxlen=capacity)
+        self._reset_state()
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    @property
+    def offset(self) -> int:
+        """Bytes of the file consumed so far."""
+        return self._offset
+
+    @property
+    def blocks(self) -> list[LogBlock]:
+        """The sparse index, including the block still filling."""
+        return self._indexed()[0]
+
+    @property
+    def entries(self) -> list[LogEntry]:
+        """Buffered entries, oldest first."""
+        return list(self._buffer)
+
+    def poll(self) -> list[LogEntry]:
+        """Parse the complete lines appended since the last poll.
+
+        Returns at most ``capacity`` entries, the newest.
+        """
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return []
+        if stat.st_ino != self._inode or stat.st_size < self._offset:
+            rotated = self._inode is not None
+            self._reset_state()
+            self._buffer.clear()
+            self._blocks.clear()
+            self._inode = stat.st_ino
+            self._rotated = rotated
+        if stat.st_size == self._offset:
+            return []
+
+        # Catching up on a large file keeps only the newest entries; the
+        # older ones are indexed for history()
+        new: deque[LogEntry] = deque(maxlen=self.capacity)
+        for offset, end, line in self._read_lines(self._offset, stat.st_size):
+            prev, entry = self._prev, self._parse(offset, line, self._prev)
+            self._index(entry, offset, end, prev)
+            self._prev = entry
+            new.append(entry)
+            self._offset = end
+        self._buffer.extend(new)
+        return list(new)
+
+    def snapshot(
+        self,
+        *,
+        levels: Optional[Collection[str]] = None,
+        sources: Optional[Collection[str]] = None,
+        limit: Optional[int] = None,
+    ) -> LogContent:
+        """``LogContent`` with the latest buffered entries (after polling)."""
+        self.poll()
+        self._rotated = False
+        entries = _filter(self._buffer, levels, sources)
+        if limit is not None:
+            entries = entries[-limit:] if limit else []
+        return LogContent(
+            title=self.title,
+            entries=entries,
+            max_entries=self.capacity,
+        )
+
+    def patch(
+        self,
+        entries: Optional[list[LogEntry]] = None,
+        *,
+        levels: Optional[Collection[str]] = None,
+        sources: Optional[Collection[str]] = None,
+        panel_id: Optional[str] = None,
+    ) -> Optional[UIPatch]:
+        """Append op for new entries, or ``None`` when nothing matches.
+
+        Polls unless ``entries`` is given: to feed several filtered panels,
+        ``poll()`` once and pass the result to each ``patch()`` call. After
+        a rotation the op replaces ``entries`` with the buffer instead.
+        """
+        if entries is None:
+            entries = self.poll()
+        action = "append"
+        if self._rotated:
+            self._rotated = False
+            action, entries = "replace", list(self._buffer)
+        matched = _filter(entries, levels, sources)
+        if not matched and action == "append":
+            return None
+        return UIPatch(
+            ops=[
+                UpdatePanelOp(
+                    panel_id=panel_id or self.panel_id,
+                    action=action,
+                    target_field="entries",
+                    data={
+                        "entries": [
+                            e.model_dump(by_alias=True, exclude_none=True)
+                            for e in matched
+                        ]
+                    },
+                )
+            ]
+        )
+
+    def seek(self, timestamp: str) -> int:
+        """Offset of the first indexed block that may hold ``timestamp`` or later."""
+        blocks, times = self._indexed()
+        t = _epoch(timestamp)
+        if not blocks or t is None:
+            return 0
+        return blocks[max(bisect_right(times, t) - 1, 0)].start
+
+    def history(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        *,
+        levels: Optional[Collection[str]] = None,
+        sources: Optional[Collection[str]] = None,
+        limit: int = 1000,
+    ) -> list[LogEntry]:
+        """Entries in ``[start, end)`` from the whole file, oldest first.
+
+        Only blocks that overlap the range and contain a wanted level and
+        source are read. Entries without a timestamp are kept when their
+        block overlaps the range.
+
+        Raises:
+            ValueError: If ``start`` or ``end`` is not an ISO 8601 time or
+                epoch seconds.
+        """
+        lo = _bound(start, "start")
+        hi = _bound(end, "end")
+        blocks, times = self._indexed()
+        first = 0
+        if lo is not None and blocks:
+            first = max(bisect_right(times, lo) - 1, 0)
+        level_set = None if levels is None else set(levels)
+        source_set = None if sources is None else set(sources)
+
+        found: list[LogEntry] = []
+        for block in blocks[first:]:
+            if (
+                hi is not None
+                and block.first_time is not None
+                and block.first_time >= hi
+            ):
+                continue
+            if lo is not None and block.last_time is not None and block.last_time < lo:
+                continue
+            if level_set is not None and not level_set & block.levels:
+                continue
+            if source_set is not None and not source_set & block.sources:
+                continue
+            # Continuation lines at the block start inherit from the entry
+            # before it, exactly as poll() parsed them
+            prev = LogEntry(
+                level=block.inherit_level, message="", source=block.inherit_source
+            )
+            for offset, _, line in self._read_lines(block.start, block.end):
+                entry = self._parse(offset, line, prev)
+                prev = entry
+                t = _epoch(entry.timestamp) if entry.timestamp else None
+                if t is not None and (
+                    (lo is not None and t < lo) or (hi is not None and t >= hi)
+                ):
+                    continue
+                if _matches(entry, level_set, source_set):
+                    found.append(entry)
+                    if len(found) >= limit:
+                        return found
+        return found
+
+    def _reset_state(self) -> None:
+        self._offset = 0
+        self._inode: Optional[int] = None
+        self._rotated = False
+        self._prev: Optional[LogEntry] = None
+        self._open: Optional[_OpenBlock] = None
+        # Block start times, kept non-decreasing so bisection works on
+        # slightly out-of-order logs
+        self._block_times: list[float] = []
+
+    def _read_lines(self, start: int, stop: int) -> Iterator[tuple[int, int, str]]:
+        """``(offset, next offset, line)`` for complete lines in ``[start, stop)``."""
+        with open(self.path, "rb") as f:
+            stop = min(stop, os.fstat(f.fileno()).st_size)
+            if stop <= start:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                pos = start
+                while pos < stop:
+                    nl = mm.find(b"\n", pos, stop)
+                    if nl < 0:
+                        return  # partial last line: wait for the rest
+                    yield pos, nl + 1, mm[pos:nl].decode("utf-8", errors="replace")
+                    pos = nl + 1
+
+    def _parse(self, offset: int, line: str, prev: Optional[LogEntry]) -> LogEntry:
+        entry = self.parser(line)
+        if entry is None:
+            entry = LogEntry(
+                level=prev.level if prev else "info",
+                message=line.rstrip("\r"),
+                source=prev.source if prev else None,
+            )
+        entry.id = str(offset)
+        return entry
+
+    def _index(
+        self, entry: LogEntry, start: int, end: int, prev: Optional[LogEntry]
+    ) -> None:
+        if self._open is None:
+            self._open = _OpenBlock(start, prev)
+        block = self._open
+        block.add(entry, end)
+        if end - block.start >= self.block_size:
+            self._blocks.append(block.freeze())
+            self._block_times.append(self._monotonic(block))
+            self._open = None
+
+    def _indexed(self) -> tuple[list[LogBlock], list[float]]:
+        """Closed blocks plus the one still filling, with their start times."""
+        if self._open is None:
+            return self._blocks, self._block_times
+        return (
+            self._blocks + [self._open.freeze()],
+            self._block_times + [self._monotonic(self._open)],
+        )
+
+    def _monotonic(self, block: _OpenBlock) -> float:
+        t = block.first_time
+        t = float("-inf") if t is None else t
+        return max(t, self._block_times[-1]) if self._block_times else t
+
+
+# ---------------------------------------------------------------------------
+# Internals
+# ---------------------------------------------------------------------------
+
+
+class _OpenBlock:
+    """Block still receiving lines.
+
+    Timestamps in one file share a format, so the earliest and latest
+    compare as strings; only those two are converted when the block is
+    frozen.
+    """
+
+    def __init__(self, start: int, prev: Optional[LogEntry]) -> None:
+        self.start = self.end = start
+        self.inherit_level = prev.level if prev else "info"
+        self.inherit_source = prev.source if prev else None
+        self.first: Optional[str] = None
+        self.last: Optional[str] = None
+        self.levels: set[str] = set()
+        self.sources: set[Optional[str]] = set()
+
+    def add(self, entry: LogEntry, end: int) -> None:
+        self.end = end
+        self.levels.add(entry.level)
+        self.sources.add(entry.source)
+        t = entry.timestamp
+        if t:
+            if self.first is None or t < self.first:
+                self.first = t
+            if self.last is None or t > self.last:
+                self.last = t
+
+    @property
+    def first_time(self) -> Optional[float]:
+        return _epoch(self.first) if self.first else None
+
+    def freeze(self) -> LogBlock:
+        return LogBlock(
+            start=self.start,
+            end=self.end,
+            first_time=self.first_time,
+            last_time=_epoch(self.last) if self.last else None,
+            levels=frozenset(self.levels),
+            sources=frozenset(self.sources),
+            inherit_level=self.inherit_level,
+            inherit_source=self.inherit_source,
+        )
+
+
+def _first(record: dict, *keys: str):
+    for key in keys:
+        if record.get(key) is not None:
+            return record[key]
+    return None
+
+
+def _bound(timestamp: Optional[str], name: str) -> Optional[float]:
+    if timestamp is None:
+        return None
+    t = _epoch(timestamp)
+    if t is None:
+        raise ValueError(f"Unparseable {name} time: {timestamp!r}")
+    return t
+
+
+def _epoch(timestamp: str) -> Optional[float]:
+    """Seconds since the epoch; naive times are read as UTC."""
+    value = timestamp.strip().replace(",", ".")
+    try:
+        return float(value)  # already epoch seconds
+    except ValueError:
+        pass
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    try:
+        dt = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def _matches(
+    entry: LogEntry,
+    levels: Optional[Collection[str]],
+    sources: Optional[Collection[str]],
+) -> bool:
+    return (levels is None or entry.level in levels) and (
+        sources is None or entry.source in sources
+    )
+
+
+def _filter(
+    entries: Collection[LogEntry],
+    levels: Optional[Collection[str]],
+    sources: Optional[Collection[str]],
+) -> list[LogEntry]:
+    if levels is None and sources is None:
+        return list(entries)
+    return [e for e in entries if _matches(e, levels, sources)]
@@ -1,6 +1,6 @@
 from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 
 class PopupAction(BaseModel):
@@ -28,6 +28,19 @@ class LayerStyle(BaseModel):
     model_config = {"populate_by_name": True}
 
 
+class LayerSource(BaseModel):
+    """Fetch reference for a lazily loaded layer.
+
+    Either ``tool`` (called with ``arguments``) or ``resource`` (a ``ui://``
+    URI) tells the view where to load the layer's features from when the
+    user first toggles it on.
+    """
+
+    tool: Optional[str] = None
+    arguments: Optional[Dict[str, Any]] = None
+    resource: Optional[str] = None
+
+
 class ClusterConfig(BaseModel):
     enabled: bool
     radius: Optional[int] = None
@@ -38,11 +51,18 @@ class MapLayer(BaseModel):
     label: str
     visible: Optional[bool] = None
     opacity: Optional[float] = None
-    features: Dict[str, Any]  # GeoJSON FeatureCollection
+    features: Optional[Dict[str, Any]] = None  # GeoJSON FeatureCollection
+    source: Optional[LayerSource] = None  # set instead of features for lazy layers
     style: Optional[LayerStyle] = None
     cluster: Optional[ClusterConfig] = None
     popup: Optional[PopupTemplate] = None
 
+    @model_validator(mode="after")
+    def _features_or_source(self) -> "MapLayer":
+        if (self.features is None) == (self.source is None):
+            raise ValueError("Exactly one of features or source is required")
+        return self
+
 
 class MapCenter(BaseModel):
     lat: float
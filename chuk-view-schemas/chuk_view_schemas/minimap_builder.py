@@ -0,0 +1,276 @@
+"""Automatic overview generation for minimap Views.
+
+Derives the ``overview`` pane of a ``MinimapContent`` from the ``detail``
+layers, so a minimap only costs a small fraction of the detail payload:
+
+- lines and polygons are simplified (Douglas-Peucker) and rounded
+- points are aggregated into grid cells, one point per cell with a count
+- feature properties are stripped (except ``keep_properties``)
+
+Tolerance and cell size start small and double until the encoded overview
+fits the byte budget.
+
+Requires NumPy (``pip install chuk-view-schemas[numpy]``).
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from typing import Any, Iterable, Optional, Sequence
+
+import numpy as np
+from pydantic import BaseModel
+
+from ._arrays import douglas_peucker
+from .minimap import MinimapCenter, MinimapContent, MinimapLayer, MinimapPane
+
+_MAX_ROUNDS = 16
+
+
+def build_minimap(
+    detail: MinimapPane,
+    *,
+    title: Optional[str] = None,
+    max_bytes: Optional[int] = None,
+    max_fraction: float = 0.1,
+    keep_properties: Optional[Sequence[str]] = None,
+) -> MinimapContent:
+    """Build a ``MinimapContent`` whose overview is generalized from ``detail``."""
+    overview = build_overview(
+        detail.layers,
+        max_bytes=max_bytes,
+        max_fraction=max_fraction,
+        keep_properties=keep_properties,
+    )
+    return MinimapContent(title=title, overview=overview, detail=detail)
+
+
+def build_overview(
+    layers: Iterable[Any],
+    *,
+    max_bytes: Optional[int] = None,
+    max_fraction: float = 0.1,
+    keep_properties: Optional[Sequence[str]] = None,
+) -> MinimapPane:
+    """Generalize detail layers into an overview pane within a byte budget.
+
+    Args:
+        layers: ``MinimapLayer``/``MapLayer`` models or dicts with
+            ``id``, ``label`` and GeoJSON ``features``. Layers without
+            inline ``features`` (a lazy ``MapLayer`` with a ``source``) are
+            skipped: there is nothing to generalize until the view loads them.
+        max_bytes: Absolute budget for the encoded overview layers.
+        max_fraction: Budget as a fraction of the encoded detail layers,
+            used when ``max_bytes`` is not given.
+        keep_properties: Feature properties to keep (all others are dropped).
+
+    Returns:
+        MinimapPane centred on the data extent. If the budget cannot be met
+        the coarsest generalization tried is returned.
+    """
+    dicts = [d for d in map(_as_dict, layers) if d.get("features") is not None]
+    if max_bytes is None:
+        max_bytes = int(_size([d["features"] for d in dicts]) * max_fraction)
+
+    bbox = _bbox(dicts)
+    span = max(bbox[2] - bbox[0], bbox[3] - bbox[1]) if bbox else 0.0
+    span = span or 1.0
+    tolerance = span / 512
+    cell_size = span / 64
+    keep = set(keep_properties or ())
+
+    out: list[MinimapLayer] = []
+    for _ in range(_MAX_ROUNDS):
+        out = [
+            MinimapLayer(
+                id=d["id"],
+                label=d["label"],
+                features=generalize_features(
+                    d["features"], tolerance=tolerance, cell_size=cell_size, keep=keep
+                ),
+            )
+            for d in dicts
+        ]
+        if _size([layer.features for layer in out]) <= max_bytes:
+            break
+        tolerance *= 2
+        cell_size *= 2
+
+    center = zoom = None
+    if bbox:
+        center = MinimapCenter(lat=(bbox[1] + bbox[3]) / 2, lon=(bbox[0] + bbox[2]) / 2)
+        lon_span = max(bbox[2] - bbox[0], bbox[3] - bbox[1], 1e-6)
+        zoom = max(0, min(18, int(math.log2(360 / lon_span))))
+    return MinimapPane(center=center, zoom=zoom, layers=out)
+
+
+def generalize_features(
+    collection: dict[str, Any],
+    *,
+    tolerance: float,
+    cell_size: float,
+    keep: Optional[set[str]] = None,
+) -> dict[str, Any]:
+    """Simplify, aggregate and strip one GeoJSON FeatureCollection."""
+    keep = keep or set()
+    decimals = max(0, math.ceil(-math.log10(tolerance))) if tolerance > 0 else 6
+    points: list[tuple[float, float]] = []
+    features: list[dict[str, Any]] = []
+
+    for feature in collection.get("features", []):
+        geometry = feature.get("geometry")
+        if not geometry:
+            continue
+        if geometry["type"] == "Point":
+            points.append(tuple(geometry["coordinates"][:2]))
+            continue
+        if geometry["type"] == "MultiPoint":
+            points.extend(tuple(c[:2]) for c in geometry["coordinates"])
+            continue
+        simplified = _simplify_geometry(geometry, tolerance, decimals)
+        if simplified is None:
+            continue
+        props = feature.get("properties") or {}
+        features.append(
+            {
+                "type": "Feature",
+                "geometry": simplified,
+                "properties": {k: v for k, v in props.items() if k in keep},
+            }
+        )
+
+    if points:
+        features.extend(
+            _aggregate_points(np.asarray(points, dtype=float), cell_size, decimals)
+        )
+    return {"type": "FeatureCollection", "features": features}
+
+
+# ---------------------------------------------------------------------------
+# Internals
+# ---------------------------------------------------------------------------
+
+
+def _as_dict(layer: Any) -> dict[str, Any]:
+    if isinstance(layer, BaseModel):
+        return layer.model_dump(by_alias=True, exclude_none=True)
+    return layer
+
+
+def _size(obj: Any) -> int:
+    return len(json.dumps(obj, separators=(",", ":")))
+
+
+def _iter_coords(geometry: dict[str, Any]) -> Iterable[Any]:
+    gtype = geometry["type"]
+    coords = geometry.get("coordinates")
+    if gtype == "Point":
+        yield coords
+    elif gtype in ("MultiPoint", "LineString"):
+        yield from coords
+    elif gtype in ("MultiLineString", "Polygon"):
+        for part in coords:
+            yield from part
+    elif gtype == "MultiPolygon":
+        for polygon in coords:
+            for ring in polygon:
+                yield from ring
+    elif gtype == "GeometryCollection":
+        for child in geometry.get("geometries", []):
+            yield from _iter_coords(child)
+
+
+def _bbox(layers: list[dict[str, Any]]) -> Optional[tuple[float, float, float, float]]:
+    arrays = []
+    for layer in layers:
+        coords = [
+            c[:2]
+            for f in layer["features"].get("features", [])
+            if f.get("geometry")
+            for c in _iter_coords(f["geometry"])
+        ]
+        if coords:
+            arrays.append(np.asarray(coords, dtype=float))
+    if not arrays:
+        return None
+    xy = np.concatenate(arrays)
+    lo, hi = xy.min(axis=0), xy.max(axis=0)
+    return float(lo[0]), float(lo[1]), float(hi[0]), float(hi[1])
+
+
+def _simplify_line(
+    coords: list[Any], tolerance: float, decimals: int, min_len: int
+) -> Optional[list]:
+    xy = np.asarray([c[:2] for c in coords], dtype=float)
+    out = np.round(douglas_peucker(xy, tolerance), decimals)
+    if len(out) < min_len:
+        return None
+    return out.tolist()
+
+
+def _simplify_polygon(
+    rings: list[Any], tolerance: float, decimals: int
+) -> Optional[list]:
+    out = []
+    for i, ring in enumerate(rings):
+        simplified = _simplify_line(ring, tolerance, decimals, 4)
+        if simplified is None:
+            if i == 0:
+                return None  # exterior collapsed: drop the polygon
+            continue
+        out.append(simplified)
+    return out
+
+
+def _simplify_geometry(
+    geometry: dict[str, Any], tolerance: float, decimals: int
+) -> Optional[dict]:
+    gtype = geometry["type"]
+    coords = geometry.get("coordinates")
+    if gtype == "LineString":
+        line = _simplify_line(coords, tolerance, decimals, 2)
+        return None if line is None else {"type": gtype, "coordinates": line}
+    if gtype == "MultiLineString":
+        lines = [
+            line
+            for part in coords
+            if (line := _simplify_line(part, tolerance, decimals, 2))
+        ]
+        return {"type": gtype, "coordinates": lines} if lines else None
+    if gtype == "Polygon":
+        polygon = _simplify_polygon(coords, tolerance, decimals)
+        return None if polygon is None else {"type": gtype, "coordinates": polygon}
+    if gtype == "MultiPolygon":
+        polygons = [
+            p for part in coords if (p := _simplify_polygon(part, tolerance, decimals))
+        ]
+        return {"type": gtype, "coordinates": polygons} if polygons else None
+    if gtype == "GeometryCollection":
+        children = [
+            g
+            for child in geometry.get("geometries", [])
+            if (g := _simplify_geometry(child, tolerance, decimals))
+        ]
+        return {"type": gtype, "geometries": children} if children else None
+    return None
+
+
+def _aggregate_points(
+    xy: np.ndarray, cell_size: float, decimals: int
+) -> list[dict[str, Any]]:
+    cells = np.floor(xy / cell_size).astype(np.int64)
+    _, inverse, counts = np.unique(
+        cells, axis=0, return_inverse=True, return_counts=True
+    )
+    inverse = inverse.ravel()
+    lon = np.round(np.bincount(inverse, weights=xy[:, 0]) / counts, decimals)
+    lat = np.round(np.bincount(inverse, weights=xy[:, 1]) / counts, decimals)
+    return [
+        {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [x, y]},
+            "properties": {"count": c},
+        }
+        for x, y, c in zip(lon.tolist(), lat.tolist(), counts.tolist())
+    ]
@@ -0,0 +1,115 @@
+from typing import Annotated, Any, Dict, List, Literal, Optional, Union
+
+from pydantic import BaseModel, Field, model_serializer
+
+
+class CrossViewLink(BaseModel):
+    source: str
+    target: str
+    type: Literal["selection", "filter", "highlight", "navigate", "update"]
+    source_field: str = Field(alias="sourceField")
+    target_field: str = Field(alias="targetField")
+    bidirectional: Optional[bool] = None
+
+    model_config = {"populate_by_name": True}
+
+
+class AddPanelOp(BaseModel):
+    op: Literal["add-panel"] = "add-panel"
+    panel: Dict[str, Any]
+    after: Optional[str] = None
+
+
+class UpdatePanelOp(BaseModel):
+    op: Literal["update-panel"] = "update-panel"
+    panel_id: str = Field(alias="panelId")
+    action: Literal["replace", "merge", "append"]
+    data: Dict[str, Any]
+    target_field: Optional[str] = Field(None, alias="targetField")
+
+    model_config = {"populate_by_name": True}
+
+
+class RemovePanelOp(BaseModel):
+    op: Literal["remove-panel"] = "remove-panel"
+    panel_id: str = Field(alias="panelId")
+
+    model_config = {"populate_by_name": True}
+
+
+class ShowPanelOp(BaseModel):
+    op: Literal["show-panel"] = "show-panel"
+    panel_id: str = Field(alias="panelId")
+    visible: bool
+
+    model_config = {"populate_by_name": True}
+
+
+class CollapsePanelOp(BaseModel):
+    op: Literal["collapse-panel"] = "collapse-panel"
+    panel_id: str = Field(alias="panelId")
+    collapsed: bool
+
+    model_config = {"populate_by_name": True}
+
+
+class AddLinkOp(BaseModel):
+    op: Literal["add-link"] = "add-link"
+    link: CrossViewLink
+
+
+class RemoveLinkOp(BaseModel):
+    op: Literal["remove-link"] = "remove-link"
+    source: str
+    target: str
+
+
+class UpdateLayoutOp(BaseModel):
+    op: Literal["update-layout"] = "update-layout"
+    layout: Union[str, Dict[str, Any]]
+
+
+class SetLoadingOp(BaseModel):
+    op: Literal["set-loading"] = "set-loading"
+    panel_id: str = Field(alias="panelId")
+    loading: bool
+
+    model_config = {"populate_by_name": True}
+
+
+class SetErrorOp(BaseModel):
+    op: Literal["set-error"] = "set-error"
+    panel_id: str = Field(alias="panelId")
+    error: Optional[str]  # None clears the error
+
+    model_config = {"populate_by_name": True}
+
+    @model_serializer(mode="wrap")
+    def _keep_error(self, handler):
+        # The view requires ``error`` (nullable), so it survives exclude_none
+        data = handler(self)
+        data.setdefault("error", self.error)
+        return data
+
+
+PatchOp = Annotated[
+    Union[
+        AddPanelOp,
+        RemovePanelOp,
+        UpdatePanelOp,
+        ShowPanelOp,
+        CollapsePanelOp,
+        AddLinkOp,
+        RemoveLinkOp,
+        UpdateLayoutOp,
+        SetLoadingOp,
+        SetErrorOp,
+    ],
+    Field(discriminator="op"),
+]
+
+
+class UIPatch(BaseModel):
+    type: Literal["ui_patch"] = "ui_patch"
+    version: Literal["3.0"] = "3.0"
+    ops: List[PatchOp]
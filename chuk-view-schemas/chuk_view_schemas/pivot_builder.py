@@ -0,0 +1,282 @@
+"""Server-side pivot aggregation for pivot and crosstab Views.
+
+``PivotContent`` normally ships every record and lets the view group them.
+``pivot()`` does the grouping in Python instead: dimension values are
+factorized to integer codes and every aggregate (sum / avg / count / min /
+max) is computed in one vectorized pass with ``bincount`` and
+``reduceat``, so the payload scales with the number of groups, not records.
+
+The result can be emitted as a ``PivotContent`` with one record per
+non-empty cell, or as a ``CrosstabContent`` for a single value with exact
+row / column / grand totals.
+
+Usage:
+    table = pivot(orders, rows=["region"], columns=["quarter"],
+                  values=[PivotValue(field="amount", aggregate="sum")])
+    content = table.to_pivot_content(title="Revenue", show_totals=True)
+
+Requires NumPy (``pip install chuk-view-schemas[numpy]``).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+from ._arrays import factorize
+from .crosstab import CrosstabContent
+from .pivot import PivotContent, PivotValue
+
+Records = Union[Sequence[Mapping[str, Any]], Mapping[str, Sequence[Any]]]
+
+TOTAL_LABEL = "Total"
+
+
+@dataclass
+class PivotTable:
+    """Aggregated pivot: one ``(n_rows, n_cols)`` matrix per value.
+
+    ``record_counts`` holds the number of records per cell. Cells without
+    values are NaN (0 for ``count``). Totals are aggregated from the
+    records, so they are exact for every aggregate (including ``avg``).
+    """
+
+    rows: list[str]
+    columns: list[str]
+    values: list[PivotValue]
+    row_keys: list[tuple[str, ...]]
+    column_keys: list[tuple[str, ...]]
+    record_counts: np.ndarray
+    cells: list[np.ndarray]
+    row_totals: list[np.ndarray]
+    column_totals: list[np.ndarray]
+    grand_totals: list[float]
+
+    def to_pivot_content(
+        self, *, title: Optional[str] = None, show_totals: Optional[bool] = None
+    ) -> PivotContent:
+        """Pre-aggregated ``PivotContent``: one record per non-empty cell.
+
+        The view re-aggregates these records, so ``count`` is sent as a
+        ``sum`` of per-cell counts; cells and sum/count/min/max totals
+        match the raw-data pivot. ``avg`` cells are exact but the view's
+        ``avg`` totals become unweighted means of cell averages; use
+        ``to_crosstab`` when exact average totals matter.
+        """
+        names = [f"{v.aggregate}_{v.field}" for v in self.values]
+        data: list[dict[str, Any]] = []
+        for i, j in zip(*np.nonzero(self.record_counts)):
+            record: dict[str, Any] = dict(zip(self.rows, self.row_keys[i]))
+            record.update(zip(self.columns, self.column_keys[j]))
+            for name, mat in zip(names, self.cells):
+                # Omitted (not null) so the view skips it like a non-number
+                if np.isfinite(mat[i, j]):
+                    record[name] = float(mat[i, j])
+            data.append(record)
+
+        values = [
+            PivotValue(
+                field=name,
+                aggregate="sum" if v.aggregate == "count" else v.aggregate,
+                label=v.label or f"{v.aggregate}({v.field})",
+            )
+            for name, v in zip(names, self.values)
+        ]
+        return PivotContent(
+            title=title,
+            data=data,
+            rows=self.rows,
+            columns=self.columns,
+            values=values,
+            show_totals=show_totals,
+        )
+
+    def to_crosstab(
+        self,
+        value: int = 0,
+        *,
+        title: Optional[str] = None,
+        totals: bool = True,
+        fill: float = 0.0,
+        separator: str = " / ",
+    ) -> CrosstabContent:
+        """``CrosstabContent`` for ``values[value]``.
+
+        With ``totals`` an exact "Total" column and row are appended (the
+        view's own ``showTotals`` would sum cells, which is wrong for
+        avg/min/max).
+        """
+        mat = np.where(np.isfinite(self.cells[value]), self.cells[value], fill)
+        row_headers = [separator.join(k) for k in self.row_keys]
+        column_headers = [separator.join(k) for k in self.column_keys]
+        if totals:
+            row_t = np.nan_to_num(self.row_totals[value], nan=fill)
+            col_t = np.nan_to_num(self.column_totals[value], nan=fill)
+            grand = self.grand_totals[value]
+            mat = np.column_stack((mat, row_t))
+            mat = np.vstack((mat, np.append(col_t, fill if np.isnan(grand) else grand)))
+            row_headers.append(TOTAL_LABEL)
+            column_headers.append(TOTAL_LABEL)
+        return CrosstabContent(
+            title=title,
+            row_headers=row_headers,
+            column_headers=column_headers,
+            values=mat.tolist(),
+        )
+
+
+def pivot(
+    records: Records,
+    *,
+    rows: Sequence[str],
+    columns: Sequence[str] = (),
+    values: Sequence[Union[PivotValue, tuple[str, str]]],
+) -> PivotTable:
+    """Group and aggregate records.
+
+    Args:
+        records: A list of dicts, or a mapping of column name to sequence.
+        rows: Dimension fields for the row key.
+        columns: Dimension fields for the column key.
+        values: ``PivotValue``s or ``(field, aggregate)`` tuples.
+
+    Row keys keep first-seen order and column keys are sorted, as in the
+    pivot view. Missing dimension values group under ``""``; missing or
+    non-numeric measure values are ignored (as the view does).
+    """
+    specs = [
+        v if isinstance(v, PivotValue) else PivotValue(field=v[0], aggregate=v[1])  # type: ignore[arg-type]
+        for v in values
+    ]
+    n = _record_count(records)
+
+    row_code, row_keys = _group_codes(records, list(rows), n, first_seen=True)
+    col_code, col_keys = _group_codes(records, list(columns), n, first_seen=False)
+    n_rows, n_cols = len(row_keys), len(col_keys)
+    cell_code = row_code * n_cols + col_code
+
+    cells, row_totals, column_totals, grand_totals = [], [], [], []
+    for spec in specs:
+        v = _numeric(_column(records, spec.field, n))
+        cells.append(
+            aggregate(cell_code, v, n_rows * n_cols, spec.aggregate).reshape(
+                n_rows, n_cols
+            )
+        )
+        row_totals.append(aggregate(row_code, v, n_rows, spec.aggregate))
+        column_totals.append(aggregate(col_code, v, n_cols, spec.aggregate))
+        grand_totals.append(
+            float(aggregate(np.zeros(n, dtype=np.int64), v, 1, spec.aggregate)[0])
+        )
+
+    return PivotTable(
+        rows=list(rows),
+        columns=list(columns),
+        values=specs,
+        row_keys=row_keys,
+        column_keys=col_keys,
+        record_counts=np.bincount(cell_code, minlength=n_rows * n_cols).reshape(
+            n_rows, n_cols
+        ),
+        cells=cells,
+        row_totals=row_totals,
+        column_totals=column_totals,
+        grand_totals=grand_totals,
+    )
+
+
+def aggregate(codes: np.ndarray, v: np.ndarray, n_groups: int, how: str) -> np.ndarray:
+    """Per-group aggregate of ``v`` (NaNs skipped); NaN for empty groups.
+
+    ``count`` is 0 rather than NaN for groups with no values.
+    """
+    ok = np.isfinite(v)
+    c, x = codes[ok], v[ok]
+    count = np.bincount(c, minlength=n_groups).astype(float)
+    if how == "count":
+        return count
+    out = np.full(n_groups, np.nan)
+    has = count > 0
+    if how in ("sum", "avg"):
+        total = np.bincount(c, weights=x, minlength=n_groups)
+        out[has] = total[has] if how == "sum" else total[has] / count[has]
+        return out
+    if how in ("min", "max"):
+        if c.size == 0:
+            return out
+        order = np.argsort(c, kind="stable")
+        c_sorted = c[order]
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(c_sorted)) + 1))
+        ufunc = np.minimum if how == "min" else np.maximum
+        out[c_sorted[starts]] = ufunc.reduceat(x[order], starts)
+        return out
+    raise ValueError(f"Unknown aggregate: {how!r}")
+
+
+# ---------------------------------------------------------------------------
+# Internals
+# ---------------------------------------------------------------------------
+
+
+def _record_count(records: Records) -> int:
+    if isinstance(records, Mapping):
+        lengths = {len(col) for col in records.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same length")
+        return lengths.pop() if lengths else 0
+    return len(records)
+
+
+def _column(records: Records, field: str, n: int) -> Sequence[Any]:
+    if isinstance(records, Mapping):
+        return records[field] if field in records else [None] * n
+    return [r.get(field) for r in records]
+
+
+def _numeric(col: Sequence[Any]) -> np.ndarray:
+    try:
+        return np.asarray(col, dtype=float)
+    except (TypeError, ValueError):
+        return np.array([_to_float(x) for x in col], dtype=float)
+
+
+def _to_float(x: Any) -> float:
+    try:
+        return float(x)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _group_codes(
+    records: Records, fields: list[str], n: int, *, first_seen: bool
+) -> tuple[np.ndarray, list[tuple[str, ...]]]:
+    if not fields:
+        return np.zeros(n, dtype=np.int64), [()]
+    per_field = [factorize(_column(records, f, n)) for f in fields]
+    combined = np.zeros(n, dtype=np.int64)
+    for codes, labels in per_field:
+        # Re-factorize after each field: codes stay dense (below n), so the
+        # product of the fields' cardinalities can never overflow int64.
+        # np.unique keeps the lexicographic (label-sorted) order.
+        combined = np.unique(combined * len(labels) + codes, return_inverse=True)[1]
+        combined = combined.ravel().astype(np.int64)
+    _, first, code = np.unique(combined, return_index=True, return_inverse=True)
+    code = code.ravel()
+    if first_seen:
+        order = np.argsort(first, kind="stable")
+        remap = np.empty_like(order)
+        remap[order] = np.arange(order.size)
+        first, code = first[order], remap[code]
+
+    # Each group's key is read off its first row
+    keys = list(
+        zip(
+            *(
+                np.asarray(labels, dtype=object)[codes[first]]
+                for codes, labels in per_field
+            )
+        )
+    )
+    return code, keys
@@ -0,0 +1,165 @@
+"""Elevation / route profile builder for profile Views.
+
+Turns a GPS track into ``ProfileContent.points``: cumulative geodesic
+distance (vectorized haversine) on x, elevation on y, resampled to a
+uniform distance grid or simplified while keeping peaks.
+
+Usage:
+    content = build_profile(track_geometry, n_points=1000, title="Stage 4")
+
+Requires NumPy (``pip install chuk-view-schemas[numpy]``).
+"""
+
+from __future__ import annotations
+
+from typing import Any, Literal, Optional
+
+import numpy as np
+
+from ._arrays import douglas_peucker
+from .profile import ProfileContent, ProfilePoint
+
+EARTH_RADIUS_M = 6_371_008.8
+
+DistanceUnit = Literal["m", "km", "mi"]
+_UNIT_METERS = {"m": 1.0, "km": 1000.0, "mi": 1609.344}
+
+
+def cumulative_distance(lon: Any, lat: Any) -> np.ndarray:
+    """Cumulative great-circle distance in metres along a lon/lat track."""
+    lon_r = np.radians(np.asarray(lon, dtype=float))
+    lat_r = np.radians(np.asarray(lat, dtype=float))
+    if lon_r.size == 0:
+        return np.zeros(0)
+    dlat = np.diff(lat_r)
+    dlon = np.diff(lon_r)
+    a = (
+        np.sin(dlat / 2) ** 2
+        + np.cos(lat_r[:-1]) * np.cos(lat_r[1:]) * np.sin(dlon / 2) ** 2
+    )
+    step = 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+    return np.concatenate(([0.0], np.cumsum(step)))
+
+
+def resample_profile(
+    distance: np.ndarray,
+    elevation: np.ndarray,
+    *,
+    n_points: Optional[int] = 1000,
+    spacing: Optional[float] = None,
+    keep_peaks: bool = True,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Resample ``elevation`` onto a uniform distance grid.
+
+    Args:
+        distance: Cumulative distance per vertex (non-decreasing).
+        elevation: Elevation per vertex.
+        n_points: Number of output samples (ignored when ``spacing`` is set).
+        spacing: Distance between samples, in the units of ``distance``.
+        keep_peaks: Also emit the exact highest and lowest vertices, which
+            linear interpolation onto the grid would otherwise shave off.
+
+    Returns:
+        ``(x, y)`` arrays sorted by distance.
+    """
+    total = float(distance[-1]) if distance.size else 0.0
+    if spacing is not None:
+        if spacing <= 0:
+            raise ValueError("spacing must be > 0")
+        grid = np.arange(0.0, total, spacing)
+        grid = np.append(grid, total)
+    else:
+        grid = np.linspace(0.0, total, max(2, n_points or 2))
+    y = np.interp(grid, distance, elevation)
+    if keep_peaks and elevation.size:
+        extremes = np.unique([int(np.argmax(elevation)), int(np.argmin(elevation))])
+        grid = np.concatenate((grid, distance[extremes]))
+        y = np.concatenate((y, elevation[extremes]))
+        order = np.argsort(grid, kind="stable")
+        grid, y = grid[order], y[order]
+    return grid, y
+
+
+def build_profile(
+    line: Optional[dict[str, Any]] = None,
+    *,
+    lon: Any = None,
+    lat: Any = None,
+    elevation: Any = None,
+    n_points: Optional[int] = 1000,
+    spacing: Optional[float] = None,
+    simplify_tolerance: Optional[float] = None,
+    keep_peaks: bool = True,
+    units: DistanceUnit = "km",
+    title: Optional[str] = None,
+    fill: Optional[bool] = True,
+) -> ProfileContent:
+    """Build a ``ProfileContent`` from a track.
+
+    Pass either a GeoJSON LineString (geometry or Feature) with
+    ``[lon, lat, elevation]`` coordinates, or ``lon``/``lat``/``elevation``
+    arrays.
+
+    Args:
+        line: GeoJSON LineString geometry or Feature.
+        lon, lat, elevation: Coordinate and elevation arrays.
+        n_points: Target number of profile points.
+        spacing: Target distance between points, in ``units``.
+        simplify_tolerance: When set, simplify with Douglas-Peucker (in
+            metres of elevation) instead of resampling uniformly. Peaks
+            and troughs deeper than the tolerance are kept exactly.
+        keep_peaks: See ``resample_profile``.
+        units: Distance units for the x axis.
+        title: Chart title.
+        fill: Fill the area under the profile.
+
+    Returns:
+        ProfileContent with distance on x and elevation on y.
+    """
+    lon_a, lat_a, ele_a = _track_arrays(line, lon, lat, elevation)
+    distance = cumulative_distance(lon_a, lat_a)
+
+    if simplify_tolerance is not None:
+        xy = douglas_peucker(np.column_stack((distance, ele_a)), simplify_tolerance)
+        x, y = xy[:, 0], xy[:, 1]
+    else:
+        step = spacing * _UNIT_METERS[units] if spacing is not None else None
+        x, y = resample_profile(
+            distance, ele_a, n_points=n_points, spacing=step, keep_peaks=keep_peaks
+        )
+
+    x = x / _UNIT_METERS[units]
+    return ProfileContent(
+        title=title,
+        x_label=f"Distance ({units})",
+        y_label="Elevation (m)",
+        fill=fill,
+        points=[ProfilePoint(x=px, y=py) for px, py in zip(x.tolist(), y.tolist())],
+    )
+
+
+def _track_arrays(
+    line: Optional[dict[str, Any]], lon: Any, lat: Any, elevation: Any
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    if line is not None:
+        geometry = line.get("geometry", line) if line.get("type") == "Feature" else line
+        if geometry.get("type") != "LineString":
+            raise ValueError(f"Expected a LineString, got {geometry.get('type')!r}")
+        coords = np.asarray(geometry["coordinates"], dtype=float)
+        if coords.ndim != 2 or coords.shape[1] < 2:
+            raise ValueError("LineString coordinates must be [lon, lat, elevation]")
+        lon, lat = coords[:, 0], coords[:, 1]
+        if elevation is None:
+            if coords.shape[1] < 3:
+                raise ValueError("LineString has no elevation; pass elevation=")
+            elevation = coords[:, 2]
+    if lon is None or lat is None or elevation is None:
+        raise ValueError("Pass a LineString or lon=, lat= and elevation= arrays")
+    lon_a = np.asarray(lon, dtype=float)
+    lat_a = np.asarray(lat, dtype=float)
+    ele_a = np.asarray(elevation, dtype=float)
+    if not (lon_a.shape == lat_a.shape == ele_a.shape):
+        raise ValueError("lon, lat and elevation must have the same length")
+    if lon_a.size < 2:
+        raise ValueError("A profile needs at least two vertices")
+    return lon_a, lat_a, ele_a
@@ -0,0 +1,261 @@
+"""Multi-resolution rollup pyramids for zoomable timeseries Views.
+
+A ``RollupPyramid`` precomputes min / max / sum / count for one series at
+power-of-two multiples of a base interval (level ``k`` buckets span
+``base * 2**k`` seconds). Each level is a dense array indexed by bucket, so
+a query for any time window picks the finest level that fits the point
+budget and slices it: cost is O(output points), not O(raw points).
+
+Pyramids can be saved to a directory of ``.npy`` files and loaded back
+memory-mapped.
+
+Zoom tool contract: a ``RollupStore`` returns ``TimeseriesContent`` with
+``zoomTool`` set. When the user zooms, the view calls that tool with
+``{"start": <iso>, "end": <iso>, "maxPoints": <int>}`` and replaces its
+content with the result.
+
+Usage:
+    store = RollupStore(zoom_tool="zoom_metrics")
+    store.add("cpu", t, v, base=1.0)
+
+    @timeseries_tool(mcp, "zoom_metrics")
+    async def zoom_metrics(start: str, end: str, maxPoints: int = 1000):
+        return store.query(start, end, max_points=maxPoints)
+
+Requires NumPy (``pip install chuk-view-schemas[numpy]``).
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Literal, Optional, Union
+
+import numpy as np
+
+from ._arrays import TimeLike, epoch_array, iso_times, to_epoch
+from .timeseries import TimeseriesContent, TimeseriesDataPoint, TimeseriesSeries
+
+Stat = Literal["mean", "min", "max", "sum", "count"]
+
+_FIELDS = ("min", "max", "sum", "count")
+
+
+@dataclass
+class RollupLevel:
+    """Dense per-bucket aggregates for one pyramid level."""
+
+    min: np.ndarray
+    max: np.ndarray
+    sum: np.ndarray
+    count: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.count)
+
+
+class RollupPyramid:
+    """Power-of-two rollups of one series, starting at epoch ``t0``."""
+
+    def __init__(self, t0: float, base: float, levels: list[RollupLevel]) -> None:
+        self.t0 = t0
+        self.base = base
+        self.levels = levels
+
+    @classmethod
+    def from_arrays(cls, t: Any, v: Any, *, base: float = 1.0) -> RollupPyramid:
+        """Build a pyramid from raw samples.
+
+        Args:
+            t: Timestamps as epoch seconds or ``datetime64`` values.
+            v: Sample values; NaN samples are ignored.
+            base: Level-0 bucket width in seconds.
+        """
+        if base <= 0:
+            raise ValueError("base must be > 0")
+        t_s = epoch_array(t)
+        v = np.asarray(v, dtype=np.float64)
+        keep = np.isfinite(v)
+        t_s, v = t_s[keep], v[keep]
+        if t_s.size == 0:
+            raise ValueError("No finite samples to roll up")
+        order = np.argsort(t_s, kind="stable")
+        t_s, v = t_s[order], v[order]
+
+        t0 = float(np.floor(t_s[0] / base) * base)
+        ids = ((t_s - t0) // base).astype(np.int64)
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(ids)) + 1))
+        occupied = ids[starts]
+        n0 = int(occupied[-1]) + 1
+
+        level0 = RollupLevel(
+            min=np.full(n0, np.nan),
+            max=np.full(n0, np.nan),
+            sum=np.zeros(n0),
+            count=np.zeros(n0, dtype=np.uint32),
+        )
+        level0.min[occupied] = np.minimum.reduceat(v, starts)
+        level0.max[occupied] = np.maximum.reduceat(v, starts)
+        level0.sum[occupied] = np.add.reduceat(v, starts)
+        level0.count[occupied] = np.diff(np.append(starts, v.size))
+
+        levels = [level0]
+        while len(levels[-1]) > 1:
+            levels.append(_coarsen(levels[-1]))
+        return cls(t0, base, levels)
+
+    @property
+    def end(self) -> float:
+        return self.t0 + len(self.levels[0]) * self.base
+
+    def level_for(self, start: float, end: float, max_points: int) -> int:
+        """Finest level with at most ``max_points`` buckets in ``[start, end)``."""
+        span = max(end - start, self.base)
+        for k in range(len(self.levels)):
+            if span / (self.base * 2**k) <= max_points:
+                return k
+        return len(self.levels) - 1
+
+    def query(
+        self,
+        start: float,
+        end: float,
+        *,
+        max_points: int = 1000,
+        stat: Stat = "mean",
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Bucket start times and values for ``[start, end)``, empty buckets skipped."""
+        k = self.level_for(start, end, max_points)
+        level = self.levels[k]
+        width = self.base * 2**k
+        i0 = max(0, int((start - self.t0) // width))
+        i1 = min(len(level), int(np.ceil((end - self.t0) / width)))
+        if i1 <= i0:
+            return np.zeros(0), np.zeros(0)
+
+        count = level.count[i0:i1]
+        if stat == "mean":
+            with np.errstate(invalid="ignore", divide="ignore"):
+                values = level.sum[i0:i1] / count
+        else:
+            values = getattr(level, stat)[i0:i1]
+        nonempty = np.flatnonzero(count > 0)
+        times = self.t0 + (i0 + nonempty) * width
+        return times, np.asarray(values[nonempty], dtype=np.float64)
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the pyramid to a directory of ``.npy`` files."""
+        root = Path(path)
+        root.mkdir(parents=True, exist_ok=True)
+        meta = {"t0": self.t0, "base": self.base, "levels": len(self.levels)}
+        (root / "meta.json").write_text(json.dumps(meta))
+        for k, level in enumerate(self.levels):
+            for field in _FIELDS:
+                np.save(root / f"L{k}_{field}.npy", getattr(level, field))
+
+    @classmethod
+    def load(cls, path: Union[str, Path], *, mmap: bool = True) -> RollupPyramid:
+        """Load a saved pyramid, memory-mapped by default."""
+        root = Path(path)
+        meta = json.loads((root / "meta.json").read_text())
+        mode = "r" if mmap else None
+        levels = [
+            RollupLevel(
+                **{f: np.load(root / f"L{k}_{f}.npy", mmap_mode=mode) for f in _FIELDS}
+            )
+            for k in range(meta["levels"])
+        ]
+        return cls(meta["t0"], meta["base"], levels)
+
+
+class RollupStore:
+    """Named rollup pyramids served as ``TimeseriesContent`` windows."""
+
+    def __init__(
+        self,
+        *,
+        zoom_tool: Optional[str] = None,
+        title: Optional[str] = None,
+    ) -> None:
+        self.zoom_tool = zoom_tool
+        self.title = title
+        self.pyramids: dict[str, RollupPyramid] = {}
+        self.colors: dict[str, Optional[str]] = {}
+
+    def add(
+        self,
+        label: str,
+        t: Any,
+        v: Any,
+        *,
+        base: float = 1.0,
+        color: Optional[str] = None,
+    ) -> RollupPyramid:
+        pyramid = RollupPyramid.from_arrays(t, v, base=base)
+        self.add_pyramid(label, pyramid, color=color)
+        return pyramid
+
+    def add_pyramid(
+        self, label: str, pyramid: RollupPyramid, *, color: Optional[str] = None
+    ) -> None:
+        self.pyramids[label] = pyramid
+        self.colors[label] = color
+
+    def query(
+        self,
+        start: Optional[TimeLike] = None,
+        end: Optional[TimeLike] = None,
+        *,
+        max_points: int = 1000,
+        stat: Stat = "mean",
+        series: Optional[list[str]] = None,
+    ) -> TimeseriesContent:
+        """Return every (or the named) series for a time window.
+
+        ``start`` / ``end`` default to the full extent of the store and
+        accept ISO 8601 strings, epoch seconds, ``datetime`` or
+        ``datetime64`` values.
+        """
+        labels = series if series is not None else list(self.pyramids)
+        pyramids = [self.pyramids[label] for label in labels]
+        lo = to_epoch(start) if start is not None else min(p.t0 for p in pyramids)
+        hi = to_epoch(end) if end is not None else max(p.end for p in pyramids)
+
+        out = []
+        for label, pyramid in zip(labels, pyramids):
+            times, values = pyramid.query(lo, hi, max_points=max_points, stat=stat)
+            out.append(
+                TimeseriesSeries(
+                    label=label,
+                    color=self.colors.get(label),
+                    data=[
+                        TimeseriesDataPoint(t=t, v=v)
+                        for t, v in zip(iso_times(times), values.tolist())
+                    ],
+                )
+            )
+        return TimeseriesContent(title=self.title, series=out, zoom_tool=self.zoom_tool)
+
+
+# ---------------------------------------------------------------------------
+# Internals
+# ---------------------------------------------------------------------------
+
+
+def _coarsen(level: RollupLevel) -> RollupLevel:
+    n = len(level)
+    pad = n % 2
+
+    def pairs(a: np.ndarray, fill: Any) -> np.ndarray:
+        if pad:
+            a = np.append(a, np.asarray([fill], dtype=a.dtype))
+        return a.reshape(-1, 2)
+
+    with np.errstate(invalid="ignore"):
+        return RollupLevel(
+            min=np.fmin.reduce(pairs(level.min, np.nan), axis=1),
+            max=np.fmax.reduce(pairs(level.max, np.nan), axis=1),
+            sum=pairs(level.sum, 0).sum(axis=1),
+            count=pairs(level.count, 0).sum(axis=1, dtype=np.uint32),
+        )
@@ -0,0 +1,240 @@
+"""Build Sankey diagrams from event paths (user journeys, funnels).
+
+``SankeyBuilder`` counts transitions between consecutive states in hashed
+counters keyed by ``(step, from, to)``. Keying nodes by step as well as
+state breaks cycles: ``home -> search -> home`` becomes
+``0:home -> 1:search -> 2:home``, so the view's layering always sees a DAG.
+
+Input can be whole paths (``add_path``) or an interleaved event stream
+(``add_event``), which keeps only the current step and state of each open
+session. Memory is bounded:
+
+- ``max_steps`` truncates long paths
+- ``max_sessions`` caps open sessions (the least recently active are closed)
+- ``max_links`` caps distinct transitions. When it is exceeded, the
+  smallest transitions are redirected to the next step's "Other" node,
+  so the flow out of each node is kept; the inflow of the states they
+  pointed to is then undercounted by at most the folded amount.
+
+``build()`` merges nodes carrying less than ``min_value`` (or beyond
+``max_nodes_per_step``) into one "Other" node per step and re-aggregates
+their links. Small links disappear into "Other" while every node keeps
+its inflow equal to its outflow.
+
+"Other" is keyed by ``None`` rather than by its label, and its node id is
+``"<step>#other"`` (real states are ``"<step>:<state>"``), so a real state
+named "Other" stays a separate node.
+
+Usage:
+    builder = SankeyBuilder(max_steps=6)
+    for session_id, page in event_stream():
+        builder.add_event(session_id, page)
+    content = builder.build(min_value=100, title="Journeys")
+
+Pure Python — no external dependencies.
+"""
+
+from __future__ import annotations
+
+from collections import Counter, OrderedDict
+from typing import Hashable, Iterable, Optional, Sequence
+
+from .sankey import SankeyContent, SankeyLink, SankeyNode
+
+OTHER_LABEL = "Other"
+
+# A state of None is the step's synthetic "Other" node
+Node = tuple[int, Optional[str]]
+Transition = tuple[int, str, Optional[str]]
+
+
+class SankeyBuilder:
+    """Streaming transition counter for step-indexed Sankey diagrams.
+
+    Args:
+        max_steps: Transitions counted per path; later ones are dropped.
+        max_links: Distinct transitions kept before small ones are folded
+            into "Other".
+        max_sessions: Open sessions tracked by ``add_event``.
+        collapse_repeats: Treat consecutive repeats of a state (a page
+            reload) as one step.
+        other_label: Label shown on the merged node.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_steps: Optional[int] = None,
+        max_links: int = 100_000,
+        max_sessions: int = 100_000,
+        collapse_repeats: bool = True,
+        other_label: str = OTHER_LABEL,
+    ) -> None:
+        if max_links < 1:
+            raise ValueError("max_links must be >= 1")
+        self.max_steps = max_steps
+        self.max_links = max_links
+        self.max_sessions = max_sessions
+        self.collapse_repeats = collapse_repeats
+        self.other_label = other_label
+        self.counts: Counter[Transition] = Counter()
+        self.folded = 0.0
+        self._sessions: OrderedDict[Hashable, tuple[int, str]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def add_path(self, path: Sequence[str], weight: float = 1.0) -> None:
+        """Count every transition of one complete path."""
+        step, prev = 0, None
+        for state in path:
+            state = str(state)
+            if prev is None:
+                prev = state
+                continue
+            if self.collapse_repeats and state == prev:
+                continue
+            if self.max_steps is not None and step >= self.max_steps:
+                break
+            self._count((step, prev, state), weight)
+            step, prev = step + 1, state
+
+    def add_paths(self, paths: Iterable[Sequence[str]]) -> SankeyBuilder:
+        for path in paths:
+            self.add_path(path)
+        return self
+
+    def add_event(self, session: Hashable, state: str, weight: float = 1.0) -> None:
+        """Advance ``session`` to ``state``, counting the transition."""
+        state = str(state)
+        current = self._sessions.get(session)
+        if current is None:
+            self._sessions[session] = (0, state)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+            return
+        self._sessions.move_to_end(session)
+        step, prev = current
+        if self.collapse_repeats and state == prev:
+            return
+        if self.max_steps is not None and step >= self.max_steps:
+            return
+        self._count((step, prev, state), weight)
+        self._sessions[session] = (step + 1, state)
+
+    def close(self, session: Hashable) -> None:
+        """Forget a finished session (its transitions stay counted)."""
+        self._sessions.pop(session, None)
+
+    def build(
+        self,
+        *,
+        min_value: float = 0.0,
+        max_nodes_per_step: Optional[int] = None,
+        title: Optional[str] = None,
+    ) -> SankeyContent:
+        """Aggregate into ``SankeyContent``.
+
+        Args:
+            min_value: Nodes with less flow than this merge into their
+                step's "Other" node.
+            max_nodes_per_step: Keep at most this many nodes per step
+                (largest flow first); the rest merge into "Other".
+            title: Sankey title.
+        """
+        flow_in: Counter[Node] = Counter()
+        flow_out: Counter[Node] = Counter()
+        for (step, a, b), value in self.counts.items():
+            flow_out[(step, a)] += value
+            flow_in[(step + 1, b)] += value
+        throughput = {
+            node: max(flow_in[node], flow_out[node])
+            for node in flow_in.keys() | flow_out.keys()
+        }
+
+        by_step: dict[int, list[tuple[float, str]]] = {}
+        for (step, state), value in throughput.items():
+            if state is not None:
+                by_step.setdefault(step, []).append((value, state))
+        keep: set[Node] = set()
+        for step, items in by_step.items():
+            items.sort(key=lambda item: (-item[0], item[1]))
+            if max_nodes_per_step is not None:
+                items = items[:max_nodes_per_step]
+            keep.update((step, state) for value, state in items if value >= min_value)
+
+        def node_of(step: int, state: Optional[str]) -> Node:
+            return (step, state) if (step, state) in keep else (step, None)
+
+        links: Counter[tuple[Node, Node]] = Counter()
+        for (step, a, b), value in self.counts.items():
+            links[(node_of(step, a), node_of(step + 1, b))] += value
+
+        values: Counter[Node] = Counter()
+        for (src, dst), value in links.items():
+            values[src] += value
+            values[dst] += value
+        ordered = sorted(
+            values,
+            key=lambda node: (
+                node[0],
+                node[1] is None,
+                -throughput.get(node, 0),
+                node[1] or "",
+            ),
+        )
+        return SankeyContent(
+            title=title,
+            nodes=[
+                SankeyNode(
+                    id=_node_id(node),
+                    label=self.other_label if node[1] is None else node[1],
+                )
+                for node in ordered
+            ],
+            links=[
+                SankeyLink(source=_node_id(src), target=_node_id(dst), value=value)
+                for (src, dst), value in sorted(
+                    links.items(), key=lambda item: (item[0][0][0], -item[1])
+                )
+            ],
+        )
+
+    def _count(self, key: Transition, weight: float) -> None:
+        self.counts[key] += weight
+        if len(self.counts) > 2 * self.max_links:
+            self._compact()
+
+    def _compact(self) -> None:
+        """Fold all but the ``max_links`` largest transitions into "Other"."""
+        ranked = self.counts.most_common()
+        kept = Counter(dict(ranked[: self.max_links]))
+        for (step, a, _), value in ranked[self.max_links :]:
+            kept[(step, a, None)] += value
+            self.folded += value
+        self.counts = kept
+
+
+def sankey_from_paths(
+    paths: Iterable[Sequence[str]],
+    *,
+    min_value: float = 0.0,
+    max_steps: Optional[int] = None,
+    max_nodes_per_step: Optional[int] = None,
+    title: Optional[str] = None,
+) -> SankeyContent:
+    """``SankeyContent`` from complete paths in one call."""
+    builder = SankeyBuilder(max_steps=max_steps).add_paths(paths)
+    return builder.build(
+        min_value=min_value, max_nodes_per_step=max_nodes_per_step, title=title
+    )
+
+
+# ---------------------------------------------------------------------------
+# Internals
+# ---------------------------------------------------------------------------
+
+
+def _node_id(node: Node) -> str:
+    step, state = node
+    return f"{step}#other" if state is None else f"{step}:{state}"
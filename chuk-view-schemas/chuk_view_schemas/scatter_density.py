@@ -0,0 +1,255 @@
+"""Hexagonal / rectangular density binning for large scatter Views.
+
+Hundreds of thousands of ``ScatterPoint``s are too heavy to send or draw.
+``reduce_scatter()`` bins each dataset into 2-D cells once it passes a
+point threshold and returns either:
+
+- a reduced ``ScatterContent``: one point per dense cell at the centroid of
+  its points, labelled with the count, plus the raw points of sparse cells
+  (the outliers), or
+- a ``HeatmapContent`` of counts on a rectangular grid over all datasets.
+
+Binning is fully vectorized (hex cells use the two-offset-lattice method).
+``scatter_tool(..., density_threshold=N)`` applies the scatter reduction to
+tool results automatically.
+
+Usage:
+    content = reduce_scatter(content, threshold=20_000, gridsize=80)
+
+Requires NumPy (``pip install chuk-view-schemas[numpy]``).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Literal, Optional, Union
+
+import numpy as np
+
+from .heatmap import HeatmapContent
+from .scatter import ScatterContent
+
+BinKind = Literal["hex", "rect"]
+
+DEFAULT_THRESHOLD = 50_000
+
+
+@dataclass
+class DensityGrid:
+    """Occupied cells of a 2-D binning.
+
+    ``cell[i]`` is the cell index of input point ``i``; the other arrays
+    are per occupied cell.
+    """
+
+    cell: np.ndarray
+    counts: np.ndarray
+    center_x: np.ndarray
+    center_y: np.ndarray
+    mean_x: np.ndarray
+    mean_y: np.ndarray
+
+
+def density_grid(
+    x: Any,
+    y: Any,
+    *,
+    gridsize: int = 100,
+    kind: BinKind = "hex",
+    extent: Optional[tuple[float, float, float, float]] = None,
+) -> DensityGrid:
+    """Bin points into hexagonal or square-ish rectangular cells.
+
+    Args:
+        x, y: Point coordinates.
+        gridsize: Number of cells across the x extent.
+        kind: ``"hex"`` (regular hexagons) or ``"rect"``.
+        extent: ``(xmin, xmax, ymin, ymax)``; defaults to the data bounds.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if x.shape != y.shape:
+        raise ValueError("x and y must have the same length")
+    if gridsize < 1:
+        raise ValueError("gridsize must be >= 1")
+    if x.size == 0:
+        empty = np.zeros(0)
+        return DensityGrid(
+            np.zeros(0, dtype=np.int64), empty, empty, empty, empty, empty
+        )
+
+    xmin, xmax, ymin, _ = extent or (x.min(), x.max(), y.min(), y.max())
+    sx = (xmax - xmin) / gridsize or 1.0
+    if kind == "hex":
+        codes, cx_of, cy_of = _hex_codes(x, y, xmin, ymin, sx, gridsize)
+    elif kind == "rect":
+        codes, cx_of, cy_of = _rect_codes(x, y, xmin, ymin, sx, gridsize)
+    else:
+        raise ValueError(f"Unknown bin kind: {kind!r}")
+
+    cells, cell = np.unique(codes, return_inverse=True)
+    cell = cell.ravel()
+    counts = np.bincount(cell)
+    return DensityGrid(
+        cell=cell,
+        counts=counts,
+        center_x=cx_of(cells),
+        center_y=cy_of(cells),
+        mean_x=np.bincount(cell, weights=x) / counts,
+        mean_y=np.bincount(cell, weights=y) / counts,
+    )
+
+
+def reduce_scatter(
+    content: ScatterContent,
+    *,
+    threshold: int = DEFAULT_THRESHOLD,
+    gridsize: int = 100,
+    kind: BinKind = "hex",
+    outlier_count: int = 1,
+    output: Literal["scatter", "heatmap"] = "scatter",
+) -> Union[ScatterContent, HeatmapContent]:
+    """Replace a large scatter with density cells.
+
+    Args:
+        content: Scatter payload.
+        threshold: Total point count at or below which ``content`` is
+            returned unchanged.
+        gridsize: Cells across the x extent.
+        kind: Cell shape for scatter output (heatmaps are always ``rect``).
+        outlier_count: Cells with at most this many points keep their raw
+            points instead of a centroid.
+        output: ``"scatter"`` for centroids + outliers, ``"heatmap"`` for a
+            count grid over all datasets.
+    """
+    structured = content.model_dump(by_alias=True, exclude_none=True)
+    if output == "heatmap":
+        if _total_points(structured) <= threshold:
+            return content
+        return _heatmap(structured, gridsize)
+    return ScatterContent.model_validate(
+        reduce_scatter_structured(
+            structured,
+            threshold,
+            gridsize=gridsize,
+            kind=kind,
+            outlier_count=outlier_count,
+        )
+    )
+
+
+def reduce_scatter_structured(
+    structured: dict[str, Any],
+    threshold: int = DEFAULT_THRESHOLD,
+    *,
+    gridsize: int = 100,
+    kind: BinKind = "hex",
+    outlier_count: int = 1,
+) -> dict[str, Any]:
+    """Centroid + outlier reduction of a serialized scatter payload.
+
+    Non-scatter payloads, and scatters at or below ``threshold`` points,
+    are returned unchanged. The input dict is not modified.
+    """
+    if structured.get("type") != "scatter" or _total_points(structured) <= threshold:
+        return structured
+    all_x, all_y = _xy(
+        [p for ds in structured["datasets"] for p in ds.get("points", [])]
+    )
+    extent = (all_x.min(), all_x.max(), all_y.min(), all_y.max())
+
+    datasets = []
+    for ds in structured["datasets"]:
+        points = ds.get("points", [])
+        if not points:
+            datasets.append(ds)
+            continue
+        x, y = _xy(points)
+        grid = density_grid(x, y, gridsize=gridsize, kind=kind, extent=extent)
+        sparse = grid.counts[grid.cell] <= outlier_count
+        reduced = [points[i] for i in np.flatnonzero(sparse).tolist()]
+        dense = np.flatnonzero(grid.counts > outlier_count)
+        reduced.extend(
+            {"x": mx, "y": my, "label": f"{n} points"}
+            for mx, my, n in zip(
+                grid.mean_x[dense].tolist(),
+                grid.mean_y[dense].tolist(),
+                grid.counts[dense].tolist(),
+            )
+        )
+        datasets.append({**ds, "points": reduced})
+    return {**structured, "datasets": datasets}
+
+
+# ---------------------------------------------------------------------------
+# Internals
+# ---------------------------------------------------------------------------
+
+
+def _total_points(structured: dict[str, Any]) -> int:
+    return sum(len(ds.get("points", [])) for ds in structured.get("datasets", []))
+
+
+def _xy(points: list[dict[str, Any]]) -> tuple[np.ndarray, np.ndarray]:
+    n = len(points)
+    x = np.fromiter((p["x"] for p in points), dtype=float, count=n)
+    y = np.fromiter((p["y"] for p in points), dtype=float, count=n)
+    return x, y
+
+
+def _hex_codes(
+    x: np.ndarray, y: np.ndarray, xmin: float, ymin: float, sx: float, nx: int
+) -> tuple[np.ndarray, Any, Any]:
+    # Two rectangular lattices, the second offset by half a cell in both
+    # directions; each point goes to the nearer lattice centre. With a
+    # vertical spacing of sqrt(3) * sx the Voronoi cells are regular hexagons.
+    sy = sx * np.sqrt(3)
+    u = (x - xmin) / sx
+    w = (y - ymin) / sy
+    i1, j1 = np.round(u), np.round(w)
+    i2, j2 = np.floor(u), np.floor(w)
+    d1 = ((u - i1) * sx) ** 2 + ((w - j1) * sy) ** 2
+    d2 = ((u - i2 - 0.5) * sx) ** 2 + ((w - j2 - 0.5) * sy) ** 2
+    second = d2 < d1
+    i = np.where(second, i2, i1).astype(np.int64)
+    j = np.where(second, j2, j1).astype(np.int64)
+    ncols = nx + 2
+    codes = (j * ncols + i) * 2 + second
+
+    def cx(c: np.ndarray) -> np.ndarray:
+        return xmin + ((c // 2) % ncols + 0.5 * (c % 2)) * sx
+
+    def cy(c: np.ndarray) -> np.ndarray:
+        return ymin + ((c // 2) // ncols + 0.5 * (c % 2)) * sy
+
+    return codes, cx, cy
+
+
+def _rect_codes(
+    x: np.ndarray, y: np.ndarray, xmin: float, ymin: float, sx: float, nx: int
+) -> tuple[np.ndarray, Any, Any]:
+    i = np.clip(((x - xmin) // sx).astype(np.int64), 0, nx - 1)
+    j = np.maximum(((y - ymin) // sx).astype(np.int64), 0)
+    codes = j * nx + i
+
+    def cx(c: np.ndarray) -> np.ndarray:
+        return xmin + (c % nx + 0.5) * sx
+
+    def cy(c: np.ndarray) -> np.ndarray:
+        return ymin + (c // nx + 0.5) * sx
+
+    return codes, cx, cy
+
+
+def _heatmap(structured: dict[str, Any], gridsize: int) -> HeatmapContent:
+    x, y = _xy([p for ds in structured["datasets"] for p in ds.get("points", [])])
+    counts, x_edges, y_edges = np.histogram2d(x, y, bins=gridsize)
+    x_mid = (x_edges[:-1] + x_edges[1:]) / 2
+    y_mid = (y_edges[:-1] + y_edges[1:]) / 2
+    # Rows run top to bottom, so the highest y comes first
+    return HeatmapContent(
+        title=structured.get("title"),
+        rows=[f"{v:.4g}" for v in y_mid[::-1].tolist()],
+        columns=[f"{v:.4g}" for v in x_mid.tolist()],
+        values=counts.T[::-1].tolist(),
+    )
@@ -13,3 +13,4 @@ class TerminalContent(BaseModel):
     version: Literal["1.0"] = "1.0"
     title: Optional[str] = None
     lines: List[TerminalLine]
+    pending: Optional[List[TerminalLine]] = None
@@ -0,0 +1,361 @@
+"""Stream process output into terminal Views as compact append patches.
+
+``TerminalStream`` interprets raw output the way a terminal would, per
+stream (stdout / stderr / stdin echo), before anything is sent:
+
+- ``\\r`` returns to the start of the line, so the next text overwrites
+  it. A progress bar redrawn 10,000 times is one line, not 10,000.
+- ``\\b``, ``\\t``, erase-in-line (``ESC[K``, ``ESC[1K``, ``ESC[2K``) and
+  horizontal cursor moves (``ESC[nC``, ``ESC[nD``, ``ESC[nG``) edit the
+  current line
+- SGR colour sequences (``ESC[...m``) are kept for the view to render.
+  The colour state is stored per cell, so overwritten text keeps its
+  colour and each line is re-emitted with the transitions it needs.
+  Other escape sequences (vertical cursor moves, screen clears, OSC
+  titles) and control characters are dropped.
+- Escape sequences and UTF-8 characters split across ``write()`` calls
+  are reassembled. An OSC string still open at a newline is dropped, and
+  an unfinished sequence keeps at most ``_MAX_CARRY`` characters.
+
+Finished lines go into a scrollback ring buffer of ``scrollback`` lines;
+lines still being written (the progress bar) are kept per stream as
+``pending``. Output is coalesced: consecutive finished lines from the same
+stream are sent as one ``TerminalLine`` joined by ``\\n`` (at most
+``max_chunk_lines`` per line), each chunk starting with the colour state
+in effect.
+
+``patch()`` returns at most one ``ui_patch`` per ``min_interval``: an
+append op with the lines finished since the last patch, and a merge op
+replacing ``pending`` when it changed.
+
+Usage:
+    term = TerminalStream("build-log", min_interval=0.5)
+    content = term.snapshot()
+    async for chunk, stream in run(cmd):
+        term.write(chunk, stream)
+        if (patch := term.patch()) is not None:
+            await send(patch.model_dump(by_alias=True, exclude_none=True))
+    term.close()
+    await send(term.patch(force=True).model_dump(by_alias=True, exclude_none=True))
+
+Pure Python — no external dependencies.
+"""
+
+from __future__ import annotations
+
+import codecs
+import re
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Literal, Optional, Union
+
+from .patch import UIPatch, UpdatePanelOp
+from .terminal import TerminalContent, TerminalLine
+
+Stream = Literal["stdin", "stdout", "stderr"]
+
+# One control token: CSI sequence, OSC string (ended by BEL / ST, or
+# abandoned at a newline), other ESC pair, or C0 control
+_CONTROL = re.compile(
+    r"(\x1b\[[0-?]*[ -/]*[@-~]"
+    r"|\x1b\][^\x07\x1b\n]*(?:\x07|\x1b\\|(?=\n))"
+    r"|\x1b[@-Z\\-_]"
+    r"|[\x00-\x1f\x7f])"
+)
+# An escape sequence cut off at the end of a chunk
+_INCOMPLETE = re.compile(r"\x1b(?:\[[0-?]*[ -/]*|\][^\x07\x1b\n]*\x1b?)?$")
+
+_TAB = 8
+_MAX_SGR = 16  # colour sequences remembered for chunk prefixes
+_MAX_CARRY = 4096  # characters of an unfinished escape sequence kept
+_RESET = "\x1b[0m"
+
+
+@dataclass
+class _Line:
+    seq: int
+    stream: Stream
+    text: str
+    prefix: str  # SGR state at the start of the line
+
+
+@dataclass
+class _Cursor:
+    """Line being written on one stream."""
+
+    cells: list[str] = field(default_factory=list)
+    styles: list[str] = field(default_factory=list)  # SGR state per cell
+    col: int = 0
+    active: list[str] = field(default_factory=list)  # SGR state now
+    prefix: str = ""  # SGR state when the line started
+    carry: str = ""  # incomplete escape sequence from the last chunk
+
+    def text(self) -> str:
+        """Cells with SGR transitions, ending in the current state."""
+        out = [self.prefix]
+        state = self.prefix
+        n = len("".join(self.cells).rstrip(" "))
+        for char, style in zip(self.cells[:n], self.styles[:n]):
+            if style != state:
+                out.append(_transition(state, style))
+                state = style
+            out.append(char)
+        now = "".join(self.active)
+        if now != state:
+            out.append(_transition(state, now))
+        return "".join(out)
+
+
+class TerminalStream:
+    """Terminal emulation, scrollback and patches for one panel.
+
+    Args:
+        panel_id: Dashboard panel the patches target.
+        scrollback: Finished lines kept.
+        max_chunk_lines: Lines coalesced into one ``TerminalLine``.
+        min_interval: Minimum seconds between emitted patches.
+        title: Terminal title for ``snapshot()``.
+        clock: Monotonic clock, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        panel_id: str = "terminal",
+        *,
+        scrollback: int = 10_000,
+        max_chunk_lines: int = 200,
+        min_interval: float = 0.25,
+        title: Optional[str] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if scrollback < 1 or max_chunk_lines < 1:
+            raise ValueError("scrollback and max_chunk_lines must be >= 1")
+        self.panel_id = panel_id
+        self.scrollback = scrollback
+        self.max_chunk_lines = max_chunk_lines
+        self.min_interval = min_interval
+        self.title = title
+        self._clock = clock
+        self._lines: deque[_Line] = deque(maxlen=scrollback)
+        self._cursors: dict[Stream, _Cursor] = {}
+        self._decoders: dict[Stream, codecs.IncrementalDecoder] = {}
+        self._seq = 0
+        self._sent = 0  # lines with seq below this have been sent
+        self._pending_sent: list[TerminalLine] = []
+        self._last_emit: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    @property
+    def lines(self) -> list[str]:
+        """Finished lines in the scrollback, oldest first."""
+        return [line.text for line in self._lines]
+
+    def write(self, data: Union[str, bytes], stream: Stream = "stdout") -> None:
+        """Feed raw output; ``bytes`` are decoded as UTF-8."""
+        if isinstance(data, bytes):
+            decoder = self._decoders.get(stream)
+            if decoder is None:
+                decoder = self._decoders[stream] = codecs.getincrementaldecoder(
+                    "utf-8"
+                )(errors="replace")
+            data = decoder.decode(data)
+        cursor = self._cursors.setdefault(stream, _Cursor())
+        data = cursor.carry + data
+        cursor.carry = ""
+        cut = _INCOMPLETE.search(data)
+        if cut is not None:
+            cursor.carry, data = data[cut.start() :], data[: cut.start()]
+            if len(cursor.carry) > _MAX_CARRY:
+                # Keep the sequence open but drop its body
+                cursor.carry = cursor.carry[:2]
+
+        parts = _CONTROL.split(data)
+        for i, part in enumerate(parts):
+            if not part:
+                continue
+            if i % 2 == 0:
+                self._put(cursor, part)
+            else:
+                self._control(cursor, part, stream)
+
+    def close(self, stream: Optional[Stream] = None) -> None:
+        """Finish the pending line of ``stream`` (or of every stream)."""
+        for name in [stream] if stream else list(self._cursors):
+            cursor = self._cursors.get(name)
+            if cursor is None:
+                continue
+            cursor.carry = ""
+            if cursor.cells or "".join(cursor.active) != cursor.prefix:
+                self._commit(cursor, name)
+
+    def snapshot(self) -> TerminalContent:
+        """Scrollback and pending lines (the initial payload)."""
+        self._sent = self._seq
+        self._pending_sent = self._pending()
+        self._last_emit = self._clock()
+        return TerminalContent(
+            title=self.title,
+            lines=self._coalesce(list(self._lines)),
+            pending=self._pending_sent or None,
+        )
+
+    def patch(self, *, force: bool = False) -> Optional[UIPatch]:
+        """Append op for newly finished lines plus a ``pending`` update, or None.
+
+        Returns None when nothing changed or ``min_interval`` has not yet
+        elapsed since the last emit (unless ``force``).
+        """
+        now = self._clock()
+        if (
+            not force
+            and self._last_emit is not None
+            and now - self._last_emit < self.min_interval
+        ):
+            return None
+        new = self._unsent()
+        pending = self._pending()
+        if not new and pending == self._pending_sent:
+            return None
+        self._last_emit = now
+        self._sent = self._seq
+        ops = []
+        if new:
+            chunk = [line.model_dump(exclude_none=True) for line in self._coalesce(new)]
+            ops.append(
+                UpdatePanelOp(
+                    panel_id=self.panel_id,
+                    action="append",
+                    target_field="lines",
+                    data={"lines": chunk},
+                )
+            )
+        if pending != self._pending_sent:
+            self._pending_sent = pending
+            ops.append(
+                UpdatePanelOp(
+                    panel_id=self.panel_id,
+                    action="merge",
+                    data={
+                        "pending": [p.model_dump(exclude_none=True) for p in pending]
+                    },
+                )
+            )
+        return UIPatch(ops=ops)
+
+    def _put(self, cursor: _Cursor, text: str) -> None:
+        cells, styles = cursor.cells, cursor.styles
+        col = cursor.col
+        if col > len(cells):
+            styles.extend([""] * (col - len(cells)))
+            cells.extend(" " * (col - len(cells)))
+        cells[col : col + len(text)] = text
+        styles[col : col + len(text)] = ["".join(cursor.active)] * len(text)
+        cursor.col = col + len(text)
+
+    def _control(self, cursor: _Cursor, token: str, stream: Stream) -> None:
+        if token == "\n":
+            self._commit(cursor, stream)
+        elif token == "\r":
+            cursor.col = 0
+        elif token == "\b":
+            cursor.col = max(0, cursor.col - 1)
+        elif token == "\t":
+            self._put(cursor, " " * (_TAB - cursor.col % _TAB))
+        elif token.startswith("\x1b[") and len(token) > 2:
+            final, params = token[-1], token[2:-1]
+            if final == "m":
+                _track_sgr(cursor.active, token, params)
+            elif final == "K":
+                if params in ("", "0"):
+                    del cursor.cells[cursor.col :]
+                    del cursor.styles[cursor.col :]
+                elif params == "1":
+                    n = min(cursor.col + 1, len(cursor.cells))
+                    cursor.cells[:n] = " " * n
+                    cursor.styles[:n] = [""] * n
+                elif params == "2":
+                    n = min(cursor.col, len(cursor.cells))
+                    cursor.cells[:] = " " * n
+                    cursor.styles[:] = [""] * n
+            elif final in "CDG" and (params.isdigit() or params == ""):
+                n = int(params or 1)
+                if final == "C":
+                    cursor.col += n
+                elif final == "D":
+                    cursor.col = max(0, cursor.col - n)
+                elif final == "G":
+                    cursor.col = max(0, n - 1)
+
+    def _commit(self, cursor: _Cursor, stream: Stream) -> None:
+        self._lines.append(_Line(self._seq, stream, cursor.text(), cursor.prefix))
+        self._seq += 1
+        cursor.cells = []
+        cursor.styles = []
+        cursor.col = 0
+        cursor.prefix = "".join(cursor.active)
+
+    def _unsent(self) -> list[_Line]:
+        """Lines finished since the last emit, read from the newest end."""
+        new = []
+        for line in reversed(self._lines):
+            if line.seq < self._sent:
+                break
+            new.append(line)
+        new.reverse()
+        return new
+
+    def _pending(self) -> list[TerminalLine]:
+        return [
+            TerminalLine(text=cursor.text(), type=stream)
+            for stream, cursor in self._cursors.items()
+            if cursor.cells
+        ]
+
+    def _coalesce(self, lines: list[_Line]) -> list[TerminalLine]:
+        out: list[TerminalLine] = []
+        run: list[_Line] = []
+
+        def flush() -> None:
+            if run:
+                # The first line carries its prefix; the rest continue it
+                texts = [run[0].text] + [
+                    line.text[len(line.prefix) :] for line in run[1:]
+                ]
+                out.append(TerminalLine(text="\n".join(texts), type=run[0].stream))
+                run.clear()
+
+        for line in lines:
+            if run and (
+                line.stream != run[0].stream or len(run) >= self.max_chunk_lines
+            ):
+                flush()
+            run.append(line)
+        flush()
+        return out
+
+
+# ---------------------------------------------------------------------------
+# Internals
+# ---------------------------------------------------------------------------
+
+
+def _transition(state: str, style: str) -> str:
+    """SGR moving from ``state`` to ``style`` (both joined SGR sequences)."""
+    if style.startswith(state):
+        return style[len(state) :]
+    return _RESET + style
+
+
+def _track_sgr(active: list[str], token: str, params: str) -> None:
+    """Update the SGR state after ``token``; a reset clears it."""
+    codes = params.split(";")
+    if codes[0] in ("", "0"):
+        active.clear()
+        if len(codes) > 1:
+            active.append(f"\x1b[{';'.join(codes[1:])}m")
+        return
+    active.append(token)
+    del active[:-_MAX_SGR]
@@ -0,0 +1,428 @@
+"""Incremental full-text search for log and datatable search tools.
+
+``TextIndex`` is an inverted index built as documents arrive: each new
+document appends its id to the postings of every distinct term it
+contains, so postings stay sorted without rework. Terms are lower-cased
+``\\w+`` runs. Queries are AND-ed clauses:
+
+- ``timeout``: a term
+- ``time*``: a prefix, expanded over the sorted vocabulary (the
+  ``max_expansions`` most frequent terms)
+- ``"connection reset"``: a phrase; the postings are intersected first,
+  then candidates are checked for the terms in sequence. Unquoted words
+  that split into several terms (``disk-full``) are phrases too.
+
+Matching walks the shortest clause newest-first, probing the others by
+bisection, and stops after ``limit`` hits, so a query costs about
+O(limit * clauses * log n) rather than a scan. Hits carry highlight spans:
+``[start, end)`` character ranges of the matched terms in each field.
+
+``LogSearch`` indexes ``LogEntry`` ``message`` and ``source``;
+``TableSearch`` indexes the text columns of datatable rows.
+
+Search tool contract: the returned content has ``searchTool`` set. The
+view calls it with ``{"query": <str>, "limit": <int>}`` and shows the
+result, which holds only the matches with their highlights (``LogEntry
+.highlights`` over ``message``, or ``DataTableContent.highlights``: one
+``{column: spans}`` map per row).
+
+Usage:
+    search = LogSearch(search_tool="search_log")
+    search.extend(tail.poll())
+
+    @log_tool(mcp, "search_log")
+    async def search_log(query: str, limit: int = 200):
+        return search.search(query, limit=limit)
+
+Pure Python — no external dependencies.
+"""
+
+from __future__ import annotations
+
+import heapq
+import re
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Any, Collection, Iterable, Iterator, Optional, Sequence
+
+from .datatable import Column, DataTableContent
+from .log import LogContent, LogEntry
+
+Span = tuple[int, int]
+
+_TOKEN = re.compile(r"\w+")
+_QUERY = re.compile(r'"([^"]*)"|(\S+)')
+
+# Column types whose values are searchable text
+TEXT_COLUMN_TYPES = (None, "text", "link", "badge")
+
+
+def tokenize(text: str) -> list[tuple[str, int, int]]:
+    """Lower-cased terms with their ``[start, end)`` character spans."""
+    return [(m.group().lower(), m.start(), m.end()) for m in _TOKEN.finditer(text)]
+
+
+@dataclass
+class Clause:
+    """One query clause: consecutive ``terms``, the last one a prefix if set."""
+
+    terms: tuple[str, ...]
+    prefix: bool = False
+
+
+def parse_query(query: str) -> list[Clause]:
+    """Split a query into AND-ed clauses."""
+    clauses = []
+    for phrase, word in _QUERY.findall(query):
+        text = phrase or word
+        terms = tuple(t for t, _, _ in tokenize(text))
+        if terms:
+            prefix = not phrase and text.endswith("*")
+            clauses.append(Clause(terms, prefix))
+    return clauses
+
+
+@dataclass
+class SearchHit:
+    doc: int
+    highlights: dict[str, list[Span]] = field(default_factory=dict)
+
+
+class TextIndex:
+    """Append-only inverted index over named text fields.
+
+    Args:
+        fields: Names of the fields of each document.
+        max_expansions: Vocabulary terms a prefix clause expands to.
+    """
+
+    def __init__(self, fields: Sequence[str], *, max_expansions: int = 64) -> None:
+        self.fields = tuple(fields)
+        self.max_expansions = max_expansions
+        self.texts: list[tuple[str, ...]] = []
+        self.postings: dict[str, array] = {}
+        self._vocabulary: list[str] = []
+        self._unsorted: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def add(self, texts: Sequence[Optional[str]]) -> int:
+        """Index one document (one text per field); returns its id."""
+        doc = len(self.texts)
+        values = tuple(t or "" for t in texts)
+        if len(values) != len(self.fields):
+            raise ValueError(f"Expected {len(self.fields)} fields, got {len(values)}")
+        self.texts.append(values)
+        seen = set()
+        for text in values:
+            seen.update(term for term, _, _ in tokenize(text))
+        postings = self.postings
+        for term in seen:
+            ids = postings.get(term)
+            if ids is None:
+                ids = postings[term] = array("I")
+                self._unsorted.append(term)
+            ids.append(doc)
+        return doc
+
+    def search(self, query: str, *, limit: int = 100) -> list[SearchHit]:
+        """Newest documents matching every clause, with highlights."""
+        clauses = parse_query(query)
+        if not clauses or limit <= 0:
+            return []
+        lists = [self._clause_postings(c) for c in clauses]
+        if any(not ids for ids in lists):
+            return []
+        order = sorted(range(len(clauses)), key=lambda i: _size(lists[i]))
+        driver, others = lists[order[0]], [lists[i] for i in order[1:]]
+        phrases = [c for c in clauses if len(c.terms) > 1]
+
+        hits = []
+        for doc in _descending(driver):
+            if not all(_contains(ids, doc) for ids in others):
+                continue
+            highlights = self._highlight(doc, clauses, phrases)
+            if highlights is None:
+                continue
+            hits.append(SearchHit(doc, highlights))
+            if len(hits) >= limit:
+                break
+        return hits
+
+    def terms(self, prefix: str) -> list[str]:
+        """Vocabulary terms starting with ``prefix``, sorted."""
+        self._sort_vocabulary()
+        vocab = self._vocabulary
+        out = []
+        for i in range(bisect_left(vocab, prefix), len(vocab)):
+            if not vocab[i].startswith(prefix):
+                break
+            out.append(vocab[i])
+        return out
+
+    def _sort_vocabulary(self) -> None:
+        if self._unsorted:
+            # Two sorted runs: Timsort merges them in linear time
+            self._vocabulary = sorted(self._vocabulary + sorted(self._unsorted))
+            self._unsorted = []
+
+    def _clause_postings(self, clause: Clause) -> list[array]:
+        """Per-term postings of a clause; the prefix term may expand to several."""
+        out = []
+        for i, term in enumerate(clause.terms):
+            if clause.prefix and i == len(clause.terms) - 1:
+                expansions = self._expand(term)
+                if not expansions:
+                    return []
+                out.append(expansions)
+            else:
+                ids = self.postings.get(term)
+                if ids is None:
+                    return []
+                out.append([ids])
+        return out
+
+    def _expand(self, prefix: str) -> list[array]:
+        terms = self.terms(prefix)
+        if len(terms) > self.max_expansions:
+            terms = heapq.nlargest(
+                self.max_expansions, terms, key=lambda t: len(self.postings[t])
+            )
+        return [self.postings[t] for t in terms]
+
+    def _highlight(
+        self, doc: int, clauses: list[Clause], phrases: list[Clause]
+    ) -> Optional[dict[str, list[Span]]]:
+        """Spans of the query terms per field; ``None`` if a phrase is absent."""
+        tokens = [tokenize(text) for text in self.texts[doc]]
+        spans: dict[str, list[Span]] = {}
+        found = set()
+        for name, toks in zip(self.fields, tokens):
+            words = [t for t, _, _ in toks]
+            matched: list[Span] = []
+            for clause in clauses:
+                n = len(clause.terms)
+                for i in range(len(words) - n + 1):
+                    if _match_at(words, i, clause):
+                        found.add(id(clause))
+                        # A phrase is one span, separators included
+                        matched.append((toks[i][1], toks[i + n - 1][2]))
+            if matched:
+                spans[name] = _merge(sorted(matched))
+        if any(id(c) not in found for c in phrases):
+            return None
+        return spans
+
+
+class LogSearch:
+    """Search over ``LogEntry`` messages and sources.
+
+    Entries are stored compactly and rebuilt for the hits.
+    """
+
+    def __init__(
+        self,
+        *,
+        title: Optional[str] = None,
+        search_tool: Optional[str] = None,
+        max_expansions: int = 64,
+    ) -> None:
+        self.title = title
+        self.search_tool = search_tool
+        self.index = TextIndex(("message", "source"), max_expansions=max_expansions)
+        self._meta: list[tuple[Optional[str], Optional[str], str]] = []
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def add(self, entry: LogEntry) -> None:
+        self.index.add((entry.message, entry.source))
+        self._meta.append((entry.id, entry.timestamp, entry.level))
+
+    def extend(self, entries: Iterable[LogEntry]) -> LogSearch:
+        for entry in entries:
+            self.add(entry)
+        return self
+
+    def search(
+        self,
+        query: str,
+        *,
+        limit: int = 200,
+        levels: Optional[Collection[str]] = None,
+    ) -> LogContent:
+        """Matching entries, oldest first, with message highlights.
+
+        ``levels`` keeps only those levels; the newest ``limit`` matches
+        are returned.
+        """
+        hits = []
+        step = limit
+        while True:
+            found = self.index.search(query, limit=step)
+            hits = [
+                h for h in found if levels is None or self._meta[h.doc][2] in levels
+            ]
+            if len(hits) >= limit or len(found) < step:
+                break
+            step *= 4  # level filter rejected too many: look further back
+        entries = []
+        for hit in reversed(hits[:limit]):
+            entry_id, timestamp, level = self._meta[hit.doc]
+            message, source = self.index.texts[hit.doc]
+            entries.append(
+                LogEntry(
+                    id=entry_id,
+                    timestamp=timestamp,
+                    level=level,
+                    message=message,
+                    source=source or None,
+                    highlights=[list(s) for s in hit.highlights.get("message", [])]
+                    or None,
+                )
+            )
+        return LogContent(
+            title=self.title,
+            searchable=True,
+            entries=entries,
+            search_tool=self.search_tool,
+        )
+
+
+class TableSearch:
+    """Search over the text columns of datatable rows.
+
+    Args:
+        columns: Table columns.
+        text_columns: Keys to index; defaults to columns whose type is
+            text, link, badge or unset.
+    """
+
+    def __init__(
+        self,
+        columns: Sequence[Column],
+        *,
+        text_columns: Optional[Sequence[str]] = None,
+        title: Optional[str] = None,
+        search_tool: Optional[str] = None,
+        max_expansions: int = 64,
+    ) -> None:
+        self.columns = list(columns)
+        self.title = title
+        self.search_tool = search_tool
+        if text_columns is None:
+            text_columns = [c.key for c in columns if c.type in TEXT_COLUMN_TYPES]
+        self.index = TextIndex(text_columns, max_expansions=max_expansions)
+        self.rows: list[dict[str, Any]] = []
+
+    @classmethod
+    def from_content(
+        cls, content: DataTableContent, *, search_tool: Optional[str] = None
+    ) -> TableSearch:
+        table = cls(
+            content.columns,
+            title=content.title,
+            search_tool=search_tool or content.search_tool,
+        )
+        return table.extend(content.rows)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def add(self, row: dict[str, Any]) -> None:
+        self.index.add([_text(row.get(key)) for key in self.index.fields])
+        self.rows.append(row)
+
+    def extend(self, rows: Iterable[dict[str, Any]]) -> TableSearch:
+        for row in rows:
+            self.add(row)
+        return self
+
+    def search(self, query: str, *, limit: int = 100) -> DataTableContent:
+        """Matching rows, in insertion order, with per-column highlights."""
+        hits = list(reversed(self.index.search(query, limit=limit)))
+        return DataTableContent(
+            title=self.title,
+            columns=self.columns,
+            rows=[self.rows[h.doc] for h in hits],
+            search_tool=self.search_tool,
+            highlights=[
+                {k: [list(s) for s in spans] for k, spans in h.highlights.items()}
+                for h in hits
+            ],
+        )
+
+
+# ---------------------------------------------------------------------------
+# Internals
+# ---------------------------------------------------------------------------
+
+
+def _size(lists: list[list[array]]) -> int:
+    """Upper bound on a clause's matches: its rarest term's postings."""
+    return min(sum(len(ids) for ids in alternatives) for alternatives in lists)
+
+
+def _descending(lists: list[list[array]]) -> Iterator[int]:
+    """Documents of a clause, newest first."""
+    # Drive by the rarest term; the clause's other terms are probed
+    alternatives = min(lists, key=lambda alts: sum(len(ids) for ids in alts))
+    rest = [alts for alts in lists if alts is not alternatives]
+    if len(alternatives) == 1:
+        docs: Iterable[int] = reversed(alternatives[0])
+    else:
+        docs = _dedupe(
+            heapq.merge(*(reversed(ids) for ids in alternatives), reverse=True)
+        )
+    for doc in docs:
+        if all(_in_any(alts, doc) for alts in rest):
+            yield doc
+
+
+def _contains(lists: list[list[array]], doc: int) -> bool:
+    return all(_in_any(alts, doc) for alts in lists)
+
+
+def _in_any(alternatives: list[array], doc: int) -> bool:
+    for ids in alternatives:
+        i = bisect_left(ids, doc)
+        if i < len(ids) and ids[i] == doc:
+            return True
+    return False
+
+
+def _dedupe(docs: Iterable[int]) -> Iterator[int]:
+    last = None
+    for doc in docs:
+        if doc != last:
+            yield doc
+            last = doc
+
+
+def _match_at(words: list[str], i: int, clause: Clause) -> bool:
+    n = len(clause.terms)
+    for j, term in enumerate(clause.terms):
+        word = words[i + j]
+        if clause.prefix and j == n - 1:
+            if not word.startswith(term):
+                return False
+        elif word != term:
+            return False
+    return True
+
+
+def _merge(spans: list[Span]) -> list[Span]:
+    """Join overlapping or touching sorted spans."""
+    out: list[Span] = []
+    for start, end in spans:
+        if out and start <= out[-1][1]:
+            out[-1] = (out[-1][0], max(out[-1][1], end))
+        else:
+            out.append((start, end))
+    return out
+
+
+def _text(value: Any) -> str:
+    return "" if value is None else str(value)
@@ -31,5 +31,10 @@ class TimeseriesContent(BaseModel):
     x_axis: Optional[TimeseriesAxisLabel] = Field(None, alias="xAxis")
     y_axis: Optional[TimeseriesYAxis] = Field(None, alias="yAxis")
     series: List[TimeseriesSeries]
+    # Live streams: samples appended after ``series`` (per label, in order),
+    # with at most ``window`` points kept per series
+    appended: Optional[List[TimeseriesSeries]] = None
+    window: Optional[int] = None
+    zoom_tool: Optional[str] = Field(None, alias="zoomTool")
 
     model_config = {"populate_by_name": True}
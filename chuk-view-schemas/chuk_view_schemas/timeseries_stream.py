@@ -0,0 +1,225 @@
+"""Live sliding-window timeseries for dashboard panels.
+
+``TimeseriesStream`` keeps the last ``window`` samples of each series in a
+fixed-size NumPy ring buffer, so memory per series is bounded no matter how
+long the stream runs. ``snapshot()`` gives the initial ``TimeseriesContent``;
+``patch()`` then returns a ``ui_patch`` with only the samples pushed since
+the last emit, at most once per ``min_interval`` seconds.
+
+The dashboard patch engine appends only to top-level fields, while samples
+live in ``series[i].data``. New samples are therefore appended to the
+top-level ``appended`` list as one ``TimeseriesSeries`` batch per changed
+series; the view folds each batch into the series with the same label and
+keeps the last ``window`` points. Once the appended batches hold a full
+window's worth of samples for some series, the next patch compacts instead: it replaces
+``series`` with the current windows and clears ``appended``. The patch
+size stays proportional to the new samples, plus one full window per
+``window`` samples.
+
+Usage:
+    stream = TimeseriesStream("cpu-panel", window=600, min_interval=2.0)
+    stream.push("cpu", time.time(), cpu_percent())
+    ...
+    if (patch := stream.patch()) is not None:
+        await send(patch.model_dump(by_alias=True, exclude_none=True))
+
+Requires NumPy (``pip install chuk-view-schemas[numpy]``).
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+from ._arrays import epoch_array, iso_times, to_epoch
+from .patch import UIPatch, UpdatePanelOp
+from .timeseries import TimeseriesContent, TimeseriesDataPoint, TimeseriesSeries
+
+
+class RingBuffer:
+    """Fixed-capacity (t, v) buffer that overwrites its oldest samples."""
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.capacity = capacity
+        self.t = np.empty(capacity)
+        self.v = np.empty(capacity)
+        self.head = 0  # next write position
+        self.size = 0
+
+    def extend(self, t: np.ndarray, v: np.ndarray) -> None:
+        if t.size > self.capacity:
+            t, v = t[-self.capacity :], v[-self.capacity :]
+        idx = (self.head + np.arange(t.size)) % self.capacity
+        self.t[idx] = t
+        self.v[idx] = v
+        self.head = (self.head + t.size) % self.capacity
+        self.size = min(self.capacity, self.size + t.size)
+
+    def arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        """Samples oldest first (copies)."""
+        start = (self.head - self.size) % self.capacity
+        idx = (start + np.arange(self.size)) % self.capacity
+        return self.t[idx], self.v[idx]
+
+    def __len__(self) -> int:
+        return self.size
+
+
+class TimeseriesStream:
+    """Sliding-window series for one dashboard panel, emitted as ``ui_patch``."""
+
+    def __init__(
+        self,
+        panel_id: str,
+        *,
+        window: int = 1000,
+        min_interval: float = 1.0,
+        title: Optional[str] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            panel_id: Dashboard panel the patches target.
+            window: Samples kept (and sent) per series.
+            min_interval: Minimum seconds between emitted patches.
+            title: Chart title for ``snapshot()``.
+            clock: Monotonic clock, injectable for tests.
+        """
+        self.panel_id = panel_id
+        self.window = window
+        self.min_interval = min_interval
+        self.title = title
+        self._clock = clock
+        self._buffers: dict[str, RingBuffer] = {}
+        self._colors: dict[str, Optional[str]] = {}
+        self._fresh: dict[str, int] = {}  # samples pushed since the last emit
+        self._synced: set[str] = set()  # series the view already has
+        # Samples per series sent as appended batches since compaction
+        self._backlog: dict[str, int] = {}
+        self._last_emit: Optional[float] = None
+
+    def add_series(self, label: str, *, color: Optional[str] = None) -> None:
+        if label not in self._buffers:
+            self._buffers[label] = RingBuffer(self.window)
+        self._colors[label] = color
+
+    def push(self, label: str, t: Any, v: Any) -> None:
+        """Append one sample or arrays of samples (time-ordered) to a series.
+
+        ``t`` accepts epoch seconds, ISO 8601 strings, ``datetime`` or
+        ``datetime64`` values.
+        """
+        if label not in self._buffers:
+            self.add_series(label)
+        t_s = _epochs(t)
+        v_a = np.atleast_1d(np.asarray(v, dtype=np.float64))
+        if t_s.shape != v_a.shape:
+            raise ValueError("t and v must have the same length")
+        self._buffers[label].extend(t_s, v_a)
+        self._fresh[label] = min(self._fresh.get(label, 0) + t_s.size, self.window)
+
+    def snapshot(self) -> TimeseriesContent:
+        """Full current window for every series (the initial payload)."""
+        self._sync()
+        self._last_emit = self._clock()
+        return TimeseriesContent(
+            title=self.title, series=self._series(), window=self.window
+        )
+
+    def patch(self, *, force: bool = False) -> Optional[UIPatch]:
+        """Samples pushed since the last emit, or None.
+
+        Normally one append op on ``appended`` with a batch per changed
+        series. A new series, or a full window of appended samples,
+        replaces ``series`` and clears ``appended`` instead.
+
+        Returns None when nothing changed or ``min_interval`` has not yet
+        elapsed since the last emit (unless ``force``).
+        """
+        if not self._fresh:
+            return None
+        now = self._clock()
+        if (
+            not force
+            and self._last_emit is not None
+            and now - self._last_emit < self.min_interval
+        ):
+            return None
+        self._last_emit = now
+        backlog = {
+            label: self._backlog.get(label, 0) + n for label, n in self._fresh.items()
+        }
+        if self._fresh.keys() - self._synced or max(backlog.values()) > self.window:
+            self._sync()
+            series = [
+                s.model_dump(by_alias=True, exclude_none=True) for s in self._series()
+            ]
+            return UIPatch(
+                ops=[
+                    UpdatePanelOp(
+                        panel_id=self.panel_id,
+                        action="replace",
+                        target_field="series",
+                        data={"series": series},
+                    ),
+                    UpdatePanelOp(
+                        panel_id=self.panel_id, action="merge", data={"appended": []}
+                    ),
+                ]
+            )
+        batches = [
+            s.model_dump(by_alias=True, exclude_none=True)
+            for s in self._series(self._fresh)
+        ]
+        self._backlog.update(backlog)
+        self._fresh.clear()
+        return UIPatch(
+            ops=[
+                UpdatePanelOp(
+                    panel_id=self.panel_id,
+                    action="append",
+                    target_field="appended",
+                    data={"appended": batches},
+                )
+            ]
+        )
+
+    def _sync(self) -> None:
+        self._fresh.clear()
+        self._synced = set(self._buffers)
+        self._backlog.clear()
+
+    def _series(self, last: Optional[dict[str, int]] = None) -> list[TimeseriesSeries]:
+        """Current windows, or only the ``last[label]`` newest samples."""
+        out = []
+        for label, buf in self._buffers.items():
+            if last is not None and label not in last:
+                continue
+            t, v = buf.arrays()
+            if last is not None:
+                t, v = t[len(t) - last[label] :], v[len(v) - last[label] :]
+            out.append(
+                TimeseriesSeries(
+                    label=label,
+                    color=self._colors.get(label),
+                    data=[
+                        TimeseriesDataPoint(t=ts, v=val)
+                        for ts, val in zip(iso_times(t), v.tolist())
+                    ],
+                )
+            )
+        return out
+
+
+def _epochs(t: Any) -> np.ndarray:
+    if isinstance(t, (str, datetime, np.datetime64, int, float)):
+        return np.array([to_epoch(t)])
+    arr = np.asarray(t)
+    if arr.dtype.kind in "OUS":
+        return np.array([to_epoch(x) for x in np.atleast_1d(arr).tolist()])
+    return np.atleast_1d(epoch_array(arr))
@@ -2,7 +2,16 @@ from __future__ import annotations
 
 from typing import List, Literal, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+
+class TreemapLayout(BaseModel):
+    """Precomputed rectangle as fractions of the parent's drill-down area."""
+
+    x: float
+    y: float
+    w: float
+    h: float
 
 
 class TreemapNode(BaseModel):
@@ -11,6 +20,7 @@ class TreemapNode(BaseModel):
     value: Optional[float] = None
     color: Optional[str] = None
     children: Optional[List[TreemapNode]] = None
+    layout: Optional[TreemapLayout] = None
 
 
 class TreemapContent(BaseModel):
@@ -18,3 +28,6 @@ class TreemapContent(BaseModel):
     version: Literal["1.0"] = "1.0"
     title: Optional[str] = None
     root: TreemapNode
+    layout_aspect: Optional[float] = Field(None, alias="layoutAspect")
+
+    model_config = {"populate_by_name": True}
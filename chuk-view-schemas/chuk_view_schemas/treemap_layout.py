@@ -0,0 +1,139 @@
+"""Server-side squarified treemap layout.
+
+The treemap view lays out the children of the current drill-down node
+with a greedy squarified algorithm each time it renders. For very large
+trees on low-end hosts that is expensive, so ``layout_treemap()`` runs the
+same algorithm ahead of time and stores each node's rectangle as
+``TreemapNode.layout``: fractions of its parent's drill-down area, computed
+for a container of ``layoutAspect`` (width / height).
+
+Rows are grown with running sums / min / max rather than re-scanning the
+row, so each node's children are placed in O(k). Traversal is iterative,
+so depth is not limited by the recursion limit.
+
+Usage:
+    content = layout_treemap(hierarchy.treemap(top_n=50), aspect=16 / 9)
+
+Benchmark: ``python benchmarks/bench_treemap_layout.py``.
+
+Pure Python — no external dependencies.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Sequence
+
+from .treemap import TreemapContent, TreemapLayout, TreemapNode
+
+Rect = tuple[float, float, float, float]
+
+
+def squarify(areas: Sequence[float], width: float, height: float) -> list[Rect]:
+    """Greedy squarified layout of ``areas`` (in order) inside ``width`` x ``height``.
+
+    Matches the view's algorithm: rows grow while the worst aspect ratio
+    does not get worse. Returns one ``(x, y, w, h)`` per area; areas after
+    the space runs out get empty rectangles.
+    """
+    n = len(areas)
+    total = math.fsum(areas)
+    if n == 0 or total <= 0:
+        return [(0.0, 0.0, 0.0, 0.0)] * n
+    scale = width * height / total
+    scaled = [a * scale for a in areas]
+
+    rects: list[Rect] = []
+    cx, cy, cw, ch = 0.0, 0.0, width, height
+    i = 0
+    while i < n:
+        side = min(cw, ch)
+        if side <= 0:
+            break
+        s2 = side * side
+        row_sum = row_max = row_min = scaled[i]
+        best = _worst(row_sum, row_max, row_min, s2)
+        j = i + 1
+        while j < n:
+            a = scaled[j]
+            cand_sum = row_sum + a
+            cand_max = max(row_max, a)
+            cand_min = min(row_min, a)
+            ratio = _worst(cand_sum, cand_max, cand_min, s2)
+            if ratio > best:
+                break
+            row_sum, row_max, row_min, best = cand_sum, cand_max, cand_min, ratio
+            j += 1
+
+        if cw >= ch:
+            # Column along the left edge
+            row_w = row_sum / ch
+            y = cy
+            for a in scaled[i:j]:
+                h = a / row_w
+                rects.append((cx, y, row_w, h))
+                y += h
+            cx, cw = cx + row_w, cw - row_w
+        else:
+            # Row along the top edge
+            row_h = row_sum / cw
+            x = cx
+            for a in scaled[i:j]:
+                w = a / row_h
+                rects.append((x, cy, w, row_h))
+                x += w
+            cy, ch = cy + row_h, ch - row_h
+        i = j
+
+    rects.extend([(0.0, 0.0, 0.0, 0.0)] * (n - len(rects)))
+    return rects
+
+
+def layout_treemap(content: TreemapContent, *, aspect: float = 1.5) -> TreemapContent:
+    """Attach squarified ``layout`` hints to every non-root node, in place.
+
+    Node sizes follow the view: a leaf is its ``value`` (default 1), a
+    parent the sum of its leaves. Returns ``content`` for chaining.
+    """
+    if aspect <= 0:
+        raise ValueError("aspect must be > 0")
+    sizes = _subtree_sizes(content.root)
+    stack = [content.root]
+    while stack:
+        node = stack.pop()
+        if not node.children:
+            continue
+        areas = [sizes[id(c)] for c in node.children]
+        for child, (x, y, w, h) in zip(node.children, squarify(areas, aspect, 1.0)):
+            child.layout = TreemapLayout(x=x / aspect, y=y, w=w / aspect, h=h)
+            stack.append(child)
+    content.layout_aspect = aspect
+    return content
+
+
+# ---------------------------------------------------------------------------
+# Internals
+# ---------------------------------------------------------------------------
+
+
+def _worst(row_sum: float, row_max: float, row_min: float, s2: float) -> float:
+    r2 = row_sum * row_sum
+    if r2 == 0 or row_min == 0:
+        return math.inf
+    return max(s2 * row_max / r2, r2 / (s2 * row_min))
+
+
+def _subtree_sizes(root: TreemapNode) -> dict[int, float]:
+    """Post-order sizes keyed by ``id(node)``, without recursion."""
+    sizes: dict[int, float] = {}
+    stack: list[tuple[TreemapNode, bool]] = [(root, False)]
+    while stack:
+        node, visited = stack.pop()
+        if not node.children:
+            sizes[id(node)] = node.value if node.value is not None else 1.0
+        elif visited:
+            sizes[id(node)] = sum(sizes[id(c)] for c in node.children)
+        else:
+            stack.append((node, True))
+            stack.extend((c, False) for c in node.children)
+    return sizes
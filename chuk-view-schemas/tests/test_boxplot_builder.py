@@ -0,0 +1,128 @@
+"""Tests for the boxplot statistics builder."""
+
+import numpy as np
+import pytest
+
+from chuk_view_schemas import BoxplotContent
+from chuk_view_schemas.boxplot_builder import (
+    BoxplotAccumulator,
+    GroupedBoxplotBuilder,
+    QuantileSketch,
+    boxplot_groups,
+    boxplot_stats,
+)
+
+
+def _latencies(n: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return rng.lognormal(3.0, 0.5, n)
+
+
+class TestExactStats:
+    def test_tukey_whiskers(self):
+        values = np.concatenate((np.arange(1.0, 101.0), [1000.0]))
+        stats = boxplot_stats(values)
+        assert stats.median == 51
+        assert stats.max == 100
+        assert stats.min == 1
+        assert stats.outliers == [1000.0]
+
+    def test_outliers_bounded(self):
+        values = np.concatenate((np.zeros(1000), np.arange(100, 200.0)))
+        stats = boxplot_stats(values, max_outliers=5)
+        assert stats.outliers == [199.0, 198.0, 197.0, 196.0, 195.0]
+
+    def test_no_outliers_is_none(self):
+        assert boxplot_stats([1.0, 2.0, 3.0]).outliers is None
+
+    def test_nan_and_empty(self):
+        assert boxplot_stats([np.nan, 1.0, 2.0]).max == 2.0
+        with pytest.raises(ValueError):
+            boxplot_stats([np.nan])
+
+    def test_groups(self):
+        groups = boxplot_groups({"a": [1.0, 2.0], "b": [3.0, 4.0]})
+        assert [g.label for g in groups] == ["a", "b"]
+
+
+class TestQuantileSketch:
+    def test_accuracy_and_bounded_size(self):
+        values = _latencies(1_000_000)
+        sketch = QuantileSketch(k=200, seed=1)
+        for chunk in np.array_split(values, 50):
+            sketch.update(chunk)
+        assert sketch.count == values.size
+        assert len(sketch) < 1000
+        for q in (0.1, 0.25, 0.5, 0.75, 0.9):
+            rank = np.searchsorted(np.sort(values), sketch.quantile(q)) / values.size
+            assert rank == pytest.approx(q, abs=0.02)
+        assert sketch.quantile(0) == values.min()
+        assert sketch.quantile(1) == values.max()
+
+    def test_merge_matches_single_stream(self):
+        values = _latencies(200_000)
+        parts = [
+            QuantileSketch(seed=i).update(c)
+            for i, c in enumerate(np.array_split(values, 8))
+        ]
+        merged = parts[0]
+        for part in parts[1:]:
+            merged.merge(part)
+        assert merged.count == values.size
+        assert merged.quantile(0.5) == pytest.approx(np.median(values), rel=0.02)
+
+    def test_empty(self):
+        with pytest.raises(ValueError):
+            QuantileSketch().quantile(0.5)
+
+
+class TestAccumulator:
+    def test_close_to_exact(self):
+        values = _latencies(500_000)
+        acc = BoxplotAccumulator(seed=0)
+        for chunk in np.array_split(values, 10):
+            acc.update(chunk)
+        approx, exact = acc.stats(), boxplot_stats(values)
+        iqr = exact.q3 - exact.q1
+        for field in ("q1", "median", "q3", "min"):
+            assert getattr(approx, field) == pytest.approx(
+                getattr(exact, field), abs=0.05 * iqr
+            )
+        assert approx.outliers[:10] == exact.outliers[:10]
+        assert len(approx.outliers) <= 100
+
+    def test_small_merge_no_duplicates(self):
+        a = BoxplotAccumulator().update([1.0, 2.0, 3.0])
+        b = BoxplotAccumulator().update([4.0, 100.0])
+        stats = a.merge(b).stats()
+        assert stats.outliers == [100.0]
+
+
+class TestGroupedBuilder:
+    def test_add_grouped_and_merge(self):
+        rng = np.random.default_rng(0)
+        labels = rng.choice(["/users", "/orders", "/health"], 30_000)
+        values = rng.exponential(10, 30_000)
+        left, right = GroupedBoxplotBuilder(), GroupedBoxplotBuilder()
+        left.add_grouped(labels[:15_000], values[:15_000])
+        right.add_grouped(labels[15_000:], values[15_000:])
+        content = left.merge(right).content(title="Latency")
+        assert isinstance(content, BoxplotContent)
+        assert [g.label for g in content.groups] == list(dict.fromkeys(labels.tolist()))
+        users = next(g for g in content.groups if g.label == "/users")
+        exact = np.median(values[labels == "/users"])
+        assert users.stats.median == pytest.approx(exact, rel=0.05)
+
+    def test_merge_does_not_share_groups(self):
+        left, right = GroupedBoxplotBuilder(), GroupedBoxplotBuilder()
+        right.add("a", [1.0, 2.0, 3.0])
+        left.merge(right)
+        right.add("a", [1000.0] * 10)
+        left.add("a", [4.0])
+        assert right.groups["a"].sketch.count == 13
+        assert left.groups["a"].sketch.count == 4
+        assert left.build()[0].stats.max == 4.0
+
+    def test_length_mismatch(self):
+        with pytest.raises(ValueError):
+            GroupedBoxplotBuilder().add_grouped(["a"], [1.0, 2.0])
@@ -0,0 +1,166 @@
+"""Tests for the interval-indexed calendar store."""
+
+import pytest
+
+from chuk_view_schemas import CalendarContent, CalendarEvent
+from chuk_view_schemas.calendar_store import CalendarStore, Recurrence, view_range
+
+
+def _event(id, start, end=None, **kwargs) -> CalendarEvent:
+    return CalendarEvent(id=id, title=id.title(), start=start, end=end, **kwargs)
+
+
+def _starts(events):
+    return [e.start for e in events]
+
+
+class TestRecurrence:
+    def test_parse(self):
+        rule = Recurrence.parse("RRULE:FREQ=MONTHLY;INTERVAL=2;BYDAY=2TU,-1FR;COUNT=5")
+        assert rule.freq == "MONTHLY" and rule.interval == 2 and rule.count == 5
+        assert rule.by_day == ((2, 1), (-1, 4))
+
+    @pytest.mark.parametrize(
+        "rule",
+        [
+            "FREQ=HOURLY",
+            "FREQ=DAILY;BYSETPOS=1",
+            "FREQ=WEEKLY;BYDAY=2MO",
+            "FREQ=DAILY;BYMONTHDAY=3",
+            "FREQ=WEEKLY;BYDAY=XX",
+            "FREQ=DAILY;INTERVAL=0",
+        ],
+    )
+    def test_unsupported(self, rule):
+        with pytest.raises(ValueError):
+            Recurrence.parse(rule)
+
+
+class TestCalendarStore:
+    def test_one_off_events(self):
+        store = CalendarStore()
+        store.add(_event("a", "2025-03-03T10:00", "2025-03-03T11:00"))
+        store.add(_event("b", "2025-03-20"))
+        store.add(_event("c", "2025-04-02"))
+        assert [e.id for e in store.occurrences("2025-03-01", "2025-04-01")] == [
+            "a",
+            "b",
+        ]
+        # Overlap, not just start: a multi-day event reaches into the range
+        store.add(_event("d", "2025-02-27", "2025-03-02", allDay=True))
+        assert "d" in [e.id for e in store.occurrences("2025-03-01", "2025-03-02")]
+
+    def test_weekly_byday(self):
+        store = CalendarStore()
+        store.add(
+            _event("standup", "2025-01-06T09:30", "2025-01-06T09:45"),
+            rrule="FREQ=WEEKLY;BYDAY=MO,WE,FR",
+        )
+        events = store.occurrences("2025-03-03", "2025-03-10")
+        assert _starts(events) == [
+            "2025-03-03T09:30:00",
+            "2025-03-05T09:30:00",
+            "2025-03-07T09:30:00",
+        ]
+        assert events[0].id == "standup@2025-03-03T09:30:00"
+        assert events[0].end == "2025-03-03T09:45:00"
+
+    def test_count_and_exdates(self):
+        store = CalendarStore()
+        store.add(
+            _event("class", "2025-01-01"),
+            rrule="FREQ=DAILY;INTERVAL=2;COUNT=4",
+            exdates=["2025-01-03"],
+        )
+        # COUNT covers 1, 3, 5, 7 January; EXDATE then drops the 3rd
+        assert _starts(store.occurrences("2024-12-01", "2025-02-01")) == [
+            "2025-01-01",
+            "2025-01-05",
+            "2025-01-07",
+        ]
+
+    def test_until(self):
+        store = CalendarStore()
+        store.add(_event("x", "2025-01-01T08:00"), rrule="FREQ=DAILY;UNTIL=20250103")
+        assert len(store.occurrences("2025-01-01", "2025-02-01")) == 3
+
+    def test_monthly_rules(self):
+        store = CalendarStore()
+        store.add(_event("pay", "2025-01-31"), rrule="FREQ=MONTHLY")
+        store.add(_event("last", "2025-01-31"), rrule="FREQ=MONTHLY;BYMONTHDAY=-1")
+        store.add(_event("review", "2025-01-14"), rrule="FREQ=MONTHLY;BYDAY=2TU")
+        feb = store.occurrences("2025-02-01", "2025-03-01")
+        # 31 February does not exist: "pay" skips the month
+        assert {(e.id.split("@")[0], e.start) for e in feb} == {
+            ("last", "2025-02-28"),
+            ("review", "2025-02-11"),
+        }
+
+    def test_yearly_leap_day(self):
+        store = CalendarStore()
+        store.add(_event("leap", "2024-02-29"), rrule="FREQ=YEARLY")
+        assert _starts(store.occurrences("2024-01-01", "2033-01-01")) == [
+            "2024-02-29",
+            "2028-02-29",
+            "2032-02-29",
+        ]
+
+    def test_far_future_window_is_lazy(self):
+        store = CalendarStore()
+        store.add(
+            _event("tick", "2000-01-01T00:00", "2000-01-01T00:05"), rrule="FREQ=DAILY"
+        )
+        events = store.occurrences("2999-06-01", "2999-06-08")
+        assert len(events) == 7
+
+    def test_utc_offset_is_kept(self):
+        store = CalendarStore()
+        store.add(_event("call", "2025-01-06T16:00Z"), rrule="FREQ=WEEKLY")
+        events = store.occurrences("2025-01-13", "2025-01-14")
+        assert _starts(events) == ["2025-01-13T16:00:00+00:00"]
+
+    def test_remove_and_replace(self):
+        store = CalendarStore()
+        store.add(_event("a", "2025-01-01"), rrule="FREQ=DAILY")
+        assert len(store.occurrences("2025-01-01", "2025-01-08")) == 7
+        store.add(_event("a", "2025-01-01"), rrule="FREQ=WEEKLY")
+        assert len(store.occurrences("2025-01-01", "2025-01-08")) == 1
+        store.remove("a")
+        assert store.occurrences("2025-01-01", "2025-01-08") == []
+        with pytest.raises(KeyError):
+            store.remove("a")
+
+    def test_many_series(self):
+        store = CalendarStore()
+        for i in range(3000):
+            store.add(
+                _event(f"s{i}", f"20{10 + i % 15}-01-0{1 + i % 9}"),
+                rrule="FREQ=WEEKLY;COUNT=10",
+            )
+        events = store.occurrences("2020-01-01", "2020-02-01")
+        assert events and all(e.start.startswith("2020-01") for e in events)
+
+
+class TestRangeContract:
+    def test_snapshot(self):
+        store = CalendarStore(title="Team", range_tool="calendar_range")
+        store.add(_event("standup", "2025-01-06T09:30"), rrule="FREQ=WEEKLY;BYDAY=MO")
+        content = store.snapshot("2025-02-14")
+        dumped = content.model_dump(by_alias=True, exclude_none=True)
+        assert dumped["rangeStart"] == "2025-02-01"
+        assert dumped["rangeEnd"] == "2025-03-01"
+        assert dumped["rangeTool"] == "calendar_range"
+        assert dumped["defaultDate"] == "2025-02-14"
+        assert dumped["defaultView"] == "month"
+        assert len(content.events) == 4
+
+    def test_view_range(self):
+        assert view_range("2025-02-14", "week") == ("2025-02-09", "2025-02-16")
+        assert view_range("2024-02-29") == ("2024-02-01", "2024-03-01")
+
+    def test_from_content(self):
+        content = CalendarContent(events=[_event("a", "2025-01-01")], range_tool="r")
+        store = CalendarStore.from_content(content)
+        assert (
+            "a" in store and store.query("2025-01-01", "2025-01-02").range_tool == "r"
+        )
@@ -0,0 +1,102 @@
+"""Tests for choropleth classification and legend generation."""
+
+import numpy as np
+import pytest
+
+from chuk_view_schemas.choropleth import (
+    class_breaks,
+    classify_features,
+    interpolate_palette,
+    property_column,
+)
+
+
+def _collection(values) -> dict:
+    return {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [0, 0]},
+                "properties": {"pop": v},
+            }
+            for v in values
+        ],
+    }
+
+
+class TestPropertyColumn:
+    def test_missing_and_non_numeric_become_nan(self):
+        fc = _collection([1, "2.5", None, "n/a", True])
+        fc["features"].append({"type": "Feature", "geometry": None, "properties": None})
+        col = property_column(fc, "pop")
+        assert col[:2].tolist() == [1.0, 2.5]
+        assert np.isnan(col[2:]).all()
+
+
+class TestClassBreaks:
+    def test_equal_interval(self):
+        assert class_breaks(np.arange(11.0), 5, "equal_interval") == [0, 2, 4, 6, 8, 10]
+
+    def test_quantile_ignores_nan(self):
+        values = np.concatenate([np.arange(100.0), [np.nan] * 10])
+        breaks = class_breaks(values, 4, "quantile")
+        assert breaks[0] == 0 and breaks[-1] == 99
+        assert breaks[2] == pytest.approx(49.5)
+
+    def test_jenks_finds_natural_clusters(self):
+        values = np.array([1, 2, 3, 50, 51, 52, 100, 101, 102], dtype=float)
+        breaks = class_breaks(values, 3, "jenks")
+        assert breaks == [1, 50, 100, 102]
+
+    def test_jenks_sampled_fast_path_keeps_outer_edges(self):
+        rng = np.random.default_rng(1)
+        values = np.concatenate([rng.normal(0, 1, 50_000), rng.normal(100, 1, 50_000)])
+        breaks = class_breaks(values, 2, "jenks", sample_size=500)
+        assert breaks[0] == values.min() and breaks[-1] == values.max()
+        assert 3 < breaks[1] < 99
+
+    def test_unknown_method(self):
+        with pytest.raises(ValueError):
+            class_breaks(np.arange(5.0), 2, "bogus")
+
+
+class TestClassifyFeatures:
+    def test_writes_colors_and_builds_legend(self):
+        fc = _collection([1, 2, 3, 4, None])
+        result = classify_features(fc, "pop", k=2, method="equal_interval")
+        fills = [f["properties"]["fill"] for f in fc["features"]]
+        assert fills[0] == fills[1] == result.colors[0]
+        assert fills[2] == fills[3] == result.colors[1]
+        assert fills[4] == result.no_data_color
+        assert result.classes.tolist() == [0, 0, 1, 1, -1]
+
+        section = result.legend_section("Population")
+        gradient = section.items[0]
+        assert gradient.type == "gradient"
+        assert len(gradient.gradient_stops) == 2
+        assert section.items[-1].label == "No data"
+
+    def test_map_layers_split_by_class(self):
+        fc = _collection([1, 2, 3, 4, None])
+        result = classify_features(fc, "pop", k=2, color_property=None)
+        assert "fill" not in fc["features"][0]["properties"]
+        layers = result.map_layers(fc, id_prefix="pop", label="Population")
+        assert [layer.id for layer in layers] == ["pop-nodata", "pop-0", "pop-1"]
+        assert sum(len(layer.features["features"]) for layer in layers) == 5
+        assert layers[1].style.fill_color == result.colors[0]
+
+    def test_large_layer(self):
+        rng = np.random.default_rng(0)
+        fc = _collection(rng.lognormal(10, 1, 100_000).tolist())
+        result = classify_features(fc, "pop", k=7, method="jenks")
+        assert len(result.colors) == 7
+        assert (result.classes >= 0).all()
+
+
+def test_interpolate_palette():
+    assert interpolate_palette(["#000000", "#ffffff"], 3) == [
+        "#000000",
+        "#808080",
+        "#ffffff",
+    ]
@@ -223,6 +223,28 @@ class TestChartTool:
 
         assert result["structuredContent"]["type"] == "chart"
 
+    def test_target_points_downsamples_line_chart(self):
+        mcp = MockChukMCPServer()
+
+        @chart_tool(mcp, "show_trend", target_points=50)
+        async def show_trend():
+            return ChartContent(
+                chart_type="line",
+                data=[
+                    ChartDataset(
+                        label="A",
+                        values=[{"x": i, "y": (i * 37) % 101} for i in range(5000)],
+                    )
+                ],
+            )
+
+        tool = mcp._tools["show_trend"]
+        result = run(tool["func"]())
+
+        values = result["structuredContent"]["data"][0]["values"]
+        assert 50 <= len(values) <= 52
+        assert values[0]["x"] == 0 and values[-1]["x"] == 4999
+
 
 class TestDictPassthrough:
     def test_dict_with_structured_content_passes_through(self):
@@ -0,0 +1,103 @@
+"""Tests for the crosstab builder."""
+
+import numpy as np
+import pytest
+
+from chuk_view_schemas import CrosstabContent
+from chuk_view_schemas.crosstab_builder import (
+    DEFAULT_SPARSE_THRESHOLD,
+    crosstab,
+    crosstab_records,
+    to_dense,
+)
+
+
+class TestCrosstab:
+    def test_counts(self):
+        content = crosstab(["a", "a", "b"], ["x", "y", "x"])
+        assert content.row_headers == ["a", "b"]
+        assert content.column_headers == ["x", "y"]
+        assert content.values == [[1, 1], [1, 0]]
+        assert content.sparse_values is None
+
+    def test_weighted_sums(self):
+        content = crosstab(["a", "a", "b"], ["x", "x", "y"], [2.0, 3.0, 4.0])
+        assert content.values == [[5, 0], [0, 4]]
+
+    def test_non_finite_weights_are_dropped(self):
+        content = crosstab(
+            ["a", "a", "b", "b"],
+            ["x", "y", "x", "y"],
+            [1.0, np.nan, np.inf, 2.0],
+            sparse_threshold=DEFAULT_SPARSE_THRESHOLD * 6,
+        )
+        sparse = content.sparse_values
+        assert sparse is not None
+        assert (sparse.rows, sparse.cols, sparse.values) == ([0, 1], [0, 1], [1.0, 2.0])
+
+    def test_sort_by_total(self):
+        content = crosstab(["a", "b", "b"], ["x", "y", "y"], sort="total")
+        assert content.row_headers == ["b", "a"]
+        assert content.column_headers == ["y", "x"]
+        assert content.values == [[2, 0], [0, 1]]
+
+    def test_sparse_encoding_below_threshold(self):
+        rng = np.random.default_rng(0)
+        products = rng.integers(0, 2000, 5000)
+        stores = rng.integers(0, 500, 5000)
+        assert crosstab(products, stores).sparse_values is None
+        content = crosstab(products, stores, sparse_threshold=DEFAULT_SPARSE_THRESHOLD)
+        assert content.values is None
+        sv = content.sparse_values
+        assert len(sv.rows) == len(sv.cols) == len(sv.values)
+        assert sum(sv.values) == 5000
+        dumped = content.model_dump(by_alias=True, exclude_none=True)
+        assert "sparseValues" in dumped and "values" not in dumped
+
+    def test_sparse_round_trips_to_dense(self):
+        rows = ["p1", "p2", "p3", "p1"]
+        cols = ["s1", "s2", "s3", "s1"]
+        dense = crosstab(rows, cols)
+        sparse = crosstab(rows, cols, sparse_threshold=1.0)
+        assert sparse.sparse_values is not None
+        assert to_dense(sparse) == dense.values
+
+    def test_huge_grid_is_not_materialized(self):
+        n = 10_000
+        content = crosstab(
+            np.arange(n),
+            np.arange(n) + 1_000_000,
+            sparse_threshold=DEFAULT_SPARSE_THRESHOLD,
+        )
+        assert len(content.row_headers) == len(content.column_headers) == n
+        assert len(content.sparse_values.values) == n
+        with pytest.raises(ValueError, match="sparse_threshold"):
+            crosstab(np.arange(n), np.arange(n) + 1_000_000)
+
+    def test_length_mismatch(self):
+        with pytest.raises(ValueError):
+            crosstab(["a"], ["x", "y"])
+
+
+class TestCrosstabRecords:
+    def test_streamed_records(self):
+        records = (
+            {"product": p, "store": s, "units": u}
+            for p, s, u in [("a", "x", 1), ("a", "x", 2), ("b", "y", None)]
+        )
+        content = crosstab_records(records, "product", "store", "units")
+        assert isinstance(content, CrosstabContent)
+        assert content.values == [[3, 0], [0, 0]]
+
+
+class TestCrosstabContent:
+    def test_requires_one_encoding(self):
+        headers = {"rowHeaders": ["a"], "columnHeaders": ["x"]}
+        with pytest.raises(ValueError, match="Exactly one"):
+            CrosstabContent(**headers)
+        with pytest.raises(ValueError, match="Exactly one"):
+            CrosstabContent(
+                **headers,
+                values=[[1]],
+                sparseValues={"rows": [0], "cols": [0], "values": [1]},
+            )
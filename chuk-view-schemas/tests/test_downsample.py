@@ -0,0 +1,166 @@
+"""Tests for LTTB / M4 downsampling."""
+
+import numpy as np
+import pytest
+
+from chuk_view_schemas import (
+    ChartContent,
+    ChartDataset,
+    TimeseriesContent,
+    TimeseriesDataPoint,
+    TimeseriesSeries,
+)
+from chuk_view_schemas.downsample import (
+    downsample_chart,
+    downsample_indices,
+    downsample_structured,
+    downsample_timeseries,
+    lttb_indices,
+    m4_indices,
+)
+
+
+def _signal(n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    x = np.cumsum(rng.uniform(0.5, 1.5, n))  # irregular timestamps
+    y = np.sin(x / 50) + rng.normal(0, 0.1, n)
+    y[n // 3] = 10.0  # spike
+    y[2 * n // 3] = -10.0  # dip
+    return x, y
+
+
+class TestLttb:
+    def test_keeps_endpoints_and_target_size(self):
+        x, y = _signal(10_000)
+        idx = lttb_indices(x, y, 500, keep_extremes=False)
+        assert len(idx) == 500
+        assert idx[0] == 0 and idx[-1] == 9_999
+        assert np.all(np.diff(idx) > 0)
+
+    def test_keeps_extremes(self):
+        x, y = _signal(10_000)
+        idx = lttb_indices(x, y, 100)
+        assert y[idx].max() == y.max()
+        assert y[idx].min() == y.min()
+
+    def test_short_input_returned_whole(self):
+        assert lttb_indices([0, 1, 2], [1, 2, 3], 10).tolist() == [0, 1, 2]
+
+
+class TestM4:
+    def test_keeps_bucket_extremes_exactly(self):
+        x, y = _signal(20_000)
+        idx = m4_indices(x, y, 400)
+        assert len(idx) <= 400 + 2
+        assert y[idx].max() == y.max() and y[idx].min() == y.min()
+
+    def test_irregular_timestamps_bucket_by_time(self):
+        # dense burst at the start, sparse tail
+        x = np.concatenate([np.linspace(0, 1, 10_000), np.linspace(2, 100, 100)])
+        y = np.arange(x.size, dtype=float)
+        idx = m4_indices(x, y, 200)
+        # the burst falls into a single time bucket
+        assert np.sum(idx < 10_000) <= 4
+
+
+def test_nan_values_are_skipped():
+    y = np.arange(100, dtype=float)
+    y[::2] = np.nan
+    idx = downsample_indices(np.arange(100), y, 10)
+    assert np.isfinite(y[idx]).all()
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        downsample_indices([0, 1, 2, 3], [0, 1, 2, 3], 3, "nope")
+
+
+class TestViewPayloads:
+    def test_timeseries(self):
+        content = TimeseriesContent(
+            series=[
+                TimeseriesSeries(
+                    label="cpu",
+                    data=[
+                        TimeseriesDataPoint(
+                            t=f"2024-01-01T00:00:{i % 60:02d}+00:00", v=i % 13
+                        )
+                        for i in range(60)
+                    ]
+                    + [
+                        TimeseriesDataPoint(
+                            t=f"2024-01-02T{i // 60:02d}:{i % 60:02d}:00+00:00",
+                            v=i % 13,
+                        )
+                        for i in range(1000)
+                    ],
+                )
+            ]
+        )
+        out = downsample_timeseries(content, 100, method="m4")
+        data = out.series[0].data
+        assert len(data) <= 102
+        assert data[0].t == content.series[0].data[0].t
+        assert data[-1].t == content.series[0].data[-1].t
+
+    def test_chart_aligned_datasets_share_indices(self):
+        content = ChartContent(
+            chart_type="area",
+            data=[
+                ChartDataset(label="a", values=[float(i % 17) for i in range(2000)]),
+                ChartDataset(label="b", values=[float(i % 29) for i in range(2000)]),
+            ],
+        )
+        out = downsample_chart(content, 100)
+        a, b = out.data[0].values, out.data[1].values
+        assert [v["label"] for v in a] == [v["label"] for v in b]
+        assert len(a) < 2000
+
+    def test_short_aligned_datasets_follow_the_shared_index(self):
+        content = ChartContent(
+            chart_type="line",
+            data=[
+                ChartDataset(label="a", values=[float(i % 17) for i in range(2000)]),
+                ChartDataset(label="b", values=[float(i % 5) for i in range(80)]),
+            ],
+        )
+        out = downsample_chart(content, 100)
+        a, b = out.data[0].values, out.data[1].values
+        labels = [v["label"] for v in a]
+        assert [v["label"] for v in b] == [x for x in labels if int(x) < 80]
+        assert all(v["value"] == float(int(v["label"]) % 5) for v in b)
+
+    def test_missing_chart_values_are_skipped(self):
+        values: list = [float(i) for i in range(2000)]
+        values[7] = None
+        payload = {
+            "type": "chart",
+            "chartType": "line",
+            "data": [{"label": "a", "values": values}],
+        }
+        out = downsample_structured(payload, 100)["data"][0]["values"]
+        assert all(v["value"] is not None for v in out)
+
+    def test_mixed_offsets_use_time_order(self):
+        # "+01:00" stamps an hour later than the "Z" stamps, so time order
+        # differs from sample order
+        data = [
+            {"t": f"2024-01-01T01:{i // 60:02d}:{i % 60:02d}+01:00", "v": float(i)}
+            for i in range(500, 1000)
+        ] + [
+            {"t": f"2024-01-01T00:{i // 60:02d}:{i % 60:02d}Z", "v": float(i)}
+            for i in range(500)
+        ]
+        payload = {"type": "timeseries", "series": [{"label": "s", "data": data}]}
+        out = downsample_structured(payload, 50)["series"][0]["data"]
+        assert 999.0 in [p["v"] for p in out] and 0.0 in [p["v"] for p in out]
+
+    def test_non_line_chart_unchanged(self):
+        content = ChartContent(
+            chart_type="bar", data=[ChartDataset(label="a", values=list(range(2000)))]
+        )
+        assert downsample_chart(content, 10) is content
+
+    def test_structured_other_view_unchanged(self):
+        payload = {"type": "map", "layers": []}
+        assert downsample_structured(payload, 10) is payload
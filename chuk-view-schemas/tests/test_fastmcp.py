@@ -9,6 +9,7 @@ from chuk_view_schemas.fastmcp import (
     timeline_tool,
     heatmap_tool,
     sankey_tool,
+    scatter_tool,
     CDN_BASE,
     VIEW_PATHS,
 )
@@ -317,3 +318,69 @@ class TestNewPerViewDecorators:
 
         ui = mcp._tools["cam_gallery"]["kwargs"]["meta"]["ui"]
         assert ui["permissions"] == {"camera": {}}
+
+
+class TestTargetPoints:
+    def test_timeseries_result_is_downsampled(self):
+        mcp = MockMCP()
+
+        @view_tool(mcp, "show_metrics", "timeseries", target_points=100)
+        async def show_metrics():
+            return {
+                "type": "timeseries",
+                "version": "1.0",
+                "series": [
+                    {
+                        "label": "cpu",
+                        "data": [
+                            {"t": f"2024-01-01T00:{i // 60:02d}:{i % 60:02d}Z", "v": i % 7}
+                            for i in range(3600)
+                        ],
+                    }
+                ],
+            }
+
+        tool = list(mcp._tools.values())[0]
+        result = run(tool["func"]())
+
+        data = result["structuredContent"]["series"][0]["data"]
+        assert 100 <= len(data) <= 102
+
+    def test_other_views_untouched(self):
+        mcp = MockMCP()
+
+        @chart_tool(mcp, "show_bars", target_points=3)
+        async def show_bars():
+            return ChartContent(
+                chart_type="bar",
+                data=[ChartDataset(label="A", values=list(range(10)))],
+            )
+
+        tool = list(mcp._tools.values())[0]
+        result = run(tool["func"]())
+
+        assert len(result["structuredContent"]["data"][0]["values"]) == 10
+
+
+class TestDensityThreshold:
+    def test_large_scatter_is_binned(self):
+        mcp = MockMCP()
+
+        @scatter_tool(mcp, "show_points", density_threshold=1000)
+        async def show_points():
+            return {
+                "type": "scatter",
+                "version": "1.0",
+                "datasets": [
+                    {
+                        "label": "A",
+                        "points": [{"x": i % 100, "y": i // 100} for i in range(10_000)],
+                    }
+                ],
+            }
+
+        tool = list(mcp._tools.values())[0]
+        result = run(tool["func"]())
+
+        points = result["structuredContent"]["datasets"][0]["points"]
+        assert len(points) < 10_000
@@ -0,0 +1,154 @@
+"""Tests for the layered flowchart layout."""
+
+import random
+import time
+
+import pytest
+
+from chuk_view_schemas import FlowchartContent, flowchart_layout
+from chuk_view_schemas.flowchart_layout import (
+    NODE_GAP,
+    NODE_W,
+    LayoutCache,
+    _count_all,
+    _reduce_crossings,
+    layout_flowchart,
+    structural_hash,
+)
+
+
+def _chart(edges, direction=None, shapes=None) -> FlowchartContent:
+    ids = list(dict.fromkeys(x for e in edges for x in e))
+    shapes = shapes or {}
+    return FlowchartContent.model_validate(
+        {
+            "direction": direction,
+            "nodes": [{"id": i, "label": i, "shape": shapes.get(i)} for i in ids],
+            "edges": [{"source": a, "target": b} for a, b in edges],
+        }
+    )
+
+
+PIPELINE = [
+    ("start", "load"),
+    ("load", "validate"),
+    ("validate", "clean"),
+    ("validate", "reject"),
+    ("clean", "store"),
+    ("reject", "store"),
+    ("start", "store"),
+]
+
+
+def _pos(content):
+    return {n.id: (n.x, n.y) for n in content.nodes}
+
+
+class TestLayoutFlowchart:
+    def test_tb_layers_run_downwards(self):
+        pos = _pos(layout_flowchart(_chart(PIPELINE)))
+        for a, b in PIPELINE:
+            assert pos[a][1] < pos[b][1]
+        # Longest path puts store below clean / reject, not beside load
+        assert pos["store"][1] > pos["clean"][1]
+        assert pos["clean"][1] == pos["reject"][1]
+
+    @pytest.mark.parametrize(
+        "direction,axis,sign", [("BT", 1, -1), ("LR", 0, 1), ("RL", 0, -1)]
+    )
+    def test_direction(self, direction, axis, sign):
+        pos = _pos(layout_flowchart(_chart(PIPELINE, direction)))
+        for a, b in PIPELINE:
+            assert sign * (pos[b][axis] - pos[a][axis]) > 0
+
+    def test_no_overlap_within_layer(self):
+        pos = _pos(layout_flowchart(_chart(PIPELINE)))
+        row = sorted(pos[k][0] for k in ("clean", "reject"))
+        assert row[1] - row[0] >= NODE_W + NODE_GAP - 1e-9
+        assert min(x for x, _ in pos.values()) >= 60 + NODE_W / 2 - 1e-9
+
+    def test_diamonds_get_more_room(self):
+        chart = _chart([("a", "b"), ("b", "c")], shapes={"b": "diamond"})
+        pos = _pos(layout_flowchart(chart))
+        assert pos["b"][1] - pos["a"][1] > 100
+        assert pos["c"][1] - pos["b"][1] > 100
+
+    def test_cycles(self):
+        pos = _pos(
+            layout_flowchart(_chart([("a", "b"), ("b", "c"), ("c", "a"), ("c", "d")]))
+        )
+        assert pos["a"][1] < pos["b"][1] < pos["c"][1] < pos["d"][1]
+
+    def test_crossing_reduction(self):
+        # Input order invites crossings: a-y, b-x
+        chart = _chart([("a", "y"), ("b", "x"), ("a", "z"), ("b", "w")])
+        chart.nodes.sort(key=lambda n: n.id)
+        pos = _pos(layout_flowchart(chart))
+        xs = {k: v[0] for k, v in pos.items()}
+        assert (xs["a"] < xs["b"]) == (max(xs["y"], xs["z"]) < min(xs["x"], xs["w"]))
+
+    def test_reduces_crossings_on_random_layers(self):
+        rng = random.Random(0)
+        layers = [list(range(r * 20, r * 20 + 20)) for r in range(5)]
+        up = [[] for _ in range(100)]
+        down = [[] for _ in range(100)]
+        for r in range(4):
+            for v in layers[r]:
+                for w in rng.sample(layers[r + 1], 2):
+                    down[v].append(w)
+                    up[w].append(v)
+        for row in layers:
+            rng.shuffle(row)
+        before = _count_all(layers, down)
+        after = _count_all(_reduce_crossings([r[:] for r in layers], up, down), down)
+        assert after < before / 2
+
+    def test_ignores_unknown_and_self_edges(self):
+        chart = _chart([("a", "b")])
+        chart.edges.append(chart.edges[0].model_copy(update={"target": "ghost"}))
+        chart.edges.append(chart.edges[0].model_copy(update={"target": "a"}))
+        pos = _pos(layout_flowchart(chart))
+        assert pos["a"][1] < pos["b"][1]
+
+    def test_empty(self):
+        assert layout_flowchart(FlowchartContent(nodes=[], edges=[])).nodes == []
+
+
+class TestCache:
+    def test_structural_hash(self):
+        a, b = _chart(PIPELINE), _chart(PIPELINE)
+        b.nodes[0].label = "Begin"
+        assert structural_hash(a) == structural_hash(b)
+        assert structural_hash(a) != structural_hash(_chart(PIPELINE, "LR"))
+        b.nodes[0].shape = "diamond"
+        assert structural_hash(a) != structural_hash(b)
+
+    def test_repeat_layout_is_cached(self, monkeypatch):
+        cache = LayoutCache()
+        layout_flowchart(_chart(PIPELINE), cache=cache)
+        calls = []
+        monkeypatch.setattr(flowchart_layout, "_layout", lambda c: calls.append(c))
+        again = layout_flowchart(_chart(PIPELINE), cache=cache)
+        assert calls == [] and again.nodes[0].x is not None
+        assert len(cache) == 1
+
+    def test_no_cache_by_default(self, monkeypatch):
+        layout_flowchart(_chart(PIPELINE))
+        calls = []
+        monkeypatch.setattr(
+            flowchart_layout, "_layout", lambda c: calls.append(c) or {}
+        )
+        layout_flowchart(FlowchartContent(nodes=[], edges=[]))
+        assert len(calls) == 1
+
+    def test_hundreds_of_nodes(self):
+        rng = random.Random(1)
+        edges = [
+            (f"n{i}", f"n{rng.randrange(i + 1, 500)}")
+            for i in range(499)
+            for _ in range(2)
+        ]
+        start = time.perf_counter()
+        content = layout_flowchart(_chart(edges))
+        assert time.perf_counter() - start < 10
+        assert all(n.x is not None for n in content.nodes)
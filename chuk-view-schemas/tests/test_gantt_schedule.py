@@ -0,0 +1,159 @@
+"""Tests for the Gantt scheduling engine."""
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from chuk_view_schemas import GanttContent, GanttTask
+from chuk_view_schemas._intervals import IntervalTree
+from chuk_view_schemas.gantt_schedule import GanttSchedule, topological_order
+
+
+def _task(id, start, end, deps=None, group=None, progress=None) -> GanttTask:
+    return GanttTask(
+        id=id,
+        label=id.title(),
+        start=start,
+        end=end,
+        dependencies=deps,
+        group=group,
+        progress=progress,
+    )
+
+
+PLAN = [
+    _task("spec", "2025-01-01", "2025-01-06", group="Design", progress=100),
+    _task("ui", "2025-01-06", "2025-01-10", ["spec"], "Design", progress=50),
+    _task("api", "2025-01-06", "2025-01-20", ["spec"], "Build", progress=20),
+    _task("web", "2025-01-10", "2025-01-15", ["ui"], "Build"),
+    _task("ship", "2025-01-20", "2025-01-21", ["api", "web"], "Release"),
+]
+
+
+class TestTopologicalOrder:
+    def test_dependencies_first(self):
+        order = topological_order(list(reversed(PLAN)))
+        for task in PLAN:
+            for dep in task.dependencies or ():
+                assert order.index(dep) < order.index(task.id)
+
+    def test_cycle_is_named(self):
+        tasks = [
+            _task("a", "2025-01-01", "2025-01-02", ["c"]),
+            _task("b", "2025-01-01", "2025-01-02", ["a"]),
+            _task("c", "2025-01-01", "2025-01-02", ["b"]),
+            _task("d", "2025-01-01", "2025-01-02", ["c"]),
+        ]
+        with pytest.raises(ValueError, match="cycle") as info:
+            topological_order(tasks)
+        loop = str(info.value).split(": ")[1].split(" -> ")
+        assert loop[0] == loop[-1] and set(loop) == {"a", "b", "c"}
+
+    def test_unknown_dependencies_ignored(self):
+        tasks = [_task("a", "2025-01-01", "2025-01-02", ["ghost"])]
+        assert topological_order(tasks) == ["a"]
+
+
+class TestCriticalPath:
+    def test_slack(self):
+        schedule = GanttSchedule(PLAN)
+        assert schedule.slack == {"spec": 0, "ui": 5, "api": 0, "web": 5, "ship": 0}
+        assert schedule.critical_path() == ["spec", "api", "ship"]
+        assert schedule.start == "2025-01-01" and schedule.end == "2025-01-21"
+
+    def test_negative_slack_flags_overlap(self):
+        tasks = [
+            _task("a", "2025-01-01", "2025-01-10"),
+            _task("b", "2025-01-05", "2025-01-12", ["a"]),
+        ]
+        assert GanttSchedule(tasks).slack["a"] == -5
+
+    def test_duplicate_ids(self):
+        with pytest.raises(ValueError, match="Duplicate"):
+            GanttSchedule(PLAN + [PLAN[0]])
+
+
+class TestGroups:
+    def test_roll_up(self):
+        design = GanttSchedule(PLAN).groups["Design"]
+        assert (design.start, design.end, design.tasks) == (
+            "2025-01-01",
+            "2025-01-10",
+            2,
+        )
+        # Duration-weighted: (5 * 100 + 4 * 50) / 9
+        assert design.progress == 78
+        assert design.critical
+
+
+class TestWindow:
+    def test_only_overlapping_tasks(self):
+        content = GanttSchedule(PLAN, window_tool="page").window(
+            "2025-01-11", "2025-01-16"
+        )
+        assert [t.id for t in content.tasks] == ["api", "web"]
+        dumped = content.model_dump(by_alias=True, exclude_none=True)
+        assert dumped["startDate"] == "2025-01-11"
+        assert dumped["endDate"] == "2025-01-16"
+        assert dumped["windowTool"] == "page"
+        # Dependencies outside the window are dropped
+        assert all(t.dependencies is None for t in content.tasks)
+        assert [t.critical for t in content.tasks] == [True, False]
+
+    def test_collapsed_group_summary(self):
+        content = GanttSchedule(PLAN).window(
+            "2025-01-01", "2025-02-01", collapsed=["Design"]
+        )
+        ids = [t.id for t in content.tasks]
+        assert ids == ["group:Design", "api", "web", "ship"]
+        bar = content.tasks[0]
+        assert bar.summary and bar.start == "2025-01-01" and bar.end == "2025-01-10"
+        # Dependencies into the group point at its summary bar
+        assert content.tasks[1].dependencies == ["group:Design"]
+        assert content.tasks[2].dependencies == ["group:Design"]
+        assert content.tasks[3].dependencies == ["api", "web"]
+
+    def test_collapsed_group_outside_window(self):
+        content = GanttSchedule(PLAN).window(
+            "2025-01-18", "2025-02-01", collapsed=["Design"]
+        )
+        assert [t.id for t in content.tasks] == ["api", "ship"]
+
+    def test_from_content(self):
+        schedule = GanttSchedule.from_content(
+            GanttContent(title="Plan", tasks=PLAN, window_tool="w")
+        )
+        assert schedule.window("2025-01-01", "2025-01-02").title == "Plan"
+        assert schedule.window_tool == "w"
+
+
+class TestIntervalTree:
+    def test_matches_brute_force(self):
+        rng = random.Random(0)
+        starts = [rng.randrange(0, 1000) for _ in range(2000)]
+        ends = [s + 1 + int(rng.expovariate(1 / 20)) for s in starts]
+        tree = IntervalTree(starts, ends)
+        for _ in range(200):
+            lo = rng.randrange(-50, 1100)
+            hi = lo + rng.randrange(1, 100)
+            expected = {i for i in range(2000) if starts[i] < hi and ends[i] > lo}
+            assert set(tree.query(lo, hi)) == expected
+
+    def test_large_plan(self):
+        day0 = date(2025, 1, 1)
+        tasks = []
+        for i in range(5000):
+            start = day0 + timedelta(days=i // 10)
+            tasks.append(
+                _task(
+                    f"t{i}",
+                    start.isoformat(),
+                    (start + timedelta(days=3)).isoformat(),
+                    [f"t{i - 10}"] if i >= 10 else None,
+                    f"g{i // 500}",
+                )
+            )
+        schedule = GanttSchedule(tasks)
+        content = schedule.window("2025-03-01", "2025-03-08", collapsed=["g0"])
+        assert 0 < len(content.tasks) < 150
@@ -0,0 +1,94 @@
+"""Tests for globe point binning and arc aggregation."""
+
+import numpy as np
+import pytest
+
+from chuk_view_schemas.globe_aggregate import aggregate_globe, choose_level, grid_cells
+
+
+class TestGridCells:
+    def test_cells_nest_across_levels(self):
+        lat = np.array([10.0, 10.1, -45.0])
+        lon = np.array([20.0, 20.1, 170.0])
+        fine = grid_cells(lat, lon, 4)
+        coarse = grid_cells(lat, lon, 1)
+        assert fine[0] == fine[1] != fine[2]
+        assert coarse[0] == coarse[1]
+
+    def test_choose_level_respects_max_points(self):
+        rng = np.random.default_rng(0)
+        lat = rng.uniform(-60, 60, 5000)
+        lon = rng.uniform(-180, 180, 5000)
+        level = choose_level(lat, lon, 100)
+        assert np.unique(grid_cells(lat, lon, level)).size <= 100
+        assert np.unique(grid_cells(lat, lon, level + 1)).size > 100
+
+    def test_choose_level_matches_direct_counts(self):
+        rng = np.random.default_rng(1)
+        lat = rng.uniform(-90, 90, 2000)
+        lon = rng.uniform(-180, 180, 2000)
+        for max_points in (8, 30, 120, 500, 1900):
+            level = choose_level(lat, lon, max_points)
+            direct = next(
+                lv
+                for lv in range(12, -1, -1)
+                if np.unique(grid_cells(lat, lon, lv)).size <= max_points
+            )
+            assert level == direct
+
+    def test_choose_level_rejects_unreachable_max_points(self):
+        with pytest.raises(ValueError, match="level 0"):
+            choose_level([0.0, 0.0, 60.0], [0.0, 100.0, -100.0], 2)
+
+
+class TestAggregateGlobe:
+    def test_merges_arcs_between_binned_endpoints(self):
+        ids = ["LHR", "LGW", "JFK", "EWR"]
+        lat = [51.47, 51.15, 40.64, 40.69]
+        lon = [-0.45, -0.19, -73.78, -74.17]
+        content = aggregate_globe(
+            ids,
+            lat,
+            lon,
+            arc_from=["LHR", "LGW", "JFK", "LHR"],
+            arc_to=["JFK", "EWR", "LHR", "LGW"],
+            arc_weight=[10, 5, 7, 3],
+            level=3,
+        )
+        assert len(content.points) == 2
+        assert {p.label for p in content.points} == {"2 points"}
+        # London->NY merged, NY->London kept, London->London dropped
+        assert len(content.arcs) == 2
+        london = next(p for p in content.points if p.lat > 45)
+        assert content.arcs[0].source == london.id
+        assert all(a.color for a in content.arcs)
+
+    def test_bounded_output_for_large_input(self):
+        rng = np.random.default_rng(1)
+        n_points, n_arcs = 3000, 1_000_000
+        ids = np.arange(n_points)
+        lat = rng.uniform(-60, 70, n_points)
+        lon = rng.uniform(-180, 180, n_points)
+        content = aggregate_globe(
+            ids,
+            lat,
+            lon,
+            arc_from=rng.integers(0, n_points, n_arcs),
+            arc_to=rng.integers(0, n_points, n_arcs),
+            max_points=200,
+            top_k=300,
+        )
+        assert len(content.points) <= 200
+        assert len(content.arcs) == 300
+        sizes = [p.size for p in content.points]
+        assert 0.2 <= min(sizes) and max(sizes) == pytest.approx(2.0)
+
+    def test_integer_indices_for_string_ids(self):
+        content = aggregate_globe(
+            ["a", "b"], [0, 50], [0, 50], arc_from=[0], arc_to=[1], level=2
+        )
+        assert len(content.arcs) == 1
+
+    def test_unknown_endpoint(self):
+        with pytest.raises(KeyError):
+            aggregate_globe(["a", "b"], [0, 1], [0, 1], arc_from=["a"], arc_to=["z"])
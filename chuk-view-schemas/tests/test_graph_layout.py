@@ -0,0 +1,197 @@
+"""Tests for server-side graph layout and coarsening."""
+
+import numpy as np
+import pytest
+
+from chuk_view_schemas import GraphContent
+from chuk_view_schemas.graph_layout import (
+    LayoutCache,
+    coarsen_graph,
+    force_layout,
+    graph_fingerprint,
+    layout_graph,
+)
+
+
+def _grid_edges(g: int) -> tuple[np.ndarray, np.ndarray]:
+    idx = np.arange(g * g).reshape(g, g)
+    s = np.concatenate([idx[:, :-1].ravel(), idx[:-1, :].ravel()])
+    t = np.concatenate([idx[:, 1:].ravel(), idx[1:, :].ravel()])
+    return s, t
+
+
+def _blocks(n_blocks: int, size: int, seed: int = 0) -> GraphContent:
+    """Dense blocks of ``size`` nodes joined in a ring by single edges."""
+    rng = np.random.default_rng(seed)
+    n = n_blocks * size
+    s = rng.integers(0, n, 4 * n)
+    t = (s // size) * size + rng.integers(0, size, 4 * n)
+    edges = [
+        {"source": str(a), "target": str(b)} for a, b in zip(s.tolist(), t.tolist())
+    ]
+    edges += [
+        {"source": str(b * size), "target": str(((b + 1) % n_blocks) * size)}
+        for b in range(n_blocks)
+    ]
+    nodes = [
+        {"id": str(i), "label": f"n{i}", "group": f"g{i // size}"} for i in range(n)
+    ]
+    return GraphContent.model_validate({"nodes": nodes, "edges": edges})
+
+
+class TestForceLayout:
+    def test_grid_keeps_its_shape(self):
+        g = 30
+        s, t = _grid_edges(g)
+        pos = force_layout(g * g, s, t)
+        rng = np.random.default_rng(1)
+        a, b = rng.integers(0, g * g, (2, 2000))
+        grid_dist = np.hypot(a // g - b // g, a % g - b % g)
+        layout_dist = np.linalg.norm(pos[a] - pos[b], axis=1)
+        assert np.corrcoef(grid_dist, layout_dist)[0, 1] > 0.9
+
+    def test_grid_repulsion_above_exact_limit(self):
+        g = 50  # 2,500 nodes: refined with cell-approximated repulsion
+        s, t = _grid_edges(g)
+        pos = force_layout(g * g, s, t)
+        assert pos.shape == (g * g, 2) and np.isfinite(pos).all()
+        edge = np.linalg.norm(pos[s] - pos[t], axis=1).mean()
+        corner = np.linalg.norm(pos[0] - pos[-1])
+        assert corner > 20 * edge
+
+    def test_deterministic_for_seed(self):
+        s, t = _grid_edges(10)
+        assert np.array_equal(
+            force_layout(100, s, t, seed=3), force_layout(100, s, t, seed=3)
+        )
+
+    def test_degenerate_inputs(self):
+        assert force_layout(0, [], []).shape == (0, 2)
+        assert force_layout(1, [0], [0]).shape == (1, 2)
+        assert np.isfinite(force_layout(50, [], [])).all()
+        with pytest.raises(ValueError):
+            force_layout(3, [0, 1], [1])
+
+
+class TestLayoutGraph:
+    def test_sets_normalized_positions(self):
+        content = layout_graph(_blocks(4, 20))
+        xs = [n.x for n in content.nodes]
+        ys = [n.y for n in content.nodes]
+        assert min(xs) >= 0 and max(xs) <= 1 and min(ys) >= 0 and max(ys) <= 1
+        dumped = content.model_dump(exclude_none=True)["nodes"][0]
+        assert {"x", "y"} <= set(dumped)
+
+    def test_ignores_unknown_endpoints(self):
+        content = GraphContent.model_validate(
+            {
+                "nodes": [{"id": "a", "label": "A"}, {"id": "b", "label": "B"}],
+                "edges": [
+                    {"source": "a", "target": "b"},
+                    {"source": "a", "target": "missing"},
+                ],
+            }
+        )
+        layout_graph(content)
+        assert all(n.x is not None for n in content.nodes)
+
+    def test_cache_by_fingerprint(self):
+        cache = LayoutCache()
+        first = layout_graph(_blocks(3, 10), cache=cache)
+        assert len(cache) == 1
+        # Same structure, different labels: served from the cache
+        second = _blocks(3, 10)
+        for node in second.nodes:
+            node.label = node.label.upper()
+        assert graph_fingerprint(first) == graph_fingerprint(second)
+        layout_graph(second, cache=cache)
+        assert [n.x for n in second.nodes] == [n.x for n in first.nodes]
+        assert len(cache) == 1
+
+    def test_fingerprint_tracks_edges(self):
+        a, b = _blocks(2, 5), _blocks(2, 5)
+        b.edges[0].weight = 2.0
+        assert graph_fingerprint(a) != graph_fingerprint(b)
+
+
+class TestLayoutCache:
+    def test_lru_eviction(self):
+        cache = LayoutCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        assert "a" in cache and "c" in cache and "b" not in cache
+        with pytest.raises(KeyError):
+            cache.get("b")
+
+
+class TestCoarsenGraph:
+    def test_collapses_to_max_nodes(self):
+        content = _blocks(30, 40)
+        result = coarsen_graph(content, max_nodes=100, tool="expand_cluster")
+        assert len(result.content.nodes) <= 100
+        members = [m for ids in result.members.values() for m in ids]
+        assert sorted(members) == sorted(n.id for n in content.nodes)
+        assert result.content.edges
+        assert all(n.x is not None for n in result.content.nodes)
+
+    def test_super_nodes_drill_down(self):
+        result = coarsen_graph(_blocks(30, 40), max_nodes=100, tool="expand_cluster")
+        node = next(n for n in result.content.nodes if n.id.startswith("cluster:"))
+        assert node.drill_down.tool == "expand_cluster"
+        assert node.drill_down.arguments == {
+            "cluster": node.id,
+            "coarsening": result.key,
+        }
+        dumped = node.model_dump(by_alias=True, exclude_none=True)
+        assert "drillDown" in dumped
+        assert node.label.endswith(f"+{len(result.members[node.id]) - 1}")
+
+    def test_clusters_follow_communities(self):
+        result = coarsen_graph(_blocks(30, 40), max_nodes=100)
+        purity = [
+            np.bincount([int(i) // 40 for i in ids]).max() / len(ids)
+            for ids in result.members.values()
+        ]
+        assert np.mean(purity) > 0.7
+
+    def test_coarse_edges_carry_summed_weight(self):
+        content = _blocks(30, 40)
+        result = coarsen_graph(content, max_nodes=100)
+        # Original edges have weight 1; edges inside a cluster are dropped
+        total = sum(e.weight for e in result.content.edges)
+        assert 0 < total <= sum(1 for e in content.edges if e.source != e.target)
+
+    def test_expand_from_cache(self):
+        cache = LayoutCache()
+        content = _blocks(30, 40)
+        result = coarsen_graph(content, max_nodes=100, tool="expand", cache=cache)
+        assert (
+            coarsen_graph(content, max_nodes=100, tool="expand", cache=cache) is result
+        )
+        cluster = next(
+            n.id for n in result.content.nodes if n.id.startswith("cluster:")
+        )
+        sub = cache.get(result.key).expand(cluster)
+        assert {n.id for n in sub.nodes} == set(result.members[cluster])
+        ids = set(result.members[cluster])
+        assert all(e.source in ids and e.target in ids for e in sub.edges)
+        assert all(n.x is not None for n in sub.nodes)
+
+    def test_recoarsening_keeps_earlier_drill_downs(self):
+        cache = LayoutCache()
+        content = _blocks(30, 40)
+        first = coarsen_graph(content, max_nodes=100, tool="expand", cache=cache)
+        second = coarsen_graph(content, max_nodes=20, tool="expand", cache=cache)
+        node = next(n for n in first.content.nodes if n.id.startswith("cluster:"))
+        args = node.drill_down.arguments
+        assert args["coarsening"] != second.key
+        sub = cache.get(args["coarsening"]).expand(args["cluster"], layout=False)
+        assert {n.id for n in sub.nodes} == set(first.members[node.id])
+
+    def test_small_graph_is_unchanged(self):
+        content = _blocks(2, 5)
+        result = coarsen_graph(content, max_nodes=100, layout=False)
+        assert [n.id for n in result.content.nodes] == [n.id for n in content.nodes]
+        assert all(n.drill_down is None for n in result.content.nodes)
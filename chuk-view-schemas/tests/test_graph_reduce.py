@@ -0,0 +1,188 @@
+"""Tests for graph and investigation reduction."""
+
+import numpy as np
+import pytest
+
+from chuk_view_schemas import GraphContent, InvestigationContent
+from chuk_view_schemas.graph_reduce import (
+    backbone,
+    core_numbers,
+    k_core,
+    reduce_graph,
+    top_degree_neighbourhood,
+    weight_threshold,
+)
+
+
+def _graph(edges, n=None, weights=None) -> GraphContent:
+    ids = sorted({x for e in edges for x in e}) if n is None else range(n)
+    return GraphContent.model_validate(
+        {
+            "nodes": [{"id": str(i), "label": str(i)} for i in ids],
+            "edges": [
+                {
+                    "source": str(a),
+                    "target": str(b),
+                    "weight": None if weights is None else weights[i],
+                }
+                for i, (a, b) in enumerate(edges)
+            ],
+        }
+    )
+
+
+# 4-clique (0-3), a path 3-4-5 to a triangle (5-7) and a pendant 8 off 4
+CLIQUE_TAIL = [
+    (0, 1),
+    (0, 2),
+    (0, 3),
+    (1, 2),
+    (1, 3),
+    (2, 3),
+    (3, 4),
+    (4, 5),
+    (5, 6),
+    (6, 7),
+    (7, 5),
+    (4, 8),
+]
+
+
+def _ids(content: GraphContent) -> set[str]:
+    return {n.id for n in content.nodes}
+
+
+class TestCoreNumbers:
+    def test_clique_with_tail(self):
+        s, t = np.array(CLIQUE_TAIL).T
+        assert core_numbers(9, s, t).tolist() == [3, 3, 3, 3, 2, 2, 2, 2, 1]
+
+    def test_ignores_loops_and_parallel_edges(self):
+        assert core_numbers(3, [0, 0, 0, 1], [1, 1, 0, 2]).tolist() == [1, 1, 1]
+
+    def test_matches_peeling_on_random_graph(self):
+        rng = np.random.default_rng(0)
+        n = 300
+        s, t = rng.integers(0, n, (2, 1500))
+        core = core_numbers(n, s, t)
+        for k in range(1, core.max() + 2):
+            alive = np.ones(n, dtype=bool)
+            while True:
+                ok = alive[s] & alive[t] & (s != t)
+                pairs = {(min(a, b), max(a, b)) for a, b in zip(s[ok], t[ok])}
+                deg = np.zeros(n, dtype=int)
+                for a, b in pairs:
+                    deg[a] += 1
+                    deg[b] += 1
+                drop = alive & (deg < k)
+                if not drop.any():
+                    break
+                alive &= ~drop
+            assert np.array_equal(alive, core >= k)
+
+
+class TestFilters:
+    def test_k_core(self):
+        assert _ids(k_core(_graph(CLIQUE_TAIL), 3)) == {"0", "1", "2", "3"}
+        two = k_core(_graph(CLIQUE_TAIL), 2)
+        assert _ids(two) == {"0", "1", "2", "3", "4", "5", "6", "7"}
+        assert all(e.source in _ids(two) and e.target in _ids(two) for e in two.edges)
+
+    def test_top_degree_neighbourhood(self):
+        content = _graph(CLIQUE_TAIL)
+        # Node 3 has degree 4: its neighbours are the clique plus 4
+        assert _ids(top_degree_neighbourhood(content, seeds=1)) == {
+            "0",
+            "1",
+            "2",
+            "3",
+            "4",
+        }
+        two_hops = top_degree_neighbourhood(content, seeds=1, hops=2)
+        assert "5" in _ids(two_hops)
+        capped = top_degree_neighbourhood(content, seeds=1, hops=2, max_nodes=2)
+        assert "3" in _ids(capped) and len(capped.nodes) == 2
+
+    def test_weight_threshold(self):
+        content = _graph([(0, 1), (1, 2), (2, 3)], weights=[5.0, 1.0, 3.0])
+        cut = weight_threshold(content, 2.0)
+        assert [(e.source, e.target) for e in cut.edges] == [("0", "1"), ("2", "3")]
+        assert _ids(cut) == {"0", "1", "2", "3"}
+        top = weight_threshold(content, max_edges=1)
+        assert [e.weight for e in top.edges] == [5.0]
+        assert _ids(top) == {"0", "1"}
+        kept = weight_threshold(content, max_edges=1, drop_isolated=False)
+        assert len(kept.nodes) == 4
+
+    def test_backbone_keeps_dominant_edges(self):
+        # Hub 0 with one heavy edge among many light ones
+        edges = [(0, i) for i in range(1, 21)]
+        weights = [100.0] + [1.0] * 19
+        content = _graph(edges, weights=weights)
+        kept = backbone(content, alpha=0.05)
+        assert [(e.source, e.target) for e in kept.edges] == [("0", "1")]
+
+    def test_preserves_other_fields(self):
+        content = _graph(CLIQUE_TAIL)
+        content.title = "Deps"
+        content.directed = True
+        out = k_core(content, 3)
+        assert out.title == "Deps" and out.directed is True
+        assert len(content.nodes) == 9
+
+
+class TestReduceGraph:
+    def test_fits_budget_and_keeps_dense_core(self):
+        rng = np.random.default_rng(1)
+        # Dense 30-node community plus a sparse random periphery
+        dense = [
+            (a, b) for a in range(30) for b in range(a + 1, 30) if rng.random() < 0.5
+        ]
+        sparse = [(int(a), int(b)) for a, b in rng.integers(30, 1000, (800, 2))]
+        content = _graph(dense + sparse, n=1000)
+        out = reduce_graph(content, max_nodes=50, max_edges=200)
+        assert len(out.nodes) == 50 and len(out.edges) <= 200
+        assert {str(i) for i in range(30)} <= _ids(out)
+        assert all(e.source in _ids(out) and e.target in _ids(out) for e in out.edges)
+
+    def test_within_budget_is_unchanged(self):
+        content = _graph(CLIQUE_TAIL)
+        out = reduce_graph(content, max_nodes=100, max_edges=100)
+        assert out.nodes == content.nodes and out.edges == content.edges
+
+
+class TestInvestigation:
+    def _content(self) -> InvestigationContent:
+        return InvestigationContent.model_validate(
+            {
+                "evidence": [
+                    {"id": x, "label": x, "type": "person"}
+                    for x in ("a", "b", "c", "d")
+                ],
+                "connections": [
+                    {"from": "a", "to": "b", "strength": "strong"},
+                    {"from": "b", "to": "c", "strength": "weak"},
+                    {"from": "c", "to": "d"},
+                    {"from": "d", "to": "ghost"},
+                ],
+            }
+        )
+
+    def test_strength_as_weight(self):
+        out = weight_threshold(self._content(), 2.0)
+        assert isinstance(out, InvestigationContent)
+        assert [(c.source, c.to) for c in out.connections] == [("a", "b"), ("c", "d")]
+
+    def test_budget(self):
+        out = reduce_graph(self._content(), max_edges=1)
+        assert len(out.connections) == 1 and len(out.evidence) == 4
+
+    def test_k_core(self):
+        assert k_core(self._content(), 2).evidence == []
+
+
+@pytest.mark.parametrize("fn", [k_core, top_degree_neighbourhood, backbone])
+def test_empty_graph(fn):
+    content = GraphContent(nodes=[], edges=[])
+    args = (1,) if fn is k_core else ()
+    assert fn(content, *args).nodes == []
@@ -0,0 +1,137 @@
+"""Tests for the incremental graph store."""
+
+import pytest
+
+from chuk_view_schemas import GraphContent, InvestigationContent, UIPatch
+from chuk_view_schemas.graph_store import GraphStore
+
+# Path a-b-c-d-e with a branch b-x
+EDGES = [("a", "b"), ("b", "c"), ("c", "d"), ("d", "e"), ("b", "x")]
+
+
+def _content() -> GraphContent:
+    ids = sorted({n for e in EDGES for n in e})
+    return GraphContent.model_validate(
+        {
+            "title": "Chain",
+            "nodes": [{"id": i, "label": i.upper()} for i in ids],
+            "edges": [{"source": a, "target": b} for a, b in EDGES],
+        }
+    )
+
+
+def _ops(patch: UIPatch) -> dict:
+    return {op.target_field: op.data[op.target_field] for op in patch.ops}
+
+
+class TestGraphStore:
+    def test_snapshot(self):
+        store = GraphStore.from_content(_content(), expand_tool="expand_node")
+        content = store.snapshot(["a"], session="s1")
+        assert [n.id for n in content.nodes] == ["a", "b"]
+        assert [(e.source, e.target) for e in content.edges] == [("a", "b")]
+        assert content.title == "Chain"
+        dumped = content.model_dump(by_alias=True, exclude_none=True)
+        assert dumped["expandTool"] == "expand_node"
+
+    def test_directed_survives_round_trip(self):
+        content = _content().model_copy(update={"directed": True})
+        store = GraphStore.from_content(content)
+        assert store.snapshot(["a"], session="s1").directed is True
+
+    def test_expand_sends_only_new_items(self):
+        store = GraphStore.from_content(_content())
+        store.snapshot(["a"], session="s1")
+        patch = store.expand("b", session="s1", panel_id="graph")
+        data = _ops(patch)
+        assert [n["id"] for n in data["nodes"]] == ["c", "x"]
+        assert [(e["source"], e["target"]) for e in data["edges"]] == [
+            ("b", "c"),
+            ("b", "x"),
+        ]
+        op = patch.ops[0].model_dump(by_alias=True, exclude_none=True)
+        assert op["panelId"] == "graph" and op["action"] == "append"
+        assert op["targetField"] == "nodes"
+        # Nothing new the second time
+        assert store.expand("b", session="s1", panel_id="graph") is None
+
+    def test_edges_to_nodes_already_held(self):
+        store = GraphStore.from_content(_content())
+        store.snapshot(["a", "c"], session="s1", hops=0)
+        patch = store.expand("b", session="s1", panel_id="graph", hops=0)
+        data = _ops(patch)
+        assert [n["id"] for n in data["nodes"]] == ["b"]
+        assert [(e["source"], e["target"]) for e in data["edges"]] == [
+            ("a", "b"),
+            ("b", "c"),
+        ]
+
+    def test_hops_and_cap(self):
+        store = GraphStore.from_content(_content())
+        store.snapshot(["a"], session="s1", hops=0)
+        data = _ops(store.expand("a", session="s1", panel_id="g", hops=3))
+        assert [n["id"] for n in data["nodes"]] == ["b", "c", "x", "d"]
+        store.snapshot(["a"], session="s2", hops=0)
+        data = _ops(store.expand("a", session="s2", panel_id="g", hops=3, max_nodes=2))
+        assert [n["id"] for n in data["nodes"]] == ["b", "c"]
+        assert all(e["target"] in {"b", "c"} for e in data["edges"])
+
+    def test_sessions_are_independent(self):
+        store = GraphStore.from_content(_content())
+        store.snapshot(["a"], session="s1")
+        store.expand("b", session="s1", panel_id="g")
+        store.snapshot(["a"], session="s2")
+        data = _ops(store.expand("b", session="s2", panel_id="g"))
+        assert [n["id"] for n in data["nodes"]] == ["c", "x"]
+
+    def test_snapshot_resets_session(self):
+        store = GraphStore.from_content(_content())
+        store.snapshot(["a"], session="s1")
+        store.expand("b", session="s1", panel_id="g")
+        assert len(store.snapshot(["a"], session="s1").nodes) == 2
+        assert store.expand("b", session="s1", panel_id="g") is not None
+
+    def test_session_eviction(self):
+        store = GraphStore.from_content(_content(), max_sessions=1)
+        store.snapshot(["a"], session="s1")
+        store.snapshot(["a"], session="s2")
+        # s1 was forgotten, so its expand re-sends a and b
+        data = _ops(store.expand("a", session="s1", panel_id="g"))
+        assert [n["id"] for n in data["nodes"]] == ["a", "b"]
+
+    def test_unknown_ids(self):
+        store = GraphStore.from_content(_content())
+        with pytest.raises(KeyError):
+            store.expand("nope", session="s", panel_id="g")
+        with pytest.raises(KeyError):
+            store.add_edge(_content().edges[0].model_copy(update={"target": "nope"}))
+
+    def test_neighbours_deduplicates(self):
+        store = GraphStore.from_content(_content())
+        store.add_edge(_content().edges[0])
+        assert store.neighbours("b") == ["a", "c", "x"]
+
+
+class TestInvestigationStore:
+    def test_expand_uses_investigation_fields(self):
+        content = InvestigationContent.model_validate(
+            {
+                "notes": "Case notes",
+                "evidence": [
+                    {"id": i, "label": i, "type": "person"} for i in ("p1", "p2", "p3")
+                ],
+                "connections": [
+                    {"from": "p1", "to": "p2", "strength": "strong"},
+                    {"from": "p2", "to": "p3"},
+                ],
+            }
+        )
+        store = GraphStore.from_content(content, expand_tool="expand")
+        first = store.snapshot(["p1"], session="s")
+        assert isinstance(first, InvestigationContent)
+        assert [e.id for e in first.evidence] == ["p1", "p2"]
+        assert first.expand_tool == "expand"
+        assert first.notes == "Case notes"
+        data = _ops(store.expand("p2", session="s", panel_id="case"))
+        assert [e["id"] for e in data["evidence"]] == ["p3"]
+        assert data["connections"] == [{"from": "p2", "to": "p3"}]
@@ -0,0 +1,107 @@
+"""Tests for the path-record hierarchy builder."""
+
+import pytest
+
+from chuk_view_schemas import SunburstContent, TreemapContent
+from chuk_view_schemas.hierarchy_builder import (
+    MAX_CONTENT_DEPTH,
+    Hierarchy,
+    build_hierarchy,
+)
+
+RECORDS = [
+    (["src", "app.py"], 10.0),
+    (["src", "util.py"], 4.0),
+    (["src", "lib", "a.py"], 1.0),
+    (["docs", "index.md"], 3.0),
+    (["README"], 2.0),
+]
+
+
+def _leaf_sum(node: dict) -> float:
+    stack, total = [node], 0.0
+    while stack:
+        n = stack.pop()
+        if n.get("children"):
+            stack.extend(n["children"])
+        else:
+            total += n["value"]
+    return total
+
+
+class TestHierarchy:
+    def test_rolls_up_values(self):
+        tree = build_hierarchy(RECORDS).to_dict()
+        assert tree["value"] == 20.0
+        src = tree["children"][0]
+        assert (src["label"], src["value"]) == ("src", 15.0)
+        assert src["id"] == "root/src"
+        assert [c["label"] for c in src["children"]] == ["app.py", "util.py", "lib"]
+
+    def test_top_n_collapses_into_other(self):
+        tree = build_hierarchy(RECORDS).to_dict(top_n=1)
+        labels = [c["label"] for c in tree["children"]]
+        assert labels == ["src", "Other (2)"]
+        assert tree["children"][1]["value"] == 5.0
+        assert "children" not in tree["children"][1]
+        assert _leaf_sum(tree) == 20.0
+
+    def test_max_depth(self):
+        tree = build_hierarchy(RECORDS).to_dict(max_depth=1)
+        assert all("children" not in c for c in tree["children"])
+        assert _leaf_sum(tree) == 20.0
+
+    def test_interior_value_becomes_self_leaf(self):
+        h = Hierarchy()
+        h.add(["a"], 5.0)
+        h.add(["a", "b"], 3.0)
+        a = h.to_dict()["children"][0]
+        assert a["value"] == 8.0
+        assert {c["label"]: c["value"] for c in a["children"]} == {
+            "b": 3.0,
+            "(self)": 5.0,
+        }
+
+    def test_deep_paths_do_not_recurse(self):
+        h = Hierarchy()
+        h.add([f"d{i}" for i in range(5000)], 1.0)
+        node, depth = h.to_dict(), 0
+        while "children" in node:
+            node, depth = node["children"][0], depth + 1
+        assert depth == 5000
+
+    def test_content_depth_is_capped(self):
+        h = Hierarchy()
+        h.add([f"d{i}" for i in range(MAX_CONTENT_DEPTH + 1)], 1.0)
+        with pytest.raises(ValueError, match="max_depth"):
+            h.treemap()
+        content = h.sunburst(max_depth=MAX_CONTENT_DEPTH)
+        assert content.root.value == 1.0
+
+    def test_ids_escape_separators(self):
+        h = Hierarchy()
+        h.add(["a/b"], 1.0)
+        h.add(["a", "b"], 2.0)
+        h.add(["a"], 4.0)
+        tree = h.to_dict()
+        ids = []
+        stack = [tree]
+        while stack:
+            node = stack.pop()
+            ids.append(node["id"])
+            stack.extend(node.get("children", []))
+        assert len(ids) == len(set(ids))
+        assert "root/a~1b" in ids and "root/a/b" in ids and "root/a/~self" in ids
+
+    def test_wide_tree_is_bounded(self):
+        h = Hierarchy()
+        for i in range(50_000):
+            h.add(["dir", f"f{i}"], float(i % 100))
+        content = h.treemap(top_n=25, title="Files")
+        assert isinstance(content, TreemapContent)
+        assert len(content.root.children[0].children) == 26
+
+    def test_sunburst_output(self):
+        content = build_hierarchy(RECORDS).sunburst(max_depth=2)
+        assert isinstance(content, SunburstContent)
+        assert content.root.value == 20.0
@@ -0,0 +1,97 @@
+"""Tests for the histogram builder."""
+
+import numpy as np
+import pytest
+
+from chuk_view_schemas.histogram import Histogram, histogram, histogram_edges
+
+
+class TestEdges:
+    def test_sturges_bin_count(self):
+        edges = histogram_edges(np.arange(1024.0), rule="sturges", nice=False)
+        assert len(edges) - 1 == 11
+        assert edges[0] == 0 and edges[-1] == pytest.approx(1023)
+
+    def test_fd_is_robust_to_outliers(self):
+        rng = np.random.default_rng(0)
+        v = np.append(rng.normal(0, 1, 10_000), 1e4)
+        edges = histogram_edges(v, rule="fd", max_bins=100_000)
+        assert np.diff(edges)[0] < 1
+
+    def test_fixed_width_is_aligned_not_rounded(self):
+        edges = histogram_edges([3.0, 97.0], rule="fixed", width=7)
+        assert edges[0] == 0
+        assert np.allclose(np.diff(edges), 7)
+        assert edges[-1] >= 97
+
+    def test_fixed_bins_are_kept(self):
+        edges = histogram_edges([3.0, 97.0], rule="fixed", bins=10)
+        assert len(edges) - 1 == 10
+        assert edges[0] == 3 and edges[-1] == pytest.approx(97)
+
+    def test_fixed_needs_size(self):
+        with pytest.raises(ValueError):
+            histogram_edges([1.0, 2.0], rule="fixed")
+
+    def test_max_bins(self):
+        edges = histogram_edges(np.arange(10.0), rule="fixed", width=1e-6, max_bins=50)
+        assert len(edges) - 1 <= 50
+
+
+class TestHistogram:
+    def test_matches_numpy(self):
+        rng = np.random.default_rng(1)
+        v = rng.exponential(5, 100_000)
+        hist = histogram(v, rule="fd")
+        expected, _ = np.histogram(v, bins=hist.edges)
+        np.testing.assert_array_equal(hist.counts, expected)
+
+    def test_uniform_edges_bin_like_searchsorted(self):
+        edges = 0.3 + np.arange(98) * 0.3
+        v = np.concatenate([edges, np.nextafter(edges, -np.inf)[1:]])
+        hist = Histogram(edges).update(v)
+        expected, _ = np.histogram(v, bins=edges)
+        np.testing.assert_array_equal(hist.counts, expected)
+
+    def test_custom_edges_use_searchsorted(self):
+        hist = Histogram([0, 1, 10, 100]).update([0.5, 1, 5, 10, 50, 100, 200, -1])
+        assert hist.counts.tolist() == [1, 2, 3]
+        assert hist.underflow == 1
+        assert hist.overflow == 1
+
+    def test_chunked_merge_equals_single_pass(self):
+        rng = np.random.default_rng(2)
+        v = rng.normal(100, 15, 200_000)
+        edges = histogram_edges(v[:10_000], rule="fd", value_range=(0, 200))
+        parts = [Histogram(edges).update(c) for c in np.array_split(v, 7)]
+        merged = parts[0]
+        for part in parts[1:]:
+            merged.merge(part)
+        np.testing.assert_array_equal(merged.counts, Histogram(edges).update(v).counts)
+        assert merged.total + merged.underflow + merged.overflow == v.size
+
+    def test_merge_requires_same_edges(self):
+        with pytest.raises(ValueError):
+            Histogram([0, 1]).merge(Histogram([0, 2]))
+
+    def test_invalid_edges(self):
+        with pytest.raises(ValueError):
+            Histogram([0, 0, 1])
+
+
+class TestToChart:
+    def test_bar_chart(self):
+        content = histogram([1, 2, 2, 3], rule="fixed", width=1).to_chart(
+            title="Sizes", x_label="KB"
+        )
+        assert content.chart_type == "bar"
+        assert content.x_axis.label == "KB"
+        values = content.data[0].values
+        assert values[0].label == "1–2"
+        assert [v.value for v in values] == [1, 3]
+
+    def test_density_integrates_to_one(self):
+        hist = histogram(np.random.default_rng(0).uniform(0, 1, 10_000))
+        content = hist.to_chart(density=True)
+        dens = np.array([v.value for v in content.data[0].values])
+        assert (dens * np.diff(hist.edges)).sum() == pytest.approx(1)
@@ -0,0 +1,130 @@
+"""Tests for lazy layer loading (LayerStore, defer_hidden_layers)."""
+
+import pytest
+
+from chuk_view_schemas import LayersContent, LayersLayer, MapContent, MapLayer
+from chuk_view_schemas.layer_store import LayerStore, defer_hidden_layers
+
+
+def _fc(n: int) -> dict:
+    return {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [i * 0.01, 51.5]},
+                "properties": {"name": f"site-{i}"},
+            }
+            for i in range(n)
+        ],
+    }
+
+
+class TestLayerStore:
+    def test_put_and_get_returns_encoded_layer(self):
+        store = LayerStore()
+        store.put(MapLayer(id="sites", label="Sites", features=_fc(3)))
+        payload = store.get("sites")
+        assert payload["id"] == "sites"
+        assert len(payload["features"]["features"]) == 3
+        assert "style" not in payload  # exclude_none
+        assert store.nbytes > 0
+
+    def test_unknown_layer_raises_key_error(self):
+        with pytest.raises(KeyError):
+            LayerStore().get("missing")
+
+    def test_loader_runs_once(self):
+        store = LayerStore()
+        calls = []
+
+        def load():
+            calls.append(1)
+            return {"id": "parcels", "label": "Parcels", "features": _fc(2)}
+
+        store.register("parcels", load)
+        assert store.nbytes == 0
+        store.get("parcels")
+        store.get("parcels")
+        assert len(calls) == 1
+
+    def test_byte_budget_evicts_least_recently_used_loader_entries(self):
+        store = LayerStore(max_bytes=1)
+        calls = {"a": 0, "b": 0}
+
+        def loader(layer_id):
+            def load():
+                calls[layer_id] += 1
+                return {"id": layer_id, "label": layer_id, "features": _fc(10)}
+
+            return load
+
+        store.register("a", loader("a"))
+        store.register("b", loader("b"))
+        store.get("a")
+        store.get("b")  # evicts "a"
+        store.get("a")  # rebuilt
+        assert calls == {"a": 2, "b": 1}
+
+    def test_pinned_layers_are_never_evicted(self):
+        store = LayerStore(max_bytes=1)
+        store.put({"id": "pinned", "label": "Pinned", "features": _fc(10)})
+        store.register(
+            "lazy", lambda: {"id": "lazy", "label": "Lazy", "features": _fc(10)}
+        )
+        store.get("lazy")
+        assert store.get("pinned")["id"] == "pinned"
+
+
+class TestDeferHiddenLayers:
+    def test_hidden_layers_become_tool_stubs(self):
+        store = LayerStore()
+        content = LayersContent(
+            layers=[
+                LayersLayer(id="roads", label="Roads", features=_fc(2)),
+                LayersLayer(
+                    id="parcels", label="Parcels", visible=False, features=_fc(50)
+                ),
+            ]
+        )
+        deferred = defer_hidden_layers(content, store, tool="load_layer")
+
+        dumped = deferred.model_dump(by_alias=True, exclude_none=True)
+        roads, parcels = dumped["layers"]
+        assert "features" in roads and "source" not in roads
+        assert "features" not in parcels
+        assert parcels["source"] == {
+            "tool": "load_layer",
+            "arguments": {"layerId": "parcels"},
+        }
+        assert len(store.get("parcels")["features"]["features"]) == 50
+        # original content is untouched
+        assert content.layers[1].features is not None
+
+    def test_resource_template(self):
+        store = LayerStore()
+        content = MapContent(
+            layers=[MapLayer(id="flood", label="Flood", visible=False, features=_fc(1))]
+        )
+        deferred = defer_hidden_layers(
+            content, store, resource="ui://gis-server/layers/{id}"
+        )
+        assert deferred.layers[0].source.resource == "ui://gis-server/layers/flood"
+        assert "flood" in store
+
+    def test_requires_exactly_one_source_kind(self):
+        content = MapContent(layers=[])
+        with pytest.raises(ValueError):
+            defer_hidden_layers(content, LayerStore())
+        with pytest.raises(ValueError):
+            defer_hidden_layers(content, LayerStore(), tool="t", resource="ui://x/{id}")
+
+
+class TestLayerValidation:
+    @pytest.mark.parametrize("model", [MapLayer, LayersLayer])
+    def test_requires_features_or_source(self, model):
+        with pytest.raises(ValueError, match="Exactly one"):
+            model(id="a", label="A")
+        with pytest.raises(ValueError, match="Exactly one"):
+            model(id="a", label="A", features=_fc(1), source={"tool": "get"})
+        assert model(id="a", label="A", source={"tool": "get"}).features is None
@@ -0,0 +1,176 @@
+"""Tests for the log tail engine."""
+
+import os
+
+import pytest
+
+from chuk_view_schemas.log_tail import LogTail, parse_line
+
+
+def _write(path, *lines, mode="a"):
+    with open(path, mode, encoding="utf-8") as f:
+        f.writelines(line + "\n" for line in lines)
+
+
+def _line(i, level="INFO", source="api"):
+    return f"2025-01-01T10:{i // 60:02d}:{i % 60:02d}Z [{level}] [{source}] event {i}"
+
+
+class TestParseLine:
+    def test_text(self):
+        entry = parse_line("2025-01-01 10:00:00,123 WARN worker: disk low")
+        assert entry.level == "warning" and entry.source == "worker"
+        assert entry.message == "disk low"
+        assert entry.timestamp == "2025-01-01 10:00:00,123"
+        entry = parse_line("[FATAL] boom")
+        assert entry.level == "error" and entry.message == "boom"
+
+    def test_json(self):
+        entry = parse_line(
+            '{"ts": "2025-01-01T10:00:00Z", "lvl": "debug", "msg": "hi", "logger": "db"}'
+        )
+        assert (entry.level, entry.message, entry.source) == ("debug", "hi", "db")
+
+    def test_unrecognised(self):
+        assert parse_line("    at Foo.bar(Foo.java:10)") is None
+        assert parse_line("Error handling is hard") is None
+
+
+class TestLogTail:
+    def test_poll_only_new_lines(self, tmp_path):
+        path = tmp_path / "job.log"
+        tail = LogTail(path)
+        assert tail.poll() == []  # missing file
+        _write(path, _line(0), _line(1))
+        assert [e.message for e in tail.poll()] == ["event 0", "event 1"]
+        assert tail.poll() == []
+        _write(path, _line(2))
+        new = tail.poll()
+        assert [e.message for e in new] == ["event 2"]
+        assert new[0].id == str(2 * len(_line(0)) + 2)
+
+    def test_partial_line_waits(self, tmp_path):
+        path = tmp_path / "job.log"
+        with open(path, "w") as f:
+            f.write(_line(0) + "\n" + "2025-01-01T10:00:01Z [INFO] half")
+        tail = LogTail(path)
+        assert len(tail.poll()) == 1
+        with open(path, "a") as f:
+            f.write(" done\n")
+        assert [e.message for e in tail.poll()] == ["half done"]
+
+    def test_ring_buffer_is_bounded(self, tmp_path):
+        path = tmp_path / "job.log"
+        _write(path, *(_line(i) for i in range(100)))
+        tail = LogTail(path, capacity=10)
+        tail.poll()
+        assert len(tail) == 10 and tail.entries[0].message == "event 90"
+        content = tail.snapshot()
+        assert content.model_dump(by_alias=True)["maxEntries"] == 10
+
+    def test_continuation_lines_inherit(self, tmp_path):
+        path = tmp_path / "job.log"
+        _write(path, _line(0, "ERROR", "db"), "Traceback (most recent call last):")
+        entries = LogTail(path).poll()
+        assert (entries[1].level, entries[1].source) == ("error", "db")
+
+    def test_append_patch_with_filters(self, tmp_path):
+        path = tmp_path / "job.log"
+        _write(path, _line(0))
+        tail = LogTail(path, panel_id="log-panel")
+        tail.snapshot()
+        assert tail.patch() is None
+        _write(path, _line(1, "ERROR"), _line(2, "INFO"), _line(3, "ERROR", "db"))
+        new = tail.poll()
+        patch = tail.patch(new, levels={"error"}, sources={"api"})
+        op = patch.model_dump(by_alias=True, exclude_none=True)["ops"][0]
+        assert op["panelId"] == "log-panel"
+        assert op["action"] == "append" and op["targetField"] == "entries"
+        assert [e["message"] for e in op["data"]["entries"]] == ["event 1"]
+        other = tail.patch(new, levels={"error"}, panel_id="errors")
+        assert len(other.ops[0].data["entries"]) == 2
+
+    def test_rotation_replaces(self, tmp_path):
+        path = tmp_path / "job.log"
+        _write(path, *(_line(i) for i in range(5)))
+        tail = LogTail(path)
+        tail.snapshot()
+        os.replace(path, tmp_path / "job.log.1")
+        _write(path, _line(9), mode="w")
+        op = tail.patch().ops[0]
+        assert op.action == "replace"
+        assert [e["message"] for e in op.data["entries"]] == ["event 9"]
+        assert tail.patch() is None
+
+    def test_truncation_rereads(self, tmp_path):
+        path = tmp_path / "job.log"
+        _write(path, *(_line(i) for i in range(5)))
+        tail = LogTail(path)
+        tail.poll()
+        _write(path, _line(7), mode="w")
+        assert [e.message for e in tail.poll()] == ["event 7"]
+        assert len(tail) == 1
+
+
+class TestIndex:
+    @pytest.fixture
+    def tail(self, tmp_path):
+        path = tmp_path / "big.log"
+        levels = ["INFO", "INFO", "DEBUG", "WARN"]
+        lines = [_line(i, levels[i % 4], "api") for i in range(2000)]
+        lines[1500] = _line(1500, "ERROR", "db")
+        _write(path, *lines)
+        tail = LogTail(path, capacity=50, block_size=4096)
+        tail.poll()
+        return tail
+
+    def test_blocks_cover_file(self, tail):
+        assert len(tail.blocks) > 10
+        assert tail.blocks[0].start == 0
+        assert all(a.end == b.start for a, b in zip(tail.blocks, tail.blocks[1:]))
+        assert tail.blocks[-1].end == tail.offset
+
+    def test_seek(self, tail):
+        offset = tail.seek("2025-01-01T10:20:00Z")  # event 1200
+        block = next(b for b in tail.blocks if b.start == offset)
+        assert block.first_time <= tail.blocks[0].first_time + 1200 <= block.last_time
+
+    def test_history_time_range(self, tail):
+        entries = tail.history("2025-01-01T10:10:00Z", "2025-01-01T10:10:05Z")
+        assert [e.message for e in entries] == [f"event {i}" for i in range(600, 605)]
+
+    def test_history_skips_blocks(self, tail, monkeypatch):
+        read = []
+        original = tail._read_lines
+
+        def spy(start, stop):
+            read.append(start)
+            return original(start, stop)
+
+        monkeypatch.setattr(tail, "_read_lines", spy)
+        entries = tail.history(levels={"error"})
+        assert [e.message for e in entries] == ["event 1500"]
+        assert len(read) == 1
+        read.clear()
+        assert tail.history(sources={"db"}, levels={"info"}) == []
+        assert len(read) == 1  # the block has db and info, just not together
+
+    def test_history_rejects_bad_bounds(self, tail):
+        with pytest.raises(ValueError, match="start"):
+            tail.history("yesterday")
+        with pytest.raises(ValueError, match="end"):
+            tail.history(end="2025-13-01")
+
+    def test_history_limit(self, tail):
+        assert len(tail.history(levels={"warning"}, limit=7)) == 7
+
+    def test_history_continuations_across_blocks(self, tmp_path):
+        path = tmp_path / "trace.log"
+        trace = [f"  File 'app.py', line {i}" for i in range(200)]
+        _write(path, _line(0), _line(1, "ERROR", "worker"), *trace, _line(2))
+        tail = LogTail(path, capacity=500, block_size=1024)
+        live = [e for e in tail.poll() if e.level == "error"]
+        assert len(tail.blocks) > 2
+        entries = tail.history(levels={"error"}, limit=1000)
+        assert [(e.id, e.source) for e in entries] == [(e.id, e.source) for e in live]
+        assert len(entries) == 201
@@ -0,0 +1,139 @@
+"""Tests for automatic minimap overview generalization."""
+
+import json
+import math
+
+from chuk_view_schemas import LayerSource, MapLayer, MinimapLayer, MinimapPane
+from chuk_view_schemas.minimap_builder import (
+    build_minimap,
+    build_overview,
+    generalize_features,
+)
+
+
+def _wiggly_line(n: int) -> dict:
+    coords = [[i / n, 0.01 * math.sin(i / 3)] for i in range(n)]
+    return {
+        "type": "Feature",
+        "geometry": {"type": "LineString", "coordinates": coords},
+        "properties": {"name": "river", "length": n},
+    }
+
+
+def _points(n: int) -> list:
+    return [
+        {
+            "type": "Feature",
+            "geometry": {
+                "type": "Point",
+                "coordinates": [(i % 100) / 100, (i // 100) / 100],
+            },
+            "properties": {"id": i, "name": f"p{i}"},
+        }
+        for i in range(n)
+    ]
+
+
+def _size(obj) -> int:
+    return len(json.dumps(obj, separators=(",", ":")))
+
+
+class TestGeneralizeFeatures:
+    def test_simplifies_lines_and_strips_properties(self):
+        fc = {"type": "FeatureCollection", "features": [_wiggly_line(2000)]}
+        out = generalize_features(fc, tolerance=0.05, cell_size=0.1)
+        line = out["features"][0]
+        assert line["geometry"]["type"] == "LineString"
+        assert 2 <= len(line["geometry"]["coordinates"]) < 100
+        assert line["properties"] == {}
+
+    def test_keeps_requested_properties(self):
+        fc = {"type": "FeatureCollection", "features": [_wiggly_line(50)]}
+        out = generalize_features(fc, tolerance=0.05, cell_size=0.1, keep={"name"})
+        assert out["features"][0]["properties"] == {"name": "river"}
+
+    def test_points_are_aggregated_into_cells(self):
+        fc = {"type": "FeatureCollection", "features": _points(10_000)}
+        out = generalize_features(fc, tolerance=0.01, cell_size=0.5)
+        counts = [f["properties"]["count"] for f in out["features"]]
+        assert len(counts) == 4
+        assert sum(counts) == 10_000
+
+    def test_collapsed_polygons_are_dropped(self):
+        tiny = {
+            "type": "Feature",
+            "geometry": {
+                "type": "Polygon",
+                "coordinates": [[[0, 0], [1e-6, 0], [1e-6, 1e-6], [0, 0]]],
+            },
+            "properties": {},
+        }
+        out = generalize_features(
+            {"type": "FeatureCollection", "features": [tiny]},
+            tolerance=0.01,
+            cell_size=0.1,
+        )
+        assert out["features"] == []
+
+
+class TestBuildOverview:
+    def _detail(self) -> MinimapPane:
+        return MinimapPane(
+            layers=[
+                MinimapLayer(
+                    id="rivers",
+                    label="Rivers",
+                    features={
+                        "type": "FeatureCollection",
+                        "features": [_wiggly_line(5000)],
+                    },
+                ),
+                MinimapLayer(
+                    id="sites",
+                    label="Sites",
+                    features={"type": "FeatureCollection", "features": _points(5000)},
+                ),
+            ]
+        )
+
+    def test_overview_fits_fraction_of_detail(self):
+        detail = self._detail()
+        overview = build_overview(detail.layers, max_fraction=0.05)
+        detail_size = _size([layer.features for layer in detail.layers])
+        overview_size = _size([layer.features for layer in overview.layers])
+        assert overview_size <= detail_size * 0.05
+        assert [layer.id for layer in overview.layers] == ["rivers", "sites"]
+        assert overview.center is not None
+        assert overview.zoom is not None
+
+    def test_build_minimap_keeps_detail_untouched(self):
+        detail = self._detail()
+        content = build_minimap(detail, title="Sites", max_bytes=20_000)
+        assert content.detail is detail
+        assert content.title == "Sites"
+        assert _size([layer.features for layer in content.overview.layers]) <= 20_000
+
+    def test_source_layers_are_skipped(self):
+        layers = [
+            MapLayer(
+                id="sites",
+                label="Sites",
+                features={"type": "FeatureCollection", "features": _points(100)},
+            ),
+            MapLayer(id="parcels", label="Parcels", source=LayerSource(tool="parcels")),
+        ]
+        overview = build_overview(layers)
+        assert [layer.id for layer in overview.layers] == ["sites"]
+
+    def test_empty_layers(self):
+        overview = build_overview(
+            [
+                {
+                    "id": "empty",
+                    "label": "Empty",
+                    "features": {"type": "FeatureCollection", "features": []},
+                }
+            ]
+        )
+        assert overview.center is None
+        assert overview.layers[0].features["features"] == []
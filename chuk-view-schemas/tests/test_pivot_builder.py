@@ -0,0 +1,130 @@
+"""Tests for the server-side pivot engine."""
+
+import numpy as np
+import pytest
+
+from chuk_view_schemas import CrosstabContent, PivotContent, PivotValue
+from chuk_view_schemas.pivot_builder import aggregate, pivot
+
+RECORDS = [
+    {"region": "North", "quarter": "Q1", "amount": 10},
+    {"region": "North", "quarter": "Q1", "amount": 30},
+    {"region": "North", "quarter": "Q2", "amount": 5},
+    {"region": "South", "quarter": "Q2", "amount": 7},
+    {"region": "South", "quarter": "Q2", "amount": "n/a"},
+    {"region": "East", "quarter": "Q1", "amount": 1},
+]
+
+
+class TestAggregate:
+    @pytest.mark.parametrize(
+        "how, expected",
+        [
+            ("sum", [4.0, 5.0, np.nan]),
+            ("avg", [2.0, 5.0, np.nan]),
+            ("count", [2.0, 1.0, 0.0]),
+            ("min", [1.0, 5.0, np.nan]),
+            ("max", [3.0, 5.0, np.nan]),
+        ],
+    )
+    def test_each_aggregate(self, how, expected):
+        codes = np.array([0, 0, 1, 2])
+        v = np.array([1.0, 3.0, 5.0, np.nan])
+        np.testing.assert_array_equal(aggregate(codes, v, 3, how), expected)
+
+    def test_unknown(self):
+        with pytest.raises(ValueError):
+            aggregate(np.zeros(1, dtype=int), np.ones(1), 1, "median")
+
+
+class TestPivot:
+    def test_keys_and_cells(self):
+        table = pivot(
+            RECORDS, rows=["region"], columns=["quarter"], values=[("amount", "sum")]
+        )
+        assert table.row_keys == [("North",), ("South",), ("East",)]
+        assert table.column_keys == [("Q1",), ("Q2",)]
+        np.testing.assert_array_equal(
+            table.cells[0], [[40, 5], [np.nan, 7], [1, np.nan]]
+        )
+        assert table.grand_totals == [53.0]
+
+    def test_totals_are_exact_for_avg(self):
+        table = pivot(
+            RECORDS, rows=["region"], columns=["quarter"], values=[("amount", "avg")]
+        )
+        assert table.row_totals[0][0] == pytest.approx(15.0)
+        assert table.grand_totals[0] == pytest.approx(53 / 5)
+
+    def test_columnar_input_and_multi_dims(self):
+        data = {
+            "a": ["x", "x", "y"],
+            "b": [1, 2, 1],
+            "c": ["p", "q", "p"],
+            "v": [1.0, 2.0, 3.0],
+        }
+        table = pivot(data, rows=["a", "b"], columns=["c"], values=[("v", "count")])
+        assert table.row_keys == [("x", "1"), ("x", "2"), ("y", "1")]
+        assert table.cells[0].tolist() == [[1, 0], [0, 1], [1, 0]]
+
+    def test_high_cardinality_fields_do_not_overflow(self):
+        # 5 fields of 2**13 labels: 2**65 combinations. Rows whose first
+        # field differs by 2**12 would collide in a wrapped int64 code.
+        n = 2**13
+        ids = np.arange(2 * n) % n
+        first = np.concatenate([np.arange(n), (np.arange(n) + n // 2) % n])
+        data = {"k0": [f"{i:05d}" for i in first]}
+        for k in range(1, 5):
+            data[f"k{k}"] = [f"{i:05d}" for i in ids]
+        data["v"] = np.ones(2 * n)
+        table = pivot(data, rows=[f"k{k}" for k in range(5)], values=[("v", "count")])
+        assert len(table.row_keys) == 2 * n
+        assert table.row_keys[0] == ("00000",) * 5
+
+    def test_large_input_is_vectorized(self):
+        rng = np.random.default_rng(0)
+        n = 200_000
+        data = {
+            "store": rng.integers(0, 50, n),
+            "day": rng.integers(0, 7, n),
+            "sales": rng.uniform(0, 100, n),
+        }
+        table = pivot(data, rows=["store"], columns=["day"], values=[("sales", "max")])
+        assert table.cells[0].shape == (50, 7)
+        assert np.nanmax(table.cells[0]) == pytest.approx(data["sales"].max())
+
+
+class TestOutputs:
+    def test_pivot_content_is_pre_aggregated(self):
+        table = pivot(
+            RECORDS,
+            rows=["region"],
+            columns=["quarter"],
+            values=[("amount", "sum"), ("amount", "count")],
+        )
+        content = table.to_pivot_content(show_totals=True)
+        assert isinstance(content, PivotContent)
+        assert len(content.data) == 4
+        assert content.values[1] == PivotValue(
+            field="count_amount", aggregate="sum", label="count(amount)"
+        )
+        north_q1 = next(
+            r for r in content.data if r["region"] == "North" and r["quarter"] == "Q1"
+        )
+        assert north_q1 == {
+            "region": "North",
+            "quarter": "Q1",
+            "sum_amount": 40.0,
+            "count_amount": 2.0,
+        }
+
+    def test_crosstab_with_exact_totals(self):
+        table = pivot(
+            RECORDS, rows=["region"], columns=["quarter"], values=[("amount", "min")]
+        )
+        content = table.to_crosstab(title="Min amount")
+        assert isinstance(content, CrosstabContent)
+        assert content.row_headers == ["North", "South", "East", "Total"]
+        assert content.column_headers == ["Q1", "Q2", "Total"]
+        assert content.values[0] == [10, 5, 5]
+        assert content.values[-1] == [1, 5, 1]
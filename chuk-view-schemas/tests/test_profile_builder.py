@@ -0,0 +1,84 @@
+"""Tests for the elevation/route profile builder."""
+
+import time
+
+import numpy as np
+import pytest
+
+from chuk_view_schemas.profile_builder import (
+    build_profile,
+    cumulative_distance,
+    resample_profile,
+)
+
+
+def _track(n: int):
+    lon = np.linspace(-3.0, -2.0, n)
+    lat = np.full(n, 54.0)
+    ele = 200 + 100 * np.sin(np.linspace(0, 6 * np.pi, n))
+    return lon, lat, ele
+
+
+class TestCumulativeDistance:
+    def test_one_degree_of_latitude(self):
+        d = cumulative_distance([0.0, 0.0], [0.0, 1.0])
+        assert d[0] == 0
+        assert d[-1] == pytest.approx(111_195, rel=1e-3)
+
+    def test_monotonic(self):
+        lon, lat, _ = _track(100)
+        assert np.all(np.diff(cumulative_distance(lon, lat)) >= 0)
+
+
+class TestResample:
+    def test_uniform_grid_keeps_exact_peaks(self):
+        distance = np.array([0.0, 1.0, 2.0, 3.0])
+        elevation = np.array([0.0, 10.0, 0.0, 5.0])
+        x, y = resample_profile(distance, elevation, n_points=3)
+        assert y.max() == 10.0
+        assert x.tolist() == sorted(x.tolist())
+
+    def test_spacing(self):
+        x, _ = resample_profile(
+            np.array([0.0, 10.0]), np.array([0.0, 1.0]), spacing=2.5, keep_peaks=False
+        )
+        assert x.tolist() == [0.0, 2.5, 5.0, 7.5, 10.0]
+
+
+class TestBuildProfile:
+    def test_from_linestring(self):
+        lon, lat, ele = _track(500)
+        line = {
+            "type": "Feature",
+            "geometry": {
+                "type": "LineString",
+                "coordinates": np.column_stack((lon, lat, ele)).tolist(),
+            },
+        }
+        content = build_profile(line, n_points=100, title="Ridge")
+        assert content.title == "Ridge"
+        assert content.x_label == "Distance (km)"
+        assert 100 <= len(content.points) <= 102
+        assert content.points[0].x == 0
+        assert content.points[-1].x == pytest.approx(65.4, rel=0.01)
+        assert max(p.y for p in content.points) == pytest.approx(ele.max())
+
+    def test_simplify_keeps_peaks(self):
+        lon, lat, ele = _track(10_000)
+        content = build_profile(lon=lon, lat=lat, elevation=ele, simplify_tolerance=5)
+        ys = [p.y for p in content.points]
+        assert len(ys) < 1000
+        assert max(ys) == pytest.approx(ele.max(), abs=5)
+        assert min(ys) == pytest.approx(ele.min(), abs=5)
+
+    def test_large_track_is_fast(self):
+        lon, lat, ele = _track(100_000)
+        start = time.perf_counter()
+        content = build_profile(lon=lon, lat=lat, elevation=ele, n_points=1000)
+        assert time.perf_counter() - start < 1.0
+        assert len(content.points) <= 1002
+
+    def test_missing_elevation(self):
+        line = {"type": "LineString", "coordinates": [[0, 0], [1, 1]]}
+        with pytest.raises(ValueError):
+            build_profile(line)
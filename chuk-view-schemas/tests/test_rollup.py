@@ -0,0 +1,116 @@
+"""Tests for the timeseries rollup pyramid store."""
+
+import time
+
+import numpy as np
+import pytest
+
+from chuk_view_schemas.rollup import RollupPyramid, RollupStore
+from chuk_view_schemas.timeseries import TimeseriesContent
+
+T0 = 1_700_000_000.0  # 2023-11-14T22:13:20Z
+
+
+def _series(n: int, step: float = 1.0):
+    t = T0 + np.arange(n) * step
+    v = np.sin(np.arange(n) / 50.0) * 10
+    return t, v
+
+
+class TestRollupPyramid:
+    def test_levels_halve(self):
+        pyramid = RollupPyramid.from_arrays(*_series(1000))
+        sizes = [len(level) for level in pyramid.levels]
+        assert sizes[0] == 1000
+        assert sizes[1] == 500
+        assert sizes[-1] == 1
+
+    def test_aggregates_match_raw(self):
+        t, v = _series(1024)
+        pyramid = RollupPyramid.from_arrays(t, v)
+        top = pyramid.levels[-1]
+        assert top.count[0] == 1024
+        assert top.min[0] == pytest.approx(v.min())
+        assert top.max[0] == pytest.approx(v.max())
+        assert top.sum[0] == pytest.approx(v.sum())
+
+    def test_level_choice_bounds_output(self):
+        pyramid = RollupPyramid.from_arrays(*_series(100_000))
+        times, values = pyramid.query(T0, T0 + 100_000, max_points=500)
+        assert 0 < len(times) <= 500
+        assert times.size == values.size
+        times, _ = pyramid.query(T0 + 100, T0 + 200, max_points=500)
+        assert len(times) == 100
+
+    def test_min_max_stats(self):
+        t, v = _series(4096)
+        pyramid = RollupPyramid.from_arrays(t, v)
+        _, lows = pyramid.query(T0, T0 + 4096, max_points=16, stat="min")
+        _, highs = pyramid.query(T0, T0 + 4096, max_points=16, stat="max")
+        assert lows.min() == pytest.approx(v.min())
+        assert highs.max() == pytest.approx(v.max())
+
+    def test_gaps_are_skipped(self):
+        t = np.array([T0, T0 + 1, T0 + 100])
+        pyramid = RollupPyramid.from_arrays(t, [1.0, 2.0, 3.0])
+        times, values = pyramid.query(T0, T0 + 101, max_points=1000)
+        assert times.tolist() == [T0, T0 + 1, T0 + 100]
+        assert values.tolist() == [1.0, 2.0, 3.0]
+
+    def test_datetime64_input_and_nan(self):
+        t = np.array(["2024-01-01T00:00:00", "2024-01-01T00:00:01"], "datetime64[s]")
+        pyramid = RollupPyramid.from_arrays(t, [np.nan, 5.0])
+        assert pyramid.levels[0].count.sum() == 1
+
+    def test_empty_raises(self):
+        with pytest.raises(ValueError):
+            RollupPyramid.from_arrays([T0], [np.nan])
+
+    def test_save_and_mmap_load(self, tmp_path):
+        t, v = _series(5000)
+        pyramid = RollupPyramid.from_arrays(t, v)
+        pyramid.save(tmp_path / "cpu")
+        loaded = RollupPyramid.load(tmp_path / "cpu")
+        assert isinstance(loaded.levels[0].sum, np.memmap)
+        a = pyramid.query(T0, T0 + 5000, max_points=100)
+        b = loaded.query(T0, T0 + 5000, max_points=100)
+        np.testing.assert_allclose(a[1], b[1])
+
+    def test_query_cost_is_independent_of_size(self):
+        pyramid = RollupPyramid.from_arrays(*_series(2_000_000))
+        start = time.perf_counter()
+        for _ in range(100):
+            pyramid.query(T0, T0 + 2_000_000, max_points=1000)
+        assert time.perf_counter() - start < 0.5
+
+
+class TestRollupStore:
+    def test_query_returns_timeseries_content(self):
+        store = RollupStore(zoom_tool="zoom_metrics", title="CPU")
+        store.add("cpu", *_series(10_000), color="#f00")
+        content = store.query(max_points=200)
+        assert isinstance(content, TimeseriesContent)
+        assert content.zoom_tool == "zoom_metrics"
+        assert content.series[0].color == "#f00"
+        assert len(content.series[0].data) <= 200
+        dumped = content.model_dump(by_alias=True, exclude_none=True)
+        assert dumped["zoomTool"] == "zoom_metrics"
+        assert dumped["series"][0]["data"][0]["t"] == "2023-11-14T22:13:20.000Z"
+
+    def test_iso_window(self):
+        store = RollupStore()
+        store.add("a", *_series(10_000))
+        content = store.query(
+            "2023-11-14T22:13:20Z", "2023-11-14T22:14:20Z", max_points=1000
+        )
+        assert len(content.series[0].data) == 60
+        t, _ = _series(10_000)
+        content = store.query(t[0], np.float64(t[60]), max_points=1000)
+        assert len(content.series[0].data) == 60
+
+    def test_series_filter(self):
+        store = RollupStore()
+        store.add("a", *_series(100))
+        store.add("b", *_series(100))
+        content = store.query(series=["b"])
+        assert [s.label for s in content.series] == ["b"]
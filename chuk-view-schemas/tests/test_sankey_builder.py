@@ -0,0 +1,118 @@
+"""Tests for the path-based Sankey builder."""
+
+import pytest
+
+from chuk_view_schemas import SankeyContent
+from chuk_view_schemas.sankey_builder import SankeyBuilder, sankey_from_paths
+
+PATHS = [
+    ["home", "search", "product", "cart"],
+    ["home", "search", "home", "search"],
+    ["home", "product", "cart"],
+    ["home", "search", "product"],
+]
+
+
+def _links(content: SankeyContent) -> dict:
+    return {(link.source, link.target): link.value for link in content.links}
+
+
+def _flows(content: SankeyContent) -> tuple[dict, dict]:
+    flow_in, flow_out = {}, {}
+    for link in content.links:
+        flow_out[link.source] = flow_out.get(link.source, 0) + link.value
+        flow_in[link.target] = flow_in.get(link.target, 0) + link.value
+    return flow_in, flow_out
+
+
+class TestSankeyBuilder:
+    def test_step_indexing_breaks_cycles(self):
+        content = sankey_from_paths(PATHS)
+        links = _links(content)
+        assert links[("0:home", "1:search")] == 3
+        assert links[("1:search", "2:home")] == 1
+        assert links[("2:home", "3:search")] == 1
+        # Every link moves one step to the right: no cycles
+        assert all(
+            int(link.target.split(":")[0]) == int(link.source.split(":")[0]) + 1
+            for link in content.links
+        )
+        assert {n.id for n in content.nodes} == {
+            n for link in content.links for n in (link.source, link.target)
+        }
+        assert next(n for n in content.nodes if n.id == "2:home").label == "home"
+
+    def test_collapse_repeats_and_max_steps(self):
+        content = sankey_from_paths([["a", "a", "b", "c", "d"]], max_steps=2)
+        assert _links(content) == {("0:a", "1:b"): 1, ("1:b", "2:c"): 1}
+        builder = SankeyBuilder(collapse_repeats=False)
+        builder.add_path(["a", "a"])
+        assert _links(builder.build()) == {("0:a", "1:a"): 1}
+
+    def test_min_value_merges_nodes_into_other(self):
+        paths = [["a", "b"]] * 10 + [["a", "c"], ["a", "d"], ["a", "e"]]
+        content = sankey_from_paths(paths, min_value=2)
+        assert _links(content) == {("0:a", "1:b"): 10, ("0:a", "1#other"): 3}
+        assert content.nodes[-1].label == "Other"
+
+    def test_real_other_state_stays_separate(self):
+        paths = [["a", "Other"]] * 5 + [["a", "c"], ["a", "d"]]
+        content = sankey_from_paths(paths, min_value=2)
+        assert _links(content) == {("0:a", "1:Other"): 5, ("0:a", "1#other"): 2}
+        assert [n.label for n in content.nodes] == ["a", "Other", "Other"]
+
+    def test_other_preserves_flow_conservation(self):
+        paths = [["a", x, "z"] for x in "bcdefg"] + [["a", "b", "y"]] * 5
+        content = sankey_from_paths(paths, max_nodes_per_step=2)
+        flow_in, flow_out = _flows(content)
+        for node in set(flow_in) & set(flow_out):
+            assert flow_in[node] == flow_out[node]
+        assert sum(link.value for link in content.links if link.source == "0:a") == 11
+
+    def test_event_stream(self):
+        builder = SankeyBuilder()
+        events = [("u1", "home"), ("u2", "home"), ("u1", "search"), ("u2", "cart")]
+        events += [("u1", "cart")]
+        for session, state in events:
+            builder.add_event(session, state)
+        assert _links(builder.build()) == {
+            ("0:home", "1:search"): 1,
+            ("0:home", "1:cart"): 1,
+            ("1:search", "2:cart"): 1,
+        }
+
+    def test_session_cap_and_close(self):
+        builder = SankeyBuilder(max_sessions=1)
+        builder.add_event("u1", "a")
+        builder.add_event("u2", "a")  # evicts u1
+        builder.add_event("u2", "b")
+        builder.add_event("u1", "c")  # u1 starts afresh, evicting u2
+        builder.add_event("u1", "d")
+        builder.close("u1")
+        builder.add_event("u1", "e")  # starts afresh again
+        assert _links(builder.build()) == {("0:a", "1:b"): 1, ("0:c", "1:d"): 1}
+
+    def test_bounded_links_fold_into_other(self):
+        builder = SankeyBuilder(max_links=10)
+        for i in range(200):
+            builder.add_path(["start", f"p{i % 50}"], weight=1 + (i % 50 == 0) * 100)
+        assert len(builder) <= 20
+        content = builder.build()
+        links = _links(content)
+        # Total flow out of the start node survives compaction
+        assert sum(v for (s, _), v in links.items() if s == "0:start") == 200 + 400
+        assert links[("0:start", "1:p0")] == 404
+        assert ("0:start", "1#other") in links
+        assert builder.folded > 0
+
+    def test_rejects_bad_limits(self):
+        with pytest.raises(ValueError):
+            SankeyBuilder(max_links=0)
+
+    def test_many_paths(self):
+        paths = (
+            [f"s{i % 7}", f"s{(i * 3) % 7}", f"s{(i * 5) % 11}"] for i in range(100_000)
+        )
+        content = sankey_from_paths(paths, min_value=1000)
+        assert sum(v for (s, _), v in _links(content).items() if s.startswith("0:")) > 0
+        assert len(content.nodes) < 40
@@ -0,0 +1,94 @@
+"""Tests for scatter density binning."""
+
+import numpy as np
+import pytest
+
+from chuk_view_schemas import HeatmapContent, ScatterContent
+from chuk_view_schemas.scatter_density import (
+    density_grid,
+    reduce_scatter,
+    reduce_scatter_structured,
+)
+
+
+def _blob_with_outliers(n: int = 20_000, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    xy = rng.normal(0, 1, size=(n, 2))
+    outliers = np.array([[40.0, 40.0], [-40.0, 35.0]])
+    return np.vstack((xy, outliers))
+
+
+def _content(xy: np.ndarray) -> ScatterContent:
+    return ScatterContent.model_validate(
+        {
+            "datasets": [
+                {
+                    "label": "A",
+                    "points": [{"x": x, "y": y} for x, y in xy.tolist()],
+                }
+            ]
+        }
+    )
+
+
+class TestDensityGrid:
+    @pytest.mark.parametrize("kind", ["hex", "rect"])
+    def test_counts_cover_all_points(self, kind):
+        xy = _blob_with_outliers(5000)
+        grid = density_grid(xy[:, 0], xy[:, 1], gridsize=30, kind=kind)
+        assert grid.counts.sum() == len(xy)
+        assert grid.cell.shape == (len(xy),)
+
+    def test_hex_points_go_to_nearest_centre(self):
+        rng = np.random.default_rng(1)
+        x, y = rng.uniform(0, 10, 2000), rng.uniform(0, 10, 2000)
+        grid = density_grid(x, y, gridsize=10, kind="hex")
+        own = np.hypot(x - grid.center_x[grid.cell], y - grid.center_y[grid.cell])
+        all_d = np.hypot(x[:, None] - grid.center_x, y[:, None] - grid.center_y)
+        np.testing.assert_allclose(own, all_d.min(axis=1))
+
+    def test_centroids_inside_extent(self):
+        xy = _blob_with_outliers(1000)
+        grid = density_grid(xy[:, 0], xy[:, 1], gridsize=20, kind="rect")
+        assert grid.mean_x.min() >= xy[:, 0].min()
+        assert grid.mean_y.max() <= xy[:, 1].max()
+
+    def test_unknown_kind(self):
+        with pytest.raises(ValueError):
+            density_grid([0, 1], [0, 1], kind="tri")
+
+
+class TestReduceScatter:
+    def test_below_threshold_unchanged(self):
+        content = _content(_blob_with_outliers(100))
+        assert reduce_scatter(content, threshold=1000) == content
+
+    def test_centroids_and_outliers(self):
+        xy = _blob_with_outliers()
+        reduced = reduce_scatter(_content(xy), threshold=1000, gridsize=50)
+        assert isinstance(reduced, ScatterContent)
+        points = reduced.datasets[0].points
+        assert len(points) < 3000
+        coords = {(p.x, p.y) for p in points}
+        assert (40.0, 40.0) in coords
+        assert (-40.0, 35.0) in coords
+        total = sum(
+            int(p.label.split()[0]) if p.label and p.label.endswith("points") else 1
+            for p in points
+        )
+        assert total == len(xy)
+
+    def test_heatmap_output(self):
+        xy = _blob_with_outliers()
+        heatmap = reduce_scatter(
+            _content(xy), threshold=1000, gridsize=20, output="heatmap"
+        )
+        assert isinstance(heatmap, HeatmapContent)
+        assert len(heatmap.rows) == len(heatmap.values) == 20
+        assert len(heatmap.columns) == 20
+        assert sum(map(sum, heatmap.values)) == len(xy)
+        assert float(heatmap.rows[0]) > float(heatmap.rows[-1])
+
+    def test_structured_ignores_other_views(self):
+        payload = {"type": "chart", "data": []}
+        assert reduce_scatter_structured(payload, 0) is payload
@@ -0,0 +1,205 @@
+"""Tests for the terminal stream engine."""
+
+import pytest
+
+from chuk_view_schemas.terminal import TerminalContent
+from chuk_view_schemas.terminal_stream import TerminalStream
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _stream(**kwargs) -> TerminalStream:
+    kwargs.setdefault("min_interval", 0.0)
+    return TerminalStream("term", **kwargs)
+
+
+class TestLineEditing:
+    def test_plain_lines(self):
+        term = _stream()
+        term.write("hello\nworld\n")
+        assert term.lines == ["hello", "world"]
+
+    def test_carriage_return_progress_is_one_line(self):
+        term = _stream()
+        for i in range(10_000):
+            term.write(f"\r{i / 100:5.1f}%|{'#' * (i // 500):<20}|")
+        term.write("\n")
+        assert len(term) == 1
+        assert term.lines == ["100.0%|" + "#" * 19 + " |"]
+
+    def test_overwrite_keeps_longer_tail(self):
+        term = _stream()
+        term.write("abcdef\rXY\n")
+        assert term.lines == ["XYcdef"]
+
+    def test_erase_in_line(self):
+        term = _stream()
+        term.write("abcdef\r\x1b[Kxy\n")
+        term.write("abcdef\x1b[3D\x1b[1K\n")
+        term.write("abcdef\x1b[2Kz\n")
+        assert term.lines == ["xy", "    ef", "      z"]
+
+    def test_backspace_tab_and_column(self):
+        term = _stream()
+        term.write("ab\bc\tx\x1b[2Gy\n")
+        assert term.lines == ["ay      x"]
+
+    def test_unsupported_sequences_dropped(self):
+        term = _stream()
+        term.write("\x1b]0;title\x07a\x1b[2Jb\x1b[1Ac\x07\n")
+        assert term.lines == ["abc"]
+
+    def test_escape_split_across_writes(self):
+        term = _stream()
+        term.write("ok \x1b[3")
+        term.write("2mgreen\x1b")
+        term.write("[0m\n")
+        assert term.lines == ["ok \x1b[32mgreen\x1b[0m"]
+
+    def test_unterminated_osc_dropped_at_newline(self):
+        term = _stream()
+        term.write("a\x1b]0;title")
+        term.write(" still title\nb\n")
+        assert term.lines == ["a", "b"]
+
+    def test_unterminated_osc_carry_is_bounded(self):
+        term = _stream()
+        term.write("\x1b]0;")
+        for _ in range(1000):
+            term.write("x" * 100)
+        assert len(term._cursors["stdout"].carry) <= 4096
+        term.write("\x07done\n")
+        assert term.lines == ["done"]
+
+    def test_utf8_split_across_writes(self):
+        term = _stream()
+        data = "héllo ✓\n".encode()
+        for i in range(len(data)):
+            term.write(data[i : i + 1])
+        assert term.lines == ["héllo ✓"]
+
+    def test_streams_are_independent(self):
+        term = _stream()
+        term.write("out ")
+        term.write("err\n", "stderr")
+        term.write("line\n")
+        assert term.lines == ["err", "out line"]
+
+
+class TestColour:
+    def test_sgr_preserved(self):
+        term = _stream()
+        term.write("\x1b[1;31mfail\x1b[0m done\n")
+        assert term.lines == ["\x1b[1;31mfail\x1b[0m done"]
+
+    def test_overwrite_keeps_colour(self):
+        term = _stream()
+        term.write("\x1b[31mred\rX\n")
+        term.write("\x1b[0mab\x1b[32mcd\x1b[0m\rxyz\n")
+        assert term.lines == [
+            "\x1b[31mXed",
+            "\x1b[31m\x1b[0mxyz\x1b[32md\x1b[0m",
+        ]
+
+    def test_colour_carried_into_chunks(self):
+        term = _stream(max_chunk_lines=2)
+        term.write("\x1b[33mone\ntwo\nthree\x1b[0m\nfour\n")
+        snap = term.snapshot()
+        assert [line.text for line in snap.lines] == [
+            "\x1b[33mone\ntwo",
+            "\x1b[33mthree\x1b[0m\nfour",
+        ]
+
+
+class TestCoalescing:
+    def test_same_stream_joined(self):
+        term = _stream()
+        term.write("a\nb\n")
+        term.write("c\n", "stderr")
+        term.write("d\n")
+        snap = term.snapshot()
+        assert isinstance(snap, TerminalContent)
+        assert [(line.type, line.text) for line in snap.lines] == [
+            ("stdout", "a\nb"),
+            ("stderr", "c"),
+            ("stdout", "d"),
+        ]
+
+    def test_chunk_size_bounded(self):
+        term = _stream(max_chunk_lines=100)
+        term.write("x\n" * 1000)
+        assert len(term.snapshot().lines) == 10
+
+    def test_scrollback_bounded(self):
+        term = _stream(scrollback=50)
+        term.write("".join(f"{i}\n" for i in range(1000)))
+        assert len(term) == 50
+        assert term.lines[0] == "950"
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            TerminalStream(scrollback=0)
+
+
+class TestPatches:
+    def test_append_and_pending(self):
+        term = _stream()
+        term.snapshot()
+        term.write("built\n 10%")
+        ops = term.patch().ops
+        assert [op.action for op in ops] == ["append", "merge"]
+        assert ops[0].target_field == "lines"
+        assert ops[0].data == {"lines": [{"text": "built", "type": "stdout"}]}
+        assert ops[1].data == {"pending": [{"text": " 10%", "type": "stdout"}]}
+        assert term.patch() is None
+
+    def test_progress_updates_only_pending(self):
+        term = _stream()
+        term.snapshot()
+        term.write("\r 10%")
+        term.patch()
+        term.write("\r 90%")
+        ops = term.patch().ops
+        assert [op.action for op in ops] == ["merge"]
+        term.write("\r100%\n")
+        ops = term.patch().ops
+        assert ops[0].data["lines"] == [{"text": "100%", "type": "stdout"}]
+        assert ops[1].data == {"pending": []}
+
+    def test_rate_limited(self):
+        clock = FakeClock()
+        term = TerminalStream("term", min_interval=1.0, clock=clock)
+        term.snapshot()
+        term.write("a\n")
+        assert term.patch() is None
+        term.write("b\n")
+        clock.now = 1.0
+        assert term.patch().ops[0].data["lines"] == [{"text": "a\nb", "type": "stdout"}]
+        term.write("c\n")
+        assert term.patch(force=True) is not None
+
+    def test_close_flushes_pending(self):
+        term = _stream()
+        term.write("no newline")
+        assert term.snapshot().pending[0].text == "no newline"
+        term.close()
+        assert term.lines == ["no newline"]
+        assert term.patch().ops[0].data["lines"][0]["text"] == "no newline"
+
+    def test_throttled_patch_skips_scrollback_scan(self, monkeypatch):
+        clock = FakeClock()
+        term = TerminalStream("term", min_interval=1.0, clock=clock)
+        term.write("x\n" * 5000)
+        term.snapshot()
+        term.write("y\n")
+        monkeypatch.setattr(term, "_unsent", lambda: pytest.fail("scanned"))
+        assert term.patch() is None
+        monkeypatch.undo()
+        clock.now = 1.0
+        assert term.patch().ops[0].data["lines"] == [{"text": "y", "type": "stdout"}]
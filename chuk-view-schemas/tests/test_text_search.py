@@ -0,0 +1,157 @@
+"""Tests for incremental full-text search."""
+
+import random
+import time
+
+from chuk_view_schemas import Column, DataTableContent, LogEntry
+from chuk_view_schemas.text_search import (
+    LogSearch,
+    TableSearch,
+    TextIndex,
+    parse_query,
+)
+
+
+def _index(*docs) -> TextIndex:
+    index = TextIndex(("text",))
+    for doc in docs:
+        index.add((doc,))
+    return index
+
+
+class TestParseQuery:
+    def test_clauses(self):
+        clauses = parse_query('Error "connection reset" time* disk-full')
+        assert [(c.terms, c.prefix) for c in clauses] == [
+            (("error",), False),
+            (("connection", "reset"), False),
+            (("time",), True),
+            (("disk", "full"), False),
+        ]
+        assert parse_query('* "" ') == []
+
+
+class TestTextIndex:
+    def test_terms_are_anded_newest_first(self):
+        index = _index("disk full on node1", "disk ok", "node1 disk full again")
+        assert [h.doc for h in index.search("disk full")] == [2, 0]
+        assert [h.doc for h in index.search("disk", limit=1)] == [2]
+        assert index.search("missing") == []
+
+    def test_phrase(self):
+        index = _index("reset connection", "connection was reset", "connection reset")
+        assert [h.doc for h in index.search('"connection reset"')] == [2]
+
+    def test_prefix(self):
+        index = _index("timeout", "timed out", "time", "tim", "other")
+        assert [h.doc for h in index.search("time*")] == [2, 1, 0]
+        assert index.terms("tim") == ["tim", "time", "timed", "timeout"]
+        # Terms added after a prefix search are found by the next one
+        index.add(("timestamp",))
+        assert [h.doc for h in index.search("time*")] == [5, 2, 1, 0]
+
+    def test_prefix_expansion_cap(self):
+        index = TextIndex(("text",), max_expansions=2)
+        for doc in ["ab", "ac", "ac", "ad", "ad", "ad"]:
+            index.add((doc,))
+        assert sorted(h.doc for h in index.search("a*")) == [1, 2, 3, 4, 5]
+
+    def test_highlights(self):
+        index = _index("Connection reset by peer; connection closed")
+        hit = index.search('"connection reset" closed')[0]
+        assert hit.highlights == {"text": [(0, 16), (37, 43)]}
+        hit = index.search("conn*")[0]
+        assert hit.highlights == {"text": [(0, 10), (26, 36)]}
+
+    def test_highlights_keep_separators_out(self):
+        index = _index("foo,foo a-b")
+        assert index.search("foo")[0].highlights == {"text": [(0, 3), (4, 7)]}
+        assert index.search("a b")[0].highlights == {"text": [(8, 9), (10, 11)]}
+        assert index.search('"a b"')[0].highlights == {"text": [(8, 11)]}
+
+    def test_terms_match_query_tokens(self):
+        # Lower-casing "İ" adds a combining mark that \w does not match, so
+        # indexing must tokenize before lower-casing, as queries do
+        index = _index("Flights to İstanbul", "stanbul")
+        assert [h.doc for h in index.search("İstanbul")] == [0]
+        assert index.search("İstanbul")[0].highlights == {"text": [(11, 19)]}
+
+    def test_fields(self):
+        index = TextIndex(("message", "source"))
+        index.add(("started", "db-pool"))
+        index.add(("db pool started", "api"))
+        # A phrase must sit within one field
+        hits = index.search('"started db"')
+        assert hits == []
+        assert [h.doc for h in index.search("pool started")] == [1, 0]
+        assert index.search("pool started")[1].highlights == {
+            "message": [(0, 7)],
+            "source": [(3, 7)],
+        }
+
+    def test_fast_over_many_documents(self):
+        rng = random.Random(0)
+        words = [f"w{i}" for i in range(2000)]
+        index = TextIndex(("text",))
+        for i in range(50_000):
+            text = " ".join(rng.choices(words, k=6))
+            if i % 500 == 0:
+                text += " connection reset"
+            index.add((text,))
+        start = time.perf_counter()
+        hits = index.search('"connection reset" w1*', limit=50)
+        assert time.perf_counter() - start < 0.5
+        assert all(h.doc % 500 == 0 for h in hits)
+
+
+class TestLogSearch:
+    def test_search_content(self):
+        search = LogSearch(search_tool="search_log")
+        search.extend(
+            [
+                LogEntry(id="0", level="info", message="job started", source="runner"),
+                LogEntry(id="1", level="error", message="Disk full", source="writer"),
+                LogEntry(id="2", level="warning", message="disk at 90%"),
+                LogEntry(id="3", level="error", message="Disk full again"),
+            ]
+        )
+        content = search.search("disk")
+        assert [e.id for e in content.entries] == ["1", "2", "3"]
+        assert content.entries[0].highlights == [[0, 4]]
+        dumped = content.model_dump(by_alias=True, exclude_none=True)
+        assert dumped["searchTool"] == "search_log" and dumped["searchable"]
+
+        errors = search.search("disk", levels={"error"}, limit=1)
+        assert [e.id for e in errors.entries] == ["3"]
+        assert [e.id for e in search.search("writer").entries] == ["1"]
+
+    def test_level_filter_looks_further_back(self):
+        search = LogSearch()
+        search.add(LogEntry(id="old", level="error", message="boom"))
+        search.extend(LogEntry(level="info", message="boom") for _ in range(50))
+        assert [
+            e.id for e in search.search("boom", levels={"error"}, limit=5).entries
+        ] == ["old"]
+
+
+class TestTableSearch:
+    def test_text_columns_only(self):
+        content = DataTableContent(
+            columns=[
+                Column(key="name", label="Name"),
+                Column(key="status", label="Status", type="badge"),
+                Column(key="count", label="Count", type="number"),
+            ],
+            rows=[
+                {"name": "alpha service", "status": "ok", "count": 42},
+                {"name": "beta", "status": "degraded", "count": 7},
+                {"name": "gamma 42", "status": "ok", "count": 1},
+            ],
+        )
+        table = TableSearch.from_content(content, search_tool="search_table")
+        result = table.search("ok")
+        assert [r["name"] for r in result.rows] == ["alpha service", "gamma 42"]
+        assert result.highlights == [{"status": [[0, 2]]}, {"status": [[0, 2]]}]
+        # Numbers are not indexed, digits in text are
+        assert [r["name"] for r in table.search("42").rows] == ["gamma 42"]
+        assert result.model_dump(by_alias=True)["searchTool"] == "search_table"
@@ -0,0 +1,193 @@
+"""Tests for the live sliding-window timeseries stream."""
+
+import numpy as np
+import pytest
+
+from chuk_view_schemas.patch import SetErrorOp, UIPatch, UpdatePanelOp
+from chuk_view_schemas.timeseries_stream import RingBuffer, TimeseriesStream
+
+T0 = 1_700_000_000.0
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestRingBuffer:
+    def test_wraps_oldest_first(self):
+        buf = RingBuffer(3)
+        buf.extend(np.arange(5.0), np.arange(5.0) * 10)
+        t, v = buf.arrays()
+        assert t.tolist() == [2.0, 3.0, 4.0]
+        assert v.tolist() == [20.0, 30.0, 40.0]
+        buf.extend(np.array([5.0]), np.array([50.0]))
+        assert buf.arrays()[0].tolist() == [3.0, 4.0, 5.0]
+
+    def test_invalid_capacity(self):
+        with pytest.raises(ValueError):
+            RingBuffer(0)
+
+
+class TestPatchModels:
+    def test_round_trip(self):
+        patch = UIPatch(
+            ops=[UpdatePanelOp(panel_id="p", action="append", data={"x": [1]})]
+        )
+        dumped = patch.model_dump(by_alias=True, exclude_none=True)
+        assert dumped["type"] == "ui_patch"
+        assert dumped["ops"][0]["panelId"] == "p"
+        assert UIPatch.model_validate(dumped) == patch
+
+    def test_discriminated_ops(self):
+        patch = UIPatch.model_validate(
+            {"ops": [{"op": "set-loading", "panelId": "p", "loading": True}]}
+        )
+        assert patch.ops[0].loading is True
+
+    def test_cleared_error_is_serialised(self):
+        patch = UIPatch(ops=[SetErrorOp(panel_id="p", error=None)])
+        dumped = patch.model_dump(by_alias=True, exclude_none=True)
+        assert dumped["ops"][0] == {"op": "set-error", "panelId": "p", "error": None}
+
+    def test_all_dashboard_ops(self):
+        ops = [
+            {"op": "add-panel", "panel": {"id": "p", "structuredContent": {}}},
+            {"op": "remove-panel", "panelId": "p"},
+            {"op": "update-panel", "panelId": "p", "action": "merge", "data": {}},
+            {"op": "show-panel", "panelId": "p", "visible": False},
+            {"op": "collapse-panel", "panelId": "p", "collapsed": True},
+            {
+                "op": "add-link",
+                "link": {
+                    "source": "a",
+                    "target": "b",
+                    "type": "filter",
+                    "sourceField": "x",
+                    "targetField": "y",
+                },
+            },
+            {"op": "remove-link", "source": "a", "target": "b"},
+            {"op": "update-layout", "layout": "tabs"},
+            {"op": "set-loading", "panelId": "p", "loading": True},
+            {"op": "set-error", "panelId": "p", "error": None},
+        ]
+        patch = UIPatch.model_validate({"ops": ops})
+        assert [op.op for op in patch.ops] == [op["op"] for op in ops]
+        dumped = patch.model_dump(by_alias=True, exclude_none=True)
+        assert dumped["ops"][5]["link"]["sourceField"] == "x"
+
+
+class TestTimeseriesStream:
+    def test_window_is_bounded(self):
+        stream = TimeseriesStream("panel", window=100)
+        stream.push("cpu", T0 + np.arange(1000), np.arange(1000))
+        content = stream.snapshot()
+        data = content.series[0].data
+        assert len(data) == 100
+        assert data[-1].v == 999
+
+    def test_patch_batches_series(self):
+        clock = FakeClock()
+        stream = TimeseriesStream("panel", window=10, clock=clock)
+        stream.snapshot()
+        clock.now = 5
+        stream.push("cpu", T0, 1.0)
+        stream.push("mem", T0, 2.0)
+        patch = stream.patch()
+        assert len(patch.ops) == 2  # new series: full replace
+        op = patch.ops[0]
+        assert op.panel_id == "panel"
+        assert op.action == "replace"
+        assert op.target_field == "series"
+        assert [s["label"] for s in op.data["series"]] == ["cpu", "mem"]
+        assert patch.ops[1].data == {"appended": []}
+
+    def test_patch_appends_only_new_samples(self):
+        clock = FakeClock()
+        stream = TimeseriesStream("panel", window=10, clock=clock)
+        stream.push("cpu", T0 + np.arange(8), np.arange(8))
+        stream.push("mem", T0, 5.0)
+        assert stream.snapshot().window == 10
+        clock.now = 5
+        stream.push("cpu", [T0 + 8, T0 + 9], [8.0, 9.0])
+        ops = stream.patch().ops
+        assert len(ops) == 1
+        assert ops[0].action == "append"
+        assert ops[0].target_field == "appended"
+        (batch,) = ops[0].data["appended"]
+        assert batch["label"] == "cpu"
+        assert [p["v"] for p in batch["data"]] == [8.0, 9.0]
+
+    def test_patch_compacts_after_a_window(self):
+        clock = FakeClock()
+        stream = TimeseriesStream("panel", window=10, clock=clock)
+        stream.push("cpu", T0, 0.0)
+        stream.snapshot()
+        actions = []
+        for i in range(1, 13):
+            clock.now = i
+            stream.push("cpu", T0 + i, float(i))
+            actions.append([op.action for op in stream.patch().ops])
+        assert actions[:10] == [["append"]] * 10
+        assert actions[10] == ["replace", "merge"]
+        assert actions[11] == ["append"]
+
+    def test_compaction_is_per_series(self):
+        clock = FakeClock()
+        stream = TimeseriesStream("panel", window=10, clock=clock)
+        for label in ("a", "b", "c"):
+            stream.push(label, T0, 0.0)
+        stream.snapshot()
+        actions = []
+        for i in range(1, 11):
+            clock.now = i
+            for label in ("a", "b", "c"):
+                stream.push(label, T0 + i, float(i))
+            actions.append([op.action for op in stream.patch().ops])
+        assert actions == [["append"]] * 10
+
+    def test_cadence(self):
+        clock = FakeClock()
+        stream = TimeseriesStream("panel", min_interval=2.0, clock=clock)
+        stream.push("cpu", T0, 1.0)
+        assert stream.patch() is not None
+        stream.push("cpu", T0 + 1, 2.0)
+        clock.now = 1.0
+        assert stream.patch() is None
+        assert stream.patch(force=True) is not None
+        clock.now = 5.0
+        assert stream.patch() is None  # nothing new
+
+    def test_timestamp_inputs(self):
+        stream = TimeseriesStream("panel")
+        stream.push("a", "2024-01-01T00:00:00Z", 1.0)
+        stream.push("a", ["2024-01-01T00:00:01Z", "2024-01-01T00:00:02Z"], [2, 3])
+        data = stream.snapshot().series[0].data
+        assert [p.t for p in data] == [
+            "2024-01-01T00:00:00.000Z",
+            "2024-01-01T00:00:01.000Z",
+            "2024-01-01T00:00:02.000Z",
+        ]
+
+    def test_numpy_scalar_times(self):
+        stream = TimeseriesStream("panel")
+        times = T0 + np.arange(2)
+        stream.push("a", times[0], 1.0)
+        stream.push("a", np.int64(T0 + 1), np.float32(2.0))
+        assert [p.v for p in stream.snapshot().series[0].data] == [1.0, 2.0]
+
+    def test_sub_second_samples_keep_distinct_times(self):
+        stream = TimeseriesStream("panel")
+        stream.push("a", T0 + np.arange(4) * 0.25, np.arange(4))
+        data = stream.snapshot().series[0].data
+        assert [p.t for p in data] == [
+            f"2023-11-14T22:13:20.{ms}Z" for ms in ("000", "250", "500", "750")
+        ]
+
+    def test_length_mismatch(self):
+        with pytest.raises(ValueError):
+            TimeseriesStream("panel").push("a", [T0, T0 + 1], [1.0])
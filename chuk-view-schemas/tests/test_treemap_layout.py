@@ -0,0 +1,124 @@
+"""Tests for server-side squarified treemap layout."""
+
+import math
+
+import pytest
+
+from chuk_view_schemas import TreemapContent, TreemapNode
+from chuk_view_schemas.hierarchy_builder import build_hierarchy
+from chuk_view_schemas.treemap_layout import layout_treemap, squarify
+
+
+def _tree() -> TreemapContent:
+    return build_hierarchy(
+        [
+            (["src", "app.py"], 6.0),
+            (["src", "util.py"], 2.0),
+            (["docs", "index.md"], 3.0),
+            (["README"], 1.0),
+        ]
+    ).treemap()
+
+
+def _nodes(root: TreemapNode):
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(node.children or [])
+
+
+class TestSquarify:
+    def test_areas_are_proportional_and_in_bounds(self):
+        areas = [6.0, 6.0, 4.0, 3.0, 2.0, 2.0, 1.0]
+        rects = squarify(areas, 6.0, 4.0)
+        assert len(rects) == len(areas)
+        for area, (x, y, w, h) in zip(areas, rects):
+            assert w * h == pytest.approx(area)
+            assert x >= -1e-9 and y >= -1e-9
+            assert x + w <= 6.0 + 1e-9 and y + h <= 4.0 + 1e-9
+
+    def test_matches_classic_example(self):
+        # Bruls et al.: first row is the 6, 6 column on the left
+        rects = squarify([6, 6, 4, 3, 2, 2, 1], 6.0, 4.0)
+        assert rects[0] == pytest.approx((0.0, 0.0, 3.0, 2.0))
+        assert rects[1] == pytest.approx((0.0, 2.0, 3.0, 2.0))
+
+    def test_empty_and_zero(self):
+        assert squarify([], 1.0, 1.0) == []
+        assert squarify([0.0, 0.0], 1.0, 1.0) == [(0.0, 0.0, 0.0, 0.0)] * 2
+
+
+class TestLayoutTreemap:
+    def test_sets_layout_on_every_non_root_node(self):
+        content = layout_treemap(_tree(), aspect=2.0)
+        assert content.layout_aspect == 2.0
+        assert content.root.layout is None
+        for node in _nodes(content.root):
+            if node is not content.root:
+                assert node.layout is not None
+
+    def test_children_tile_parent(self):
+        content = layout_treemap(_tree(), aspect=1.5)
+        for node in _nodes(content.root):
+            if not node.children:
+                continue
+            sizes = [c.value for c in node.children]
+            area = sum(c.layout.w * c.layout.h for c in node.children)
+            assert area == pytest.approx(1.0)
+            for child, size in zip(node.children, sizes):
+                assert child.layout.w * child.layout.h == pytest.approx(
+                    size / sum(sizes)
+                )
+
+    def test_serializes_with_aliases(self):
+        dumped = layout_treemap(_tree()).model_dump(by_alias=True, exclude_none=True)
+        assert dumped["layoutAspect"] == 1.5
+        assert set(dumped["root"]["children"][0]["layout"]) == {"x", "y", "w", "h"}
+
+    def test_leaf_without_value_counts_as_one(self):
+        content = TreemapContent.model_validate(
+            {
+                "root": {
+                    "id": "r",
+                    "label": "r",
+                    "children": [
+                        {"id": "a", "label": "a"},
+                        {"id": "b", "label": "b", "value": 3},
+                    ],
+                }
+            }
+        )
+        a, b = layout_treemap(content, aspect=1.0).root.children
+        assert a.layout.w * a.layout.h == pytest.approx(0.25)
+        assert b.layout.w * b.layout.h == pytest.approx(0.75)
+
+    def test_deep_tree_does_not_recurse(self):
+        # Deeper than pydantic validates, so build the nodes directly
+        node = TreemapNode.model_construct(id="leaf", label="leaf", value=1.0)
+        for i in range(3000):
+            node = TreemapNode.model_construct(id=str(i), label=str(i), children=[node])
+        content = layout_treemap(TreemapContent.model_construct(root=node))
+        depth = sum(1 for n in _nodes(content.root) if n.layout is not None)
+        assert depth == 3000
+
+    def test_rejects_bad_aspect(self):
+        with pytest.raises(ValueError):
+            layout_treemap(_tree(), aspect=0)
+
+    def test_wide_tree(self):
+        content = TreemapContent.model_validate(
+            {
+                "root": {
+                    "id": "r",
+                    "label": "r",
+                    "children": [
+                        {"id": str(i), "label": str(i), "value": 1 + i % 7}
+                        for i in range(20_000)
+                    ],
+                }
+            }
+        )
+        layout_treemap(content)
+        total = math.fsum(c.layout.w * c.layout.h for c in content.root.children)
+        assert total == pytest.approx(1.0)